@@ -62,12 +62,22 @@ async def main():
     )
 
     # Run backtest
-    await session.run(
-        start_time=start_time,
-        end_time=end_time,
-        interval_seconds=300  # 5 minute intervals (more realistic for ratio trading)
-    )
+    try:
+        await session.run(
+            start_time=start_time,
+            end_time=end_time,
+            interval_seconds=300  # 5 minute intervals (more realistic for ratio trading)
+        )
+    finally:
+        datasource.close()
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file
@@ -1,16 +1,29 @@
 """Binance exchange client implementation."""
 
-import ccxt
-from typing import Dict, List, Optional, Union, Any, Literal, cast
+import ccxt.pro as ccxt_pro
+from typing import Dict, List, Optional, Tuple, Union, Any, Literal, cast
 from datetime import datetime
+import time
 from loguru import logger
+import numpy as np
+import polars as pl
 
-from ..base import BaseExchangeClient, Ticker, Candle, OrderBook
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..base import BaseExchangeClient, Ticker, OrderBook
 
 
 class BinanceClient(BaseExchangeClient):
     """Binance US exchange client using CCXT."""
     
+    __slots__ = ("exchange", "_markets_key")
+    
+    # Markets/currencies loaded once per process, keyed by (exchange id, testnet)
+    _markets_cache: Dict[Tuple[str, bool], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+    
     def __init__(self, api_key: Optional[str] = None, secret_key: Optional[str] = None, testnet: bool = False):
         super().__init__(api_key, secret_key)
         
@@ -22,61 +35,123 @@ class BinanceClient(BaseExchangeClient):
             config['secret'] = secret_key
         
         # Use Binance US for US users, regular Binance otherwise
-        self.exchange = ccxt.binanceus(config)  # type: ignore[arg-type]
+        # (ccxt.pro exchanges support both REST fetch_* and websocket watch_* calls)
+        self.exchange = ccxt_pro.binanceus(config)  # type: ignore[arg-type]
         
         # Set rate limiting after initialization
         self.exchange.enableRateLimit = True
         
+        # Decode REST responses with orjson when it is installed
+        if orjson is not None:
+            self.exchange.parse_json = self._parse_json
+        
         if testnet:
             # Binance testnet URLs
             self.exchange.set_sandbox_mode(True)
         
+        # Reuse markets loaded by an earlier instance so ccxt skips the reload
+        self._markets_key = (self.exchange.id, testnet)
+        cached = self._markets_cache.get(self._markets_key)
+        if cached is not None:
+            self.exchange.set_markets(*cached)
+        
         logger.info(f"BinanceClient initialized {'(testnet)' if testnet else ''}")
     
-    def get_ticker(self, symbol: str) -> Ticker:
+    @staticmethod
+    def _parse_json(http_response: Any) -> Any:
+        """orjson drop-in for ccxt's Exchange.parse_json."""
+        if isinstance(http_response, str) and http_response[:1] in ('{', '['):
+            try:
+                return orjson.loads(http_response)  # type: ignore[union-attr]
+            except ValueError:
+                pass
+        return None
+    
+    async def get_ticker(self, symbol: str) -> Ticker:
         """Get current ticker for a symbol."""
         try:
-            ticker_data = self.exchange.fetch_ticker(symbol)
-            
-            timestamp = ticker_data.get('timestamp')
-            if timestamp is None:
-                timestamp = datetime.now().timestamp() * 1000
-            
-            return Ticker(
-                symbol=symbol,
-                timestamp=datetime.fromtimestamp(float(timestamp) / 1000),
-                bid=float(ticker_data['bid']) if ticker_data['bid'] is not None else 0.0,
-                ask=float(ticker_data['ask']) if ticker_data['ask'] is not None else 0.0,
-                last=float(ticker_data['last']) if ticker_data['last'] is not None else 0.0,
-                volume_24h=float(ticker_data['quoteVolume']) if ticker_data['quoteVolume'] is not None else 0.0
-            )
+            ticker_data = await self.exchange.fetch_ticker(symbol)
+            return self._parse_ticker(symbol, ticker_data)
         except Exception as e:
             logger.error(f"Error fetching ticker for {symbol}: {e}")
             raise
     
-    def get_candles(
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """Get current tickers for multiple symbols in a single request."""
+        try:
+            tickers_data = await self.exchange.fetch_tickers(symbols)
+            
+            return {
+                symbol: self._parse_ticker(symbol, tickers_data[symbol])
+                for symbol in symbols
+                if symbol in tickers_data
+            }
+        except Exception as e:
+            logger.error(f"Error fetching tickers for {', '.join(symbols)}: {e}")
+            raise
+    
+    async def watch_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """Wait for the next ticker update(s) pushed over the websocket feed."""
+        try:
+            tickers_data = await self.exchange.watch_tickers(symbols)
+            
+            return {
+                symbol: self._parse_ticker(symbol, ticker_data)
+                for symbol, ticker_data in tickers_data.items()
+            }
+        except Exception as e:
+            logger.error(f"Error watching tickers for {', '.join(symbols)}: {e}")
+            raise
+    
+    def _parse_ticker(self, symbol: str, ticker_data: Dict[str, Any]) -> Ticker:
+        """Convert a raw CCXT ticker dict into a Ticker."""
+        timestamp = ticker_data.get('timestamp')
+        if timestamp is None:
+            timestamp = datetime.now().timestamp() * 1000
+        
+        return Ticker(
+            symbol=symbol,
+            timestamp=datetime.fromtimestamp(float(timestamp) / 1000),
+            bid=float(ticker_data['bid']) if ticker_data['bid'] is not None else 0.0,
+            ask=float(ticker_data['ask']) if ticker_data['ask'] is not None else 0.0,
+            last=float(ticker_data['last']) if ticker_data['last'] is not None else 0.0,
+            volume_24h=float(ticker_data['quoteVolume']) if ticker_data['quoteVolume'] is not None else 0.0
+        )
+    
+    async def get_candles(
         self, 
         symbol: str, 
         timeframe: str = '1h',
         limit: int = 100
-    ) -> List[Candle]:
+    ) -> pl.DataFrame:
         """
-        Get historical OHLCV candles.
+        Get historical OHLCV candles as a DataFrame.
+        Columns: timestamp, open, high, low, close, volume
         Timeframes: 1m, 5m, 15m, 30m, 1h, 4h, 1d, 1w
         """
         try:
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            
-            candles = []
-            for candle in ohlcv:
-                candles.append(Candle(
-                    timestamp=datetime.fromtimestamp(candle[0] / 1000),
-                    open=candle[1],
-                    high=candle[2],
-                    low=candle[3],
-                    close=candle[4],
-                    volume=candle[5]
-                ))
+            ohlcv = await self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+            
+            arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+            
+            # Epoch ms -> datetime64, shifted to local wall-clock time to match
+            # datetime.fromtimestamp. The UTC offset is looked up per candle so
+            # ranges crossing a DST change stay correct.
+            epoch_ms = arr[:, 0].astype(np.int64)
+            utc_offsets = np.fromiter(
+                (time.localtime(t).tm_gmtoff for t in (epoch_ms // 1000).tolist()),
+                dtype=np.int64, count=len(epoch_ms)
+            )
+            timestamps = (epoch_ms + utc_offsets * 1000).astype('datetime64[ms]')
+            
+            candles = pl.DataFrame({
+                'timestamp': timestamps,
+                'open': arr[:, 1],
+                'high': arr[:, 2],
+                'low': arr[:, 3],
+                'close': arr[:, 4],
+                'volume': arr[:, 5],
+            })
             
             logger.debug(f"Fetched {len(candles)} candles for {symbol}")
             return candles
@@ -85,36 +160,57 @@ class BinanceClient(BaseExchangeClient):
             logger.error(f"Error fetching candles for {symbol}: {e}")
             raise
     
-    def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
+    async def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
         """Get current order book."""
         try:
-            book = self.exchange.fetch_order_book(symbol, limit=depth)
-            
-            timestamp = book.get('timestamp')
-            if timestamp is not None:
-                book_timestamp = datetime.fromtimestamp(float(timestamp) / 1000)
-            else:
-                book_timestamp = datetime.now()
-            
-            return OrderBook(
-                symbol=symbol,
-                timestamp=book_timestamp,
-                bids=[(float(bid[0]), float(bid[1])) for bid in book['bids'] if bid[0] is not None and bid[1] is not None],
-                asks=[(float(ask[0]), float(ask[1])) for ask in book['asks'] if ask[0] is not None and ask[1] is not None]
-            )
+            book = await self.exchange.fetch_order_book(symbol, limit=depth)
+            return self._parse_orderbook(symbol, book)
             
         except Exception as e:
             logger.error(f"Error fetching orderbook for {symbol}: {e}")
             raise
     
-    def get_balance(self) -> Dict[str, float]:
+    async def watch_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
+        """Wait for the next order book update pushed over the websocket feed."""
+        try:
+            book = await self.exchange.watch_order_book(symbol, limit=depth)
+            return self._parse_orderbook(symbol, book, depth)
+            
+        except Exception as e:
+            logger.error(f"Error watching orderbook for {symbol}: {e}")
+            raise
+    
+    def _parse_orderbook(self, symbol: str, book: Dict[str, Any], depth: Optional[int] = None) -> OrderBook:
+        """Convert a raw CCXT order book dict into an OrderBook."""
+        timestamp = book.get('timestamp')
+        if timestamp is not None:
+            book_timestamp = datetime.fromtimestamp(float(timestamp) / 1000)
+        else:
+            book_timestamp = datetime.now()
+        
+        return OrderBook(
+            symbol=symbol,
+            timestamp=book_timestamp,
+            bids=self._parse_levels(book['bids'], depth),
+            asks=self._parse_levels(book['asks'], depth)
+        )
+    
+    @staticmethod
+    def _parse_levels(levels: List[List[float]], depth: Optional[int] = None) -> np.ndarray:
+        """Convert CCXT [price, size, ...] levels into a (levels, 2) float64 array."""
+        arr = np.asarray(levels[:depth], dtype=np.float64)
+        if arr.size == 0:
+            return np.empty((0, 2), dtype=np.float64)
+        return arr[:, :2]
+    
+    async def get_balance(self) -> Dict[str, float]:
         """Get account balances."""
         if not self.api_key or not self.secret_key:
             logger.warning("No API keys provided, cannot fetch balance")
             return {}
         
         try:
-            balance = self.exchange.fetch_balance()
+            balance = await self.exchange.fetch_balance()
             
             # Return only non-zero balances
             non_zero: Dict[str, float] = {}
@@ -134,7 +230,7 @@ class BinanceClient(BaseExchangeClient):
             logger.error(f"Error fetching balance: {e}")
             raise
     
-    def place_order(
+    async def place_order(
         self,
         symbol: str,
         side: str,  # "buy" or "sell"
@@ -153,7 +249,7 @@ class BinanceClient(BaseExchangeClient):
             order_type = 'limit' if price else 'market'
             
             if order_type == 'limit':
-                order = self.exchange.create_order(
+                order = await self.exchange.create_order(
                     symbol=symbol,
                     type=order_type,
                     side=side,  # type: ignore[arg-type]
@@ -161,7 +257,7 @@ class BinanceClient(BaseExchangeClient):
                     price=price
                 )
             else:
-                order = self.exchange.create_order(
+                order = await self.exchange.create_order(
                     symbol=symbol,
                     type=order_type,
                     side=side,  # type: ignore[arg-type]
@@ -175,14 +271,14 @@ class BinanceClient(BaseExchangeClient):
             logger.error(f"Error placing order: {e}")
             raise
     
-    def cancel_order(self, order_id: str, symbol: str) -> bool:
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """Cancel an order."""
         if not self.api_key or not self.secret_key:
             logger.error("No API keys provided, cannot cancel orders")
             return False
         
         try:
-            self.exchange.cancel_order(order_id, symbol)
+            await self.exchange.cancel_order(order_id, symbol)
             logger.success(f"Cancelled order {order_id}")
             return True
             
@@ -190,10 +286,36 @@ class BinanceClient(BaseExchangeClient):
             logger.error(f"Error cancelling order {order_id}: {e}")
             return False
     
-    def get_exchange_info(self) -> dict:
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self.exchange.close()
+    
+    async def load_markets(self) -> Dict[str, Any]:
+        """Load markets once and share them with every other client instance."""
+        cached = self._markets_cache.get(self._markets_key)
+        if cached is None:
+            markets = await self.exchange.load_markets()
+            cached = (markets, self.exchange.currencies)
+            BinanceClient._markets_cache[self._markets_key] = cached
+        return cached[0]
+    
+    def resolve_symbols(self, symbols: List[str]) -> List[str]:
+        """Map symbols to their unified CCXT form, dropping ones the exchange doesn't list.
+        
+        Requires markets to be loaded (see load_markets).
+        """
+        resolved = []
+        for symbol in symbols:
+            try:
+                resolved.append(self.exchange.market(symbol)['symbol'])
+            except ccxt_pro.BadSymbol:
+                logger.warning(f"{symbol} is not listed on {self.exchange.id}, skipping")
+        return resolved
+    
+    async def get_exchange_info(self) -> dict:
         """Get exchange trading rules and symbol info."""
         try:
-            return self.exchange.load_markets()
+            return await self.load_markets()
         except Exception as e:
             logger.error(f"Error loading markets: {e}")
             raise
@@ -201,15 +323,23 @@ class BinanceClient(BaseExchangeClient):
 
 # Quick test
 if __name__ == "__main__":
-    client = BinanceClient()
-    
-    # Test public endpoints (no API key needed)
-    ticker = client.get_ticker("BTC/USDT")
-    print(f"BTC Price: ${ticker.last:,.2f}")
-    print(f"Bid: ${ticker.bid:,.2f} | Ask: ${ticker.ask:,.2f}")
-    
-    # Get some candles
-    candles = client.get_candles("ETH/USDT", "1h", limit=5)
-    print(f"\nLast 5 hourly candles for ETH:")
-    for candle in candles:
-        print(f"  {candle.timestamp}: Close ${candle.close:,.2f}")
\ No newline at end of file
+    import asyncio
+    
+    async def test():
+        client = BinanceClient()
+        
+        try:
+            # Test public endpoints (no API key needed)
+            ticker = await client.get_ticker("BTC/USDT")
+            print(f"BTC Price: ${ticker.last:,.2f}")
+            print(f"Bid: ${ticker.bid:,.2f} | Ask: ${ticker.ask:,.2f}")
+            
+            # Get some candles
+            candles = await client.get_candles("ETH/USDT", "1h", limit=5)
+            print(f"\nLast 5 hourly candles for ETH:")
+            for candle in candles.iter_rows(named=True):
+                print(f"  {candle['timestamp']}: Close ${candle['close']:,.2f}")
+        finally:
+            await client.close()
+    
+    asyncio.run(test())
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 from src.data.clients.Binance.binanceClient import BinanceClient
 from loguru import logger
+import asyncio
 import sys
 
 # Configure loguru for better test output
@@ -9,7 +10,7 @@ logger.remove()  # Remove default handler
 logger.add(sys.stdout, colorize=True, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>")
 
 
-def test_binance_client():
+async def test_binance_client():
     """Test all public methods of the Binance client."""
     
     # Initialize client (no API keys needed for public data)
@@ -22,7 +23,7 @@ def test_binance_client():
     # Test 1: Get ticker
     logger.info("Testing get_ticker()...")
     try:
-        ticker = client.get_ticker("BTC/USDT")
+        ticker = await client.get_ticker("BTC/USDT")
         logger.success(f"BTC/USDT ticker retrieved:")
         logger.info(f"  Price: ${ticker.last:,.2f}")
         logger.info(f"  Bid: ${ticker.bid:,.2f} | Ask: ${ticker.ask:,.2f}")
@@ -34,18 +35,18 @@ def test_binance_client():
     # Test 2: Get candles
     logger.info("Testing get_candles()...")
     try:
-        candles = client.get_candles("ETH/USDT", "1h", limit=5)
+        candles = await client.get_candles("ETH/USDT", "1h", limit=5)
         logger.success(f"Retrieved {len(candles)} candles for ETH/USDT")
-        for i, candle in enumerate(candles[-3:], 1):  # Show last 3
-            logger.debug(f"  Candle {i} @ {candle.timestamp.strftime('%Y-%m-%d %H:%M')}")
-            logger.debug(f"    O: ${candle.open:,.2f} H: ${candle.high:,.2f} L: ${candle.low:,.2f} C: ${candle.close:,.2f}")
+        for i, candle in enumerate(candles.tail(3).iter_rows(named=True), 1):  # Show last 3
+            logger.debug(f"  Candle {i} @ {candle['timestamp'].strftime('%Y-%m-%d %H:%M')}")
+            logger.debug(f"    O: ${candle['open']:,.2f} H: ${candle['high']:,.2f} L: ${candle['low']:,.2f} C: ${candle['close']:,.2f}")
     except Exception as e:
         logger.error(f"get_candles failed: {e}")
     
     # Test 3: Get orderbook
     logger.info("Testing get_orderbook()...")
     try:
-        book = client.get_orderbook("SOL/USDT", depth=5)
+        book = await client.get_orderbook("SOL/USDT", depth=5)
         logger.success(f"SOL/USDT order book retrieved")
         
         # Show top bids/asks
@@ -58,9 +59,9 @@ def test_binance_client():
             logger.debug(f"  ${price:,.2f} - Size: {size:.3f}")
         
         # Calculate spread
-        if book.bids and book.asks:
-            spread = book.asks[0][0] - book.bids[0][0]
-            spread_pct = (spread / book.bids[0][0]) * 100
+        if len(book.bids) and len(book.asks):
+            spread = book.asks[0, 0] - book.bids[0, 0]
+            spread_pct = (spread / book.bids[0, 0]) * 100
             logger.info(f"Spread: ${spread:.2f} ({spread_pct:.3f}%)")
     except Exception as e:
         logger.error(f"get_orderbook failed: {e}")
@@ -71,7 +72,7 @@ def test_binance_client():
     try:
         prices = {}
         for symbol in symbols:
-            ticker = client.get_ticker(symbol)
+            ticker = await client.get_ticker(symbol)
             prices[symbol] = ticker.last
             logger.debug(f"  {symbol}: ${ticker.last:,.2f}")
         logger.success(f"Retrieved prices for {len(prices)} symbols")
@@ -81,7 +82,7 @@ def test_binance_client():
     # Test 5: Test balance (will fail without API keys - expected)
     logger.info("Testing get_balance() without API keys...")
     try:
-        balance = client.get_balance()
+        balance = await client.get_balance()
         if balance:
             logger.warning(f"Unexpected balance returned: {balance}")
         else:
@@ -89,10 +90,12 @@ def test_binance_client():
     except Exception as e:
         logger.error(f"get_balance failed unexpectedly: {e}")
     
+    await client.close()
+    
     logger.info("=" * 50)
     logger.success("TESTING COMPLETE!")
     logger.info("=" * 50)
 
 
 if __name__ == "__main__":
-    test_binance_client()
\ No newline at end of file
+    asyncio.run(test_binance_client())
\ No newline at end of file
@@ -1,13 +1,15 @@
 """Base exchange client interface."""
 
 from abc import ABC, abstractmethod
+import asyncio
 from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass
+import numpy as np
 import polars as pl
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ticker:
     """Current market price data."""
     symbol: str
@@ -18,9 +20,9 @@ class Ticker:
     volume_24h: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Candle:
-    """OHLCV candle data."""
+    """OHLCV candle row. Mirrors the columns of the DataFrame returned by get_candles."""
     timestamp: datetime
     open: float
     high: float
@@ -29,50 +31,62 @@ class Candle:
     volume: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderBook:
     """Order book snapshot."""
     symbol: str
     timestamp: datetime
-    bids: List[Tuple[Union[float, int], Union[float, int]]]  # More flexible types
-    asks: List[Tuple[Union[float, int], Union[float, int]]]
+    bids: np.ndarray  # float64 array of shape (levels, 2): [price, size], best first
+    asks: np.ndarray
 
 
 class BaseExchangeClient(ABC):
     """Abstract base class all exchange clients must implement."""
     
+    # Subclasses declare their own additional slots
+    __slots__ = ("api_key", "secret_key", "name")
+    
     def __init__(self, api_key: Optional[str] = None, secret_key: Optional[str] = None):
         self.api_key = api_key
         self.secret_key = secret_key
         self.name = self.__class__.__name__.replace("Client", "").lower()
     
     @abstractmethod
-    def get_ticker(self, symbol: str) -> Ticker:
+    async def get_ticker(self, symbol: str) -> Ticker:
         """Get current ticker for a symbol."""
         pass
     
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """Get current tickers for multiple symbols. Returns {symbol: Ticker}.
+        
+        Default implementation issues one get_ticker call per symbol concurrently;
+        clients whose exchange supports a batched endpoint should override.
+        """
+        tickers = await asyncio.gather(*(self.get_ticker(symbol) for symbol in symbols))
+        return dict(zip(symbols, tickers))
+    
     @abstractmethod
-    def get_candles(
+    async def get_candles(
         self, 
         symbol: str, 
         timeframe: str,
         limit: int = 100
-    ) -> List[Candle]:
-        """Get historical OHLCV candles."""
+    ) -> pl.DataFrame:
+        """Get historical OHLCV candles as a DataFrame with Candle's columns."""
         pass
     
     @abstractmethod
-    def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
+    async def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
         """Get current order book."""
         pass
     
     @abstractmethod
-    def get_balance(self) -> Dict[str, float]:
+    async def get_balance(self) -> Dict[str, float]:
         """Get account balances. Returns {asset: amount}."""
         pass
     
     @abstractmethod
-    def place_order(
+    async def place_order(
         self,
         symbol: str,
         side: str,  # "buy" or "sell"
@@ -83,6 +97,10 @@ class BaseExchangeClient(ABC):
         pass
     
     @abstractmethod
-    def cancel_order(self, order_id: str, symbol: str) -> bool:
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """Cancel an order. Returns success."""
+        pass
+    
+    async def close(self) -> None:
+        """Release network resources held by the client."""
         pass
\ No newline at end of file
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 import asyncio
+import random
 from loguru import logger
 from datetime import datetime
 
@@ -10,11 +11,15 @@ from datetime import datetime
 class BaseCollector(ABC):
     """Abstract base class for data collectors."""
     
+    # Subclasses declare their own additional slots
+    __slots__ = ("symbols", "interval_seconds", "is_running", "_task", "_backoff")
+    
     def __init__(self, symbols: List[str], interval_seconds: int = 30):
         self.symbols = symbols
         self.interval_seconds = interval_seconds
         self.is_running = False
         self._task: Optional[asyncio.Task] = None
+        self._backoff = 1.0  # Seconds to wait after the next failure
         
     @abstractmethod
     async def collect_once(self):
@@ -30,21 +35,40 @@ class BaseCollector(ABC):
         self.is_running = True
         logger.info(f"Starting collector for {len(self.symbols)} symbols every {self.interval_seconds}s")
         
+        try:
+            await self.setup()
+        except Exception as e:
+            logger.warning(f"Collector setup failed, continuing: {e}")
+        
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
         while self.is_running:
             try:
-                start_time = asyncio.get_event_loop().time()
                 await self.collect_once()
+                self._backoff = 1.0
                 
-                # Calculate how long to sleep to maintain interval
-                elapsed = asyncio.get_event_loop().time() - start_time
-                sleep_time = max(0, self.interval_seconds - elapsed)
+                # Sleep until the next scheduled tick so cadence doesn't drift
+                next_tick += self.interval_seconds
+                sleep_time = next_tick - loop.time()
                 
                 if sleep_time > 0:
                     await asyncio.sleep(sleep_time)
+                else:
+                    # Overran the interval; restart the schedule instead of bursting to catch up
+                    next_tick = loop.time()
                     
             except Exception as e:
-                logger.error(f"Collection error: {e}")
-                await asyncio.sleep(self.interval_seconds)
+                # Exponential backoff with jitter, capped at the collection interval
+                delay = min(self._backoff, self.interval_seconds) * random.uniform(0.5, 1.5)
+                logger.error(f"Collection error: {e} (retrying in {delay:.1f}s)")
+                await asyncio.sleep(delay)
+                self._backoff = min(self._backoff * 2, self.interval_seconds)
+                next_tick = loop.time()
+    
+    async def setup(self):
+        """Prepare resources before the first collection. Override in subclasses."""
+        pass
     
     async def stop(self):
         """Stop collection."""
@@ -55,4 +79,9 @@ class BaseCollector(ABC):
             try:
                 await self._task
             except asyncio.CancelledError:
-                pass
\ No newline at end of file
+                pass
+        await self.close()
+    
+    async def close(self):
+        """Release resources held by the collector. Override in subclasses."""
+        pass
\ No newline at end of file
@@ -1,77 +1,157 @@
 """Price collector for continuous ticker data collection."""
 
 import asyncio
-from typing import List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from loguru import logger
 
 from .baseCollector import BaseCollector
 from ..clients.Binance.binanceClient import BinanceClient
+from ..clients.base import Ticker, OrderBook
 from ..storage.database import Database
 
 
 class PriceCollector(BaseCollector):
-    """Collects ticker prices continuously."""
+    """Collects ticker prices continuously.
+    
+    With use_websocket enabled, tickers are pushed over the exchange websocket
+    feed in the background and interval_seconds only throttles database writes.
+    Otherwise tickers are polled over REST every interval.
+    """
+    
+    __slots__ = (
+        "_owns_client", "client", "_owns_db", "db", "use_websocket", "_latest",
+        "n_collections", "n_ok", "n_fail", "start_time", "_log_every", "_next_log",
+    )
     
     def __init__(
         self, 
         symbols: List[str], 
         interval_seconds: int = 30,
-        db_path: str = "data/trading.db"
+        db_path: str = "data/trading.db",
+        use_websocket: bool = False,
+        client: Optional[BinanceClient] = None,
+        db: Optional[Database] = None
     ):
         super().__init__(symbols, interval_seconds)
-        self.client = BinanceClient()
-        self.db = Database(db_path)
-        self.stats = {
-            'collections': 0,
-            'successes': 0,
-            'failures': 0,
-            'start_time': None
-        }
+        self._owns_client = client is None
+        self.client = client or BinanceClient()
+        self._owns_db = db is None
+        self.db = db or Database(db_path)
+        self.use_websocket = use_websocket
+        self._latest: Dict[str, Ticker] = {}  # Latest streamed ticker per symbol
+        
+        # Collection statistics (plain counters; see stats for a dict view)
+        self.n_collections = 0
+        self.n_ok = 0
+        self.n_fail = 0
+        self.start_time: Optional[datetime] = None
+        self._log_every = 10  # Log summary every N collections
+        self._next_log = self._log_every
+    
+    async def setup(self):
+        """Load exchange markets and resolve symbols once, up front.
+        
+        The websocket feed is subscribed afterwards so it only watches
+        symbols the exchange lists.
+        """
+        try:
+            await self.client.load_markets()
+            self.symbols = self.client.resolve_symbols(self.symbols)
+        finally:
+            if self.use_websocket:
+                self._task = asyncio.create_task(self._stream())
+    
+    async def close(self):
+        """Close the exchange client and database unless they are shared with other collectors."""
+        if self._owns_client:
+            await self.client.close()
+        if self._owns_db:
+            self.db.close()
+    
+    async def _stream(self):
+        """Keep the latest ticker per symbol updated from the websocket feed."""
+        while True:
+            try:
+                self._latest.update(await self.client.watch_tickers(self.symbols))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ticker stream error: {e}")
+                await asyncio.sleep(1)
     
     async def collect_once(self):
         """Collect current prices for all symbols."""
-        self.stats['collections'] += 1
+        self.n_collections += 1
         
-        for symbol in self.symbols:
+        if self.use_websocket:
+            # Take the tickers streamed since the last write
+            tickers, self._latest = self._latest, {}
+        else:
             try:
-                # Fetch ticker
-                ticker = self.client.get_ticker(symbol)
-                
-                # Save to database
-                success = self.db.save_ticker(ticker)
-                
-                if success:
-                    self.stats['successes'] += 1
-                    logger.debug(f"✓ {symbol}: ${ticker.last:,.2f} (spread: ${ticker.ask - ticker.bid:.2f})")
-                else:
-                    self.stats['failures'] += 1
-                    
-                # Small delay between symbols to be nice to API
-                await asyncio.sleep(0.2)
-                
+                # Fetch all tickers in one request
+                tickers = await self.client.get_tickers(self.symbols)
             except Exception as e:
-                self.stats['failures'] += 1
-                logger.error(f"Failed to collect {symbol}: {e}")
+                self.n_fail += len(self.symbols)
+                logger.error(f"Failed to collect tickers: {e}")
+                return
+        
+        # Bind loop-invariant lookups to locals once per collection.
+        # Pass args rather than f-strings so loguru skips formatting when DEBUG is filtered
+        log_debug, log_error = logger.debug, logger.error
+        get_ticker = tickers.get
+        use_websocket = self.use_websocket
+        
+        batch: List[Ticker] = []
+        append = batch.append
+        n_missing = 0
+        for symbol in self.symbols:
+            ticker = get_ticker(symbol)
+            if ticker is None:
+                if use_websocket:
+                    log_debug("No ticker update for {} since last write", symbol)
+                else:
+                    n_missing += 1
+                    log_error("Failed to collect {}: missing from batch response", symbol)
+                continue
+            
+            append(ticker)
+            log_debug("✓ {}: ${:,.2f} (spread: ${:.2f})", symbol, ticker.last, ticker.ask - ticker.bid)
+        
+        # Save the whole batch in one transaction
+        saved = await self.db.asave_tickers(batch)
+        self.n_ok += saved
+        self.n_fail += n_missing + len(batch) - saved
         
-        # Log summary every 10 collections
-        if self.stats['collections'] % 10 == 0:
+        # Log summary every few collections
+        if self.n_collections >= self._next_log:
+            self._next_log += self._log_every
             self.log_stats()
     
     def log_stats(self):
         """Log collection statistics."""
-        if self.stats['start_time']:
-            runtime = (datetime.now() - self.stats['start_time']).total_seconds() / 60
+        if self.start_time:
+            runtime = (datetime.now() - self.start_time).total_seconds() / 60
             logger.info(
-                f"📊 Stats: {self.stats['collections']} collections, "
-                f"{self.stats['successes']} saved, "
-                f"{self.stats['failures']} failed, "
+                f"📊 Stats: {self.n_collections} collections, "
+                f"{self.n_ok} saved, "
+                f"{self.n_fail} failed, "
                 f"Runtime: {runtime:.1f} min"
             )
     
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Collection statistics as a dict."""
+        return {
+            'collections': self.n_collections,
+            'successes': self.n_ok,
+            'failures': self.n_fail,
+            'start_time': self.start_time
+        }
+    
     async def start(self):
         """Start collection with stats tracking."""
-        self.stats['start_time'] = datetime.now()
+        self.start_time = datetime.now()
         logger.success(f"Starting price collection for: {', '.join(self.symbols)}")
         await super().start()
 
@@ -79,71 +159,159 @@ class PriceCollector(BaseCollector):
 class CandleCollector(BaseCollector):
     """Collects historical candles periodically."""
     
+    __slots__ = ("_owns_client", "client", "_owns_db", "db", "timeframes", "_semaphore")
+    
     def __init__(
         self,
         symbols: List[str],
         timeframes: List[str] = ["1h", "4h"],
         interval_seconds: int = 3600,  # Every hour
-        db_path: str = "data/trading.db"
+        db_path: str = "data/trading.db",
+        client: Optional[BinanceClient] = None,
+        db: Optional[Database] = None,
+        max_concurrency: int = 5  # Max in-flight requests, for rate limiting
     ):
         super().__init__(symbols, interval_seconds)
-        self.client = BinanceClient()
-        self.db = Database(db_path)
+        self._owns_client = client is None
+        self.client = client or BinanceClient()
+        self._owns_db = db is None
+        self.db = db or Database(db_path)
         self.timeframes = timeframes
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def setup(self):
+        """Load exchange markets and resolve symbols once, up front."""
+        await self.client.load_markets()
+        self.symbols = self.client.resolve_symbols(self.symbols)
+    
+    async def close(self):
+        """Close the exchange client and database unless they are shared with other collectors."""
+        if self._owns_client:
+            await self.client.close()
+        if self._owns_db:
+            self.db.close()
     
     async def collect_once(self):
         """Collect recent candles for all symbols and timeframes."""
-        for symbol in self.symbols:
-            for timeframe in self.timeframes:
-                try:
-                    # Get recent candles
-                    candles = self.client.get_candles(symbol, timeframe, limit=100)
-                    
-                    # Save to database
-                    saved = self.db.save_candles(symbol, timeframe, candles)
-                    
-                    logger.debug(f"✓ {symbol} {timeframe}: Saved {saved} candles")
-                    
-                    await asyncio.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    logger.error(f"Failed to collect candles for {symbol} {timeframe}: {e}")
+        collect_one, timeframes = self._collect_one, self.timeframes
+        await asyncio.gather(*(
+            collect_one(symbol, timeframe)
+            for symbol in self.symbols
+            for timeframe in timeframes
+        ))
+    
+    async def _collect_one(self, symbol: str, timeframe: str):
+        """Collect recent candles for a single symbol and timeframe."""
+        try:
+            # Get recent candles
+            async with self._semaphore:
+                candles = await self.client.get_candles(symbol, timeframe, limit=100)
+            
+            # Save to database
+            saved = await self.db.asave_candles(symbol, timeframe, candles)
+            
+            logger.debug("✓ {} {}: Saved {} candles", symbol, timeframe, saved)
+            
+        except Exception as e:
+            logger.error(f"Failed to collect candles for {symbol} {timeframe}: {e}")
 
 
 class OrderBookCollector(BaseCollector):
-    """Collects order book snapshots."""
+    """Collects order book snapshots.
+    
+    With use_websocket enabled, order books are pushed over the exchange
+    websocket feed and interval_seconds only throttles database writes.
+    """
+    
+    __slots__ = ("_owns_client", "client", "_owns_db", "db", "depth", "_semaphore", "use_websocket", "_latest")
     
     def __init__(
         self,
         symbols: List[str],
         interval_seconds: int = 60,
         depth: int = 20,
-        db_path: str = "data/trading.db"
+        db_path: str = "data/trading.db",
+        use_websocket: bool = False,
+        client: Optional[BinanceClient] = None,
+        db: Optional[Database] = None,
+        max_concurrency: int = 5  # Max in-flight REST requests, for rate limiting
     ):
         super().__init__(symbols, interval_seconds)
-        self.client = BinanceClient()
-        self.db = Database(db_path)
+        self._owns_client = client is None
+        self.client = client or BinanceClient()
+        self._owns_db = db is None
+        self.db = db or Database(db_path)
         self.depth = depth
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.use_websocket = use_websocket
+        self._latest: Dict[str, OrderBook] = {}  # Latest streamed book per symbol
     
-    async def collect_once(self):
-        """Collect orderbook snapshots for all symbols."""
-        for symbol in self.symbols:
+    async def setup(self):
+        """Load exchange markets and resolve symbols once, up front.
+        
+        The websocket feed is subscribed afterwards so it only watches
+        symbols the exchange lists.
+        """
+        try:
+            await self.client.load_markets()
+            self.symbols = self.client.resolve_symbols(self.symbols)
+        finally:
+            if self.use_websocket:
+                self._task = asyncio.create_task(self._stream())
+    
+    async def close(self):
+        """Close the exchange client and database unless they are shared with other collectors."""
+        if self._owns_client:
+            await self.client.close()
+        if self._owns_db:
+            self.db.close()
+    
+    async def _stream(self):
+        """Keep the latest order book per symbol updated from the websocket feed."""
+        await asyncio.gather(*(self._stream_one(symbol) for symbol in self.symbols))
+    
+    async def _stream_one(self, symbol: str):
+        """Consume the order book feed for a single symbol."""
+        while True:
             try:
-                # Get orderbook
-                orderbook = self.client.get_orderbook(symbol, self.depth)
-                
-                # Save to database
-                success = self.db.save_orderbook(orderbook, symbol)
-                
-                if success and orderbook.bids and orderbook.asks:
-                    spread = orderbook.asks[0][0] - orderbook.bids[0][0]
-                    spread_pct = (spread / orderbook.bids[0][0]) * 100
-                    logger.debug(f"✓ {symbol} orderbook: Spread {spread_pct:.3f}%")
-                
-                await asyncio.sleep(0.3)
-                
+                self._latest[symbol] = await self.client.watch_orderbook(symbol, self.depth)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Failed to collect orderbook for {symbol}: {e}")
+                logger.error(f"Orderbook stream error for {symbol}: {e}")
+                await asyncio.sleep(1)
+    
+    async def collect_once(self):
+        """Collect orderbook snapshots for all symbols."""
+        collect_one = self._collect_one
+        await asyncio.gather(*(collect_one(symbol) for symbol in self.symbols))
+    
+    async def _collect_one(self, symbol: str):
+        """Collect an orderbook snapshot for a single symbol."""
+        try:
+            # Get orderbook
+            if self.use_websocket:
+                orderbook = self._latest.pop(symbol, None)
+                if orderbook is None:
+                    logger.debug("No orderbook update for {} since last write", symbol)
+                    return
+            else:
+                async with self._semaphore:
+                    orderbook = await self.client.get_orderbook(symbol, self.depth)
+            
+            # Save to database
+            success = await self.db.asave_orderbook(orderbook, symbol)
+            
+            if success and len(orderbook.bids) and len(orderbook.asks):
+                # Spread is only computed if a DEBUG handler will emit it
+                logger.opt(lazy=True).debug(
+                    "✓ {} orderbook: Spread {:.3f}%",
+                    lambda: symbol,
+                    lambda: (orderbook.asks[0, 0] - orderbook.bids[0, 0]) / orderbook.bids[0, 0] * 100
+                )
+            
+        except Exception as e:
+            logger.error(f"Failed to collect orderbook for {symbol}: {e}")
 
 
 # Convenience function to run multiple collectors
@@ -157,23 +325,25 @@ async def run_collectors(
     orderbook_interval: int = 60
 ):
     """Run multiple collectors concurrently."""
-    tasks = []
+    if not (collect_prices or collect_candles or collect_orderbooks):
+        logger.warning("No collectors enabled!")
+        return
+    
+    # Share one exchange client (markets, rate limiter, HTTP session) and one database
+    client = BinanceClient()
+    db = Database()
+    collectors: List[BaseCollector] = []
     
     if collect_prices:
-        price_collector = PriceCollector(symbols, price_interval)
-        tasks.append(asyncio.create_task(price_collector.start()))
+        collectors.append(PriceCollector(symbols, price_interval, client=client, db=db))
     
     if collect_candles:
-        candle_collector = CandleCollector(symbols, ["1h", "4h"], candle_interval)
-        tasks.append(asyncio.create_task(candle_collector.start()))
+        collectors.append(CandleCollector(symbols, ["1h", "4h"], candle_interval, client=client, db=db))
     
     if collect_orderbooks:
-        orderbook_collector = OrderBookCollector(symbols, orderbook_interval)
-        tasks.append(asyncio.create_task(orderbook_collector.start()))
+        collectors.append(OrderBookCollector(symbols, orderbook_interval, client=client, db=db))
     
-    if not tasks:
-        logger.warning("No collectors enabled!")
-        return
+    tasks = [asyncio.create_task(collector.start()) for collector in collectors]
     
     logger.success(f"Running {len(tasks)} collectors. Press Ctrl+C to stop.")
     
@@ -183,6 +353,13 @@ async def run_collectors(
         logger.info("Shutting down collectors...")
         for task in tasks:
             task.cancel()
+        for collector in collectors:
+            await collector.stop()
+    finally:
+        try:
+            await client.close()
+        finally:
+            db.close()  # Flushes buffered tickers and stops the checkpointer
 
 
 if __name__ == "__main__":
@@ -65,4 +65,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file
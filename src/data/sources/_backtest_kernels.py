@@ -0,0 +1,155 @@
+"""Numeric kernels behind BacktestDataSource lookups.
+
+Timestamps are int64 microseconds (a ``datetime64[us]`` array viewed as
+``int64``). Every kernel is compiled with numba when it is installed and
+runs as plain Python otherwise (see ``utils.jit``).
+"""
+
+from typing import Tuple
+import numpy as np
+
+from ...utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def lookup(ts: np.ndarray, now: int, hint: int) -> int:
+    """Index of the last timestamp <= now, or -1.
+
+    hint is the result of a previous lookup. If it is still valid (time
+    moved forward), the search gallops forward from it. Otherwise it
+    bisects the whole array.
+    """
+    n = len(ts)
+    lo = 0
+    hi = n
+
+    if 0 <= hint < n and ts[hint] <= now:
+        # Gallop: every index below lo is <= now, the answer is below bound
+        lo = hint + 1
+        step = 1
+        bound = lo
+        while bound < n and ts[bound] <= now:
+            lo = bound + 1
+            bound = lo + step
+            step *= 2
+        hi = min(bound, n)
+
+    # Bisect for the first timestamp > now within [lo, hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if ts[mid] <= now:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo - 1
+
+
+@njit(cache=True)
+def history_slice(ts: np.ndarray, now: int, hint: int, limit: int) -> Tuple[int, int]:
+    """Bounds [lo, hi) of the last `limit` rows at or before now."""
+    hi = lookup(ts, now, hint) + 1
+    return max(0, hi - limit), hi
+
+
+@njit(cache=True)
+def _ratio_hist_merge(
+    ts1: np.ndarray,
+    px1: np.ndarray,
+    ts2: np.ndarray,
+    px2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge-join two sorted price series on timestamp and compute px1 / px2.
+
+    Rows where px2 is not positive are skipped.
+    """
+    n = min(len(ts1), len(ts2))
+    ts_out = np.empty(n, dtype=np.int64)
+    r_out = np.empty(n, dtype=np.float64)
+
+    i = 0
+    j = 0
+    m = 0
+    while i < len(ts1) and j < len(ts2):
+        if ts1[i] < ts2[j]:
+            i += 1
+        elif ts1[i] > ts2[j]:
+            j += 1
+        else:
+            if px2[j] > 0:
+                ts_out[m] = ts1[i]
+                r_out[m] = px1[i] / px2[j]
+                m += 1
+            i += 1
+            j += 1
+    return ts_out[:m], r_out[:m]
+
+
+def _ratio_hist_vectorized(
+    ts1: np.ndarray,
+    px1: np.ndarray,
+    ts2: np.ndarray,
+    px2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy equivalent of _ratio_hist_merge.
+
+    Intersects the (unique, sorted) timestamps, then applies the px2 > 0
+    filter as one boolean mask over the matched columns.
+    """
+    ts, i1, i2 = np.intersect1d(ts1, ts2, assume_unique=True, return_indices=True)
+    p1, p2 = px1[i1], px2[i2]
+    keep = p2 > 0
+    return ts[keep], p1[keep] / p2[keep]
+
+
+# The compiled merge loop is fastest under numba; interpreted, the
+# vectorized intersect + mask avoids a per-row Python loop
+ratio_hist = _ratio_hist_merge if NUMBA_AVAILABLE else _ratio_hist_vectorized
+
+
+@njit(cache=True)
+def eytzinger_build(timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Lay out sorted int64 timestamps in Eytzinger (BFS) order.
+
+    Returns (keys, ranks). Both are 1-indexed with length n + 1: keys[k]
+    is the timestamp stored at tree node k, and ranks[k] is its index in
+    the sorted array.
+    """
+    n = len(timestamps)
+    keys = np.empty(n + 1, dtype=np.int64)
+    ranks = np.empty(n + 1, dtype=np.int64)
+    if n == 0:
+        return keys, ranks
+
+    # In-order walk of the implicit tree visits nodes in sorted order
+    k = 1
+    while 2 * k <= n:
+        k = 2 * k
+    for i in range(n):
+        keys[k] = timestamps[i]
+        ranks[k] = i
+        if 2 * k + 1 <= n:
+            k = 2 * k + 1
+            while 2 * k <= n:
+                k = 2 * k
+        else:
+            while k & 1:
+                k >>= 1
+            k >>= 1
+    return keys, ranks
+
+
+@njit(cache=True)
+def eytzinger_search(keys: np.ndarray, ranks: np.ndarray, t: int) -> int:
+    """Index in the sorted array of the last timestamp <= t, or -1."""
+    n = len(keys) - 1
+    k = 1
+    while k <= n:
+        # Branch-free descent: right child if keys[k] <= t
+        k = 2 * k + (keys[k] <= t)
+    # Strip the trailing right turns (and the final one) to reach the first key > t
+    while k & 1:
+        k >>= 1
+    k >>= 1
+    if k == 0:
+        return n - 1
+    return ranks[k] - 1
@@ -1,11 +1,50 @@
 """Backtest data source implementation using simulated time."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Sequence, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
 from loguru import logger
+import numpy as np
+import polars as pl
 
 from .base import DataSource, PriceData, CandleData, OrderBookData, OrderBookLevel
 from ..storage.database import Database
+from . import _backtest_kernels as kernels
+from ...utils.jit import NUMBA_AVAILABLE
+
+
+@lru_cache(maxsize=None)
+def _simulated_book_shape(depth: int) -> Tuple[np.ndarray, np.ndarray, List[float]]:
+    """Price multipliers and quantities for a simulated order book of `depth` levels.
+
+    Returns:
+        Tuple of (bid price multipliers, ask price multipliers, level quantities)
+    """
+    spread_pct = 0.001  # 0.1% spread
+    levels = np.arange(depth)
+    bid_multipliers = (1 - spread_pct/2) - levels * 0.0001
+    ask_multipliers = (1 + spread_pct/2) + levels * 0.0001
+    quantities = (100.0 + levels * 10.0).tolist()  # Simulated quantity
+    return bid_multipliers, ask_multipliers, quantities
+
+
+class _PriceSeries(NamedTuple):
+    """Column-oriented price history for one symbol, sorted by timestamp.
+
+    Missing bid/ask values are stored as NaN. When numba is available the
+    timestamps are also kept in Eytzinger order for cold lookups.
+    """
+    timestamps: np.ndarray  # datetime64[us]
+    ticks: np.ndarray  # The same timestamps viewed as int64 microseconds, for the kernels
+    prices: np.ndarray  # float64
+    bids: np.ndarray  # float64
+    asks: np.ndarray  # float64
+    eytzinger: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
 
 class BacktestDataSource(DataSource):
@@ -19,7 +58,9 @@ class BacktestDataSource(DataSource):
         self,
         db_path: str = "data/trading.db",
         start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None,
+        parquet_path: Optional[str] = None,
+        cache_dir: Optional[str] = None
     ):
         """Initialize backtest data source.
 
@@ -27,15 +68,37 @@ class BacktestDataSource(DataSource):
             db_path: Path to the SQLite database
             start_time: Start time for backtest (defaults to earliest data)
             end_time: End time for backtest (defaults to latest data)
+            parquet_path: Optional Parquet snapshot of the prices table (see
+                export_parquet). When the file exists, prices are loaded
+                from it instead of SQLite.
+            cache_dir: Optional directory for persisting the loaded price
+                arrays. Later runs over the same database state and period
+                memory-map them instead of querying SQLite.
         """
-        self.db = Database(db_path)
+        self.db = Database(db_path, read_only=True)
+        self.parquet_path = Path(parquet_path) if parquet_path else None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.current_time = start_time
         self.start_time = start_time
         self.end_time = end_time
 
         # Cache for performance
-        self._price_cache: Dict[str, List[PriceData]] = {}
+        self._price_cache: Dict[str, _PriceSeries] = {}
         self._cache_loaded = False
+        self._last_idx: Dict[str, int] = {}  # Last lookup result per symbol
+
+    @property
+    def current_time(self) -> Optional[datetime]:
+        """The current simulated time."""
+        return self._current_time
+
+    @current_time.setter
+    def current_time(self, value: Optional[datetime]):
+        self._current_time = value
+        # Kept in sync as int64 microseconds so lookups compare against the cache directly
+        self._now = int(np.datetime64(value, 'us').view(np.int64)) if value else 0
+        # Prices already looked up at this time; only valid until the clock moves
+        self._price_memo: Dict[str, Optional[PriceData]] = {}
 
     def set_current_time(self, current_time: datetime):
         """Set the current simulated time for backtesting.
@@ -62,45 +125,33 @@ class BacktestDataSource(DataSource):
         logger.info("Loading historical data for backtesting...")
 
         try:
-            with self.db.get_connection() as conn:
-                # Load all price data for the backtest period
-                query = """
-                    SELECT DISTINCT symbol FROM prices
-                """
-                symbols = [row[0] for row in conn.execute(query).fetchall()]
-
-                for symbol in symbols:
-                    price_query = """
-                        SELECT symbol, last, timestamp, bid, ask
-                        FROM prices
-                        WHERE symbol = ?
-                    """
-
-                    # Add time constraints if specified
-                    params = [symbol]
-                    if self.start_time:
-                        price_query += " AND timestamp >= ?"
-                        params.append(self.start_time.isoformat())
-                    if self.end_time:
-                        price_query += " AND timestamp <= ?"
-                        params.append(self.end_time.isoformat())
-
-                    price_query += " ORDER BY timestamp ASC"
-
-                    results = conn.execute(price_query, params).fetchall()
-
-                    price_data = []
-                    for row in results:
-                        price_data.append(PriceData(
-                            symbol=row[0],
-                            price=float(row[1]),
-                            timestamp=datetime.fromisoformat(row[2]),
-                            bid=float(row[3]) if row[3] else None,
-                            ask=float(row[4]) if row[4] else None,
-                            volume=None  # Volume not available in current schema
-                        ))
-
-                    self._price_cache[symbol] = price_data
+            cached = None
+            if self.parquet_path and self.parquet_path.exists():
+                columns, segments = self._segment_by_symbol(*self._read_parquet_prices())
+            else:
+                cache_path = self.cache_dir / self._disk_cache_key() if self.cache_dir else None
+                cached = self._read_disk_cache(cache_path) if cache_path else None
+                if cached:
+                    columns, segments = cached
+                else:
+                    columns, segments = self._segment_by_symbol(*self._read_sqlite_prices())
+                    if cache_path:
+                        self._write_disk_cache(cache_path, columns, segments)
+
+            # Store columns rather than PriceData objects; rows are
+            # only boxed into PriceData when returned to a caller
+            timestamps = columns['timestamp']
+            ticks = timestamps.view(np.int64)
+
+            for symbol, (lo, hi) in segments.items():
+                self._price_cache[symbol] = _PriceSeries(
+                    timestamps=timestamps[lo:hi],
+                    ticks=ticks[lo:hi],
+                    prices=columns['last'][lo:hi],
+                    bids=columns['bid'][lo:hi],
+                    asks=columns['ask'][lo:hi],
+                    eytzinger=kernels.eytzinger_build(ticks[lo:hi]) if NUMBA_AVAILABLE else None,
+                )
 
             self._cache_loaded = True
             logger.success(f"Loaded data for {len(self._price_cache)} symbols")
@@ -109,6 +160,193 @@ class BacktestDataSource(DataSource):
             logger.error(f"Error loading backtest data cache: {e}")
             raise
 
+    @staticmethod
+    def _segment_by_symbol(
+        columns: Dict[str, np.ndarray],
+        all_symbols: List[str]
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, Tuple[int, int]]]:
+        """Find each symbol's row range in columns grouped by symbol.
+
+        Args:
+            columns: Column arrays sorted by symbol then timestamp
+            all_symbols: Every known symbol; ones without rows get an empty range
+
+        Returns:
+            Tuple of (columns, {symbol: (start row, end row)})
+        """
+        symbols = columns['symbol']
+        bounds = np.concatenate((
+            [0], np.flatnonzero(symbols[1:] != symbols[:-1]) + 1, [len(symbols)]
+        ))
+        found = {symbols[lo]: (int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo}
+        return columns, {symbol: found.get(symbol, (0, 0)) for symbol in all_symbols}
+
+    def _disk_cache_key(self) -> str:
+        """Name of the on-disk cache entry for the current database state and period."""
+        db_file = self.db.db_path.resolve()
+        parts: List[Any] = [str(db_file), self.start_time, self.end_time]
+        # Recent writes may only be in the WAL file, so it is part of the state too
+        for path in (db_file, db_file.with_name(db_file.name + '-wal')):
+            if path.exists():
+                stat = path.stat()
+                parts += [stat.st_mtime_ns, stat.st_size]
+        return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _read_disk_cache(
+        path: Path
+    ) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Tuple[int, int]]]]:
+        """Memory-map a cache entry written by _write_disk_cache.
+
+        Args:
+            path: Cache entry directory
+
+        Returns:
+            Tuple of (columns, segments), or None if there is no usable entry
+        """
+        if not path.is_dir():
+            return None
+        try:
+            segments = {
+                symbol: (lo, hi)
+                for symbol, (lo, hi) in json.loads((path / 'segments.json').read_text()).items()
+            }
+            columns = {
+                name: np.load(path / f"{name}.npy", mmap_mode='r')
+                for name in ('timestamp', 'last', 'bid', 'ask')
+            }
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable backtest cache {path}: {e}")
+            return None
+        logger.debug(f"Memory-mapped backtest cache {path}")
+        return columns, segments
+
+    @staticmethod
+    def _write_disk_cache(
+        path: Path,
+        columns: Dict[str, np.ndarray],
+        segments: Dict[str, Tuple[int, int]]
+    ):
+        """Persist price columns and symbol ranges as a cache entry directory.
+
+        Args:
+            path: Cache entry directory
+            columns: Column arrays sorted by symbol then timestamp
+            segments: Row range per symbol
+        """
+        # Write to a temporary directory and rename it, so readers never see a partial entry
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.mkdir(parents=True, exist_ok=True)
+            for name in ('timestamp', 'last', 'bid', 'ask'):
+                np.save(tmp / f"{name}.npy", np.ascontiguousarray(columns[name]))
+            (tmp / 'segments.json').write_text(json.dumps(segments))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write backtest cache {path}: {e}")
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _read_sqlite_prices(self) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Read the backtest period's prices from SQLite as column arrays.
+
+        Returns:
+            Tuple of (columns sorted by symbol then timestamp, all known symbols)
+        """
+        with self.db.get_connection() as conn:
+            # Load all price data for the backtest period in one query,
+            # ordered by the (symbol, timestamp) unique index
+            price_query = """
+                SELECT symbol, last, timestamp, bid, ask
+                FROM prices
+                WHERE 1 = 1
+            """
+
+            # Add time constraints if specified. Bounds are bound in the stored
+            # 'YYYY-MM-DD HH:MM:SS' form so the text comparison matches the
+            # datetime comparison of the Parquet path ('T' sorts after ' ')
+            params = []
+            if self.start_time:
+                price_query += " AND timestamp >= ?"
+                params.append(self.start_time.isoformat(sep=' '))
+            if self.end_time:
+                price_query += " AND timestamp <= ?"
+                params.append(self.end_time.isoformat(sep=' '))
+
+            price_query += " ORDER BY symbol ASC, timestamp ASC"
+
+            results = conn.execute(price_query, params).fetchall()
+
+            # Symbols with no rows in the period still get an (empty) entry
+            all_symbols = [row[0] for row in conn.execute("SELECT DISTINCT symbol FROM prices")]
+
+        columns = {
+            'symbol': np.array([row[0] for row in results], dtype=object),
+            # NumPy parses the ISO-8601 strings in one C loop, without datetime objects
+            'timestamp': np.array([row[2] for row in results], dtype=str).astype('datetime64[us]'),
+            'last': np.array([row[1] for row in results], dtype=np.float64),
+            'bid': np.array([row[3] or np.nan for row in results], dtype=np.float64),
+            'ask': np.array([row[4] or np.nan for row in results], dtype=np.float64),
+        }
+        return columns, all_symbols
+
+    def _read_parquet_prices(self) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Read the backtest period's prices from the Parquet snapshot as column arrays.
+
+        Returns:
+            Tuple of (columns sorted by symbol then timestamp, all known symbols)
+        """
+        prices = pl.scan_parquet(self.parquet_path)
+        all_symbols = prices.select(pl.col('symbol').unique()).collect()['symbol'].to_list()
+
+        if self.start_time:
+            prices = prices.filter(pl.col('timestamp') >= self.start_time)
+        if self.end_time:
+            prices = prices.filter(pl.col('timestamp') <= self.end_time)
+
+        df = prices.sort(['symbol', 'timestamp']).collect()
+
+        columns = {
+            'symbol': df['symbol'].to_numpy().astype(object),
+            'timestamp': df['timestamp'].to_numpy().astype('datetime64[us]'),
+            'last': df['last'].to_numpy().astype(np.float64),
+        }
+        for side in ('bid', 'ask'):
+            # Same convention as the SQLite path: null or zero quotes become NaN
+            values = df[side].fill_null(np.nan).to_numpy().astype(np.float64)
+            values[values == 0] = np.nan
+            columns[side] = values
+        return columns, all_symbols
+
+    def export_parquet(self, path: str) -> int:
+        """Snapshot the whole prices table to a Parquet file.
+
+        Passing the file as parquet_path to later backtests loads prices
+        from the columnar snapshot instead of SQLite.
+
+        Args:
+            path: Destination Parquet file
+
+        Returns:
+            Number of rows written
+        """
+        with self.db.get_connection() as conn:
+            results = conn.execute(
+                "SELECT symbol, timestamp, last, bid, ask FROM prices ORDER BY symbol, timestamp"
+            ).fetchall()
+
+        df = pl.DataFrame({
+            'symbol': [row[0] for row in results],
+            'timestamp': np.array([row[1] for row in results], dtype=str).astype('datetime64[us]'),
+            'last': [row[2] for row in results],
+            'bid': [row[3] for row in results],
+            'ask': [row[4] for row in results],
+        }, schema_overrides={'symbol': pl.Utf8, 'last': pl.Float64, 'bid': pl.Float64, 'ask': pl.Float64})
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        df.write_parquet(path)
+        logger.success(f"Exported {df.height} price rows to {path}")
+        return df.height
+
     async def get_current_price(self, symbol: str) -> Optional[PriceData]:
         """Get price at current simulated time.
 
@@ -122,6 +360,9 @@ class BacktestDataSource(DataSource):
             logger.warning("No current_time set for backtest data source")
             return None
 
+        if symbol in self._price_memo:
+            return self._price_memo[symbol]
+
         await self._load_data_cache()
 
         if symbol not in self._price_cache:
@@ -129,24 +370,44 @@ class BacktestDataSource(DataSource):
             return None
 
         # Find the most recent price at or before current_time
-        symbol_data = self._price_cache[symbol]
+        series = self._price_cache[symbol]
+        idx = self._index_at(symbol, series)
 
-        # Binary search for efficiency
-        left, right = 0, len(symbol_data) - 1
-        result_idx = -1
+        price = self._price_at(symbol, series, idx) if idx >= 0 else None
+        self._price_memo[symbol] = price
+        return price
 
-        while left <= right:
-            mid = (left + right) // 2
-            if symbol_data[mid].timestamp <= self.current_time:
-                result_idx = mid
-                left = mid + 1
-            else:
-                right = mid - 1
+    async def get_symbol_prices(self, symbols: Sequence[str]) -> Dict[str, Optional[PriceData]]:
+        """Get prices for multiple symbols at current simulated time.
 
-        if result_idx == -1:
-            return None
+        Resolves every symbol in one synchronous pass over the cached
+        series instead of one awaited get_current_price per symbol.
 
-        return symbol_data[result_idx]
+        Args:
+            symbols: List of trading symbols
+
+        Returns:
+            Dictionary mapping symbol to price data
+        """
+        if not self.current_time:
+            logger.warning("No current_time set for backtest data source")
+            return {symbol: None for symbol in symbols}
+
+        await self._load_data_cache()
+
+        memo = self._price_memo
+        result: Dict[str, Optional[PriceData]] = {}
+        for symbol in symbols:
+            if symbol not in memo:
+                series = self._price_cache.get(symbol)
+                if series is None:
+                    memo[symbol] = None
+                else:
+                    idx = self._index_at(symbol, series)
+                    memo[symbol] = self._price_at(symbol, series, idx) if idx >= 0 else None
+            result[symbol] = memo[symbol]
+
+        return result
 
     async def get_price_history(self, symbol: str, limit: int = 100) -> List[PriceData]:
         """Get historical price data up to current simulated time.
@@ -166,15 +427,111 @@ class BacktestDataSource(DataSource):
         if symbol not in self._price_cache:
             return []
 
-        # Get all data up to current_time
-        symbol_data = self._price_cache[symbol]
-        valid_data = [
-            data for data in symbol_data
-            if data.timestamp <= self.current_time
+        # Data up to current_time ends at hi; return the most recent 'limit' points
+        series = self._price_cache[symbol]
+        lo, hi = kernels.history_slice(series.ticks, self._now, self._last_idx.get(symbol, -1), limit)
+        self._last_idx[symbol] = hi - 1
+
+        # Convert each column slice to Python values in one call instead of per element
+        return [
+            PriceData(
+                symbol=symbol,
+                price=price,
+                timestamp=timestamp,
+                bid=None if bid != bid else bid,  # NaN marks a missing quote
+                ask=None if ask != ask else ask,
+                volume=None  # Volume not available in current schema
+            )
+            for timestamp, price, bid, ask in zip(
+                series.timestamps[lo:hi].tolist(),
+                series.prices[lo:hi].tolist(),
+                series.bids[lo:hi].tolist(),
+                series.asks[lo:hi].tolist(),
+            )
         ]
 
-        # Return the most recent 'limit' data points
-        return valid_data[-limit:] if valid_data else []
+    def _index_at(self, symbol: str, series: _PriceSeries) -> int:
+        """Find the last row at or before current_time.
+
+        Time usually only moves forward a little between calls, so the
+        search resumes from the previous result for the symbol. Cold
+        lookups use the Eytzinger index when one was built.
+
+        Args:
+            symbol: Trading symbol
+            series: Cached price series for the symbol
+
+        Returns:
+            Row index, or -1 if all data is after current_time
+        """
+        hint = self._last_idx.get(symbol, -1)
+        cold = hint < 0 or series.ticks[hint] > self._now
+        if cold and series.eytzinger is not None:
+            idx = kernels.eytzinger_search(*series.eytzinger, self._now)
+        else:
+            idx = kernels.lookup(series.ticks, self._now, hint)
+
+        self._last_idx[symbol] = idx
+        return idx
+
+    async def get_price_ratio_history(
+        self,
+        symbol1: str,
+        symbol2: str,
+        limit: int = 100
+    ) -> List[Tuple[datetime, float]]:
+        """Get historical price ratio data up to current simulated time.
+
+        Args:
+            symbol1: First symbol (numerator)
+            symbol2: Second symbol (denominator)
+            limit: Number of historical points
+
+        Returns:
+            List of (timestamp, ratio) tuples, ordered by timestamp
+        """
+        if not self.current_time:
+            return []
+
+        await self._load_data_cache()
+
+        if symbol1 not in self._price_cache or symbol2 not in self._price_cache:
+            return []
+
+        # Same window as joining two get_price_history calls, without boxing rows
+        windows = []
+        for symbol in (symbol1, symbol2):
+            series = self._price_cache[symbol]
+            lo, hi = kernels.history_slice(series.ticks, self._now, self._last_idx.get(symbol, -1), limit)
+            self._last_idx[symbol] = hi - 1
+            windows.append((series.ticks[lo:hi], series.prices[lo:hi]))
+
+        ticks, ratios = kernels.ratio_hist(*windows[0], *windows[1])
+
+        return list(zip(ticks.view('datetime64[us]').tolist(), ratios.tolist()))
+
+    @staticmethod
+    def _price_at(symbol: str, series: _PriceSeries, idx: int) -> PriceData:
+        """Box one row of a cached price series into a PriceData.
+
+        Args:
+            symbol: Trading symbol
+            series: Cached price series for the symbol
+            idx: Row index
+
+        Returns:
+            Price data for that row
+        """
+        bid = float(series.bids[idx])
+        ask = float(series.asks[idx])
+        return PriceData(
+            symbol=symbol,
+            price=float(series.prices[idx]),
+            timestamp=series.timestamps[idx].item(),
+            bid=None if np.isnan(bid) else bid,
+            ask=None if np.isnan(ask) else ask,
+            volume=None  # Volume not available in current schema
+        )
 
     async def get_candles(
         self,
@@ -198,25 +555,27 @@ class BacktestDataSource(DataSource):
         try:
             with self.db.get_connection() as conn:
                 query = """
-                    SELECT symbol, timeframe, timestamp, open, high, low, close, volume
-                    FROM candles
-                    WHERE symbol = ? AND timeframe = ? AND timestamp <= ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
+                    -- Newest rows first for the LIMIT, then returned oldest first
+                    SELECT * FROM (
+                        SELECT symbol, timeframe, timestamp, open, high, low, close, volume
+                        FROM candles
+                        WHERE symbol = ? AND timeframe = ? AND timestamp <= ?
+                        ORDER BY timestamp DESC
+                        LIMIT ?
+                    )
+                    ORDER BY timestamp ASC
                 """
 
                 results = conn.execute(
                     query,
-                    (symbol, timeframe, self.current_time.isoformat(), limit)
+                    (symbol, timeframe, self.current_time.isoformat(sep=' '), limit)
                 ).fetchall()
 
                 if not results:
                     return []
 
-                # Reverse to get oldest first
-                candle_data = []
-                for row in reversed(results):
-                    candle_data.append(CandleData(
+                candle_data = [
+                    CandleData(
                         symbol=row[0],
                         timeframe=row[1],
                         timestamp=datetime.fromisoformat(row[2]),
@@ -225,7 +584,9 @@ class BacktestDataSource(DataSource):
                         low=float(row[5]),
                         close=float(row[6]),
                         volume=float(row[7])
-                    ))
+                    )
+                    for row in results
+                ]
 
                 return candle_data
 
@@ -257,21 +618,11 @@ class BacktestDataSource(DataSource):
         # Simulate a simple orderbook around current price
         # This is a basic implementation - real orderbook reconstruction
         # would be more complex
-        spread_pct = 0.001  # 0.1% spread
-
-        bids = []
-        asks = []
+        bid_multipliers, ask_multipliers, quantities = _simulated_book_shape(depth)
 
-        for i in range(depth):
-            # Bids below current price
-            bid_price = price * (1 - spread_pct/2 - (i * 0.0001))
-            bid_qty = 100.0 + (i * 10)  # Simulated quantity
-            bids.append(OrderBookLevel(price=bid_price, quantity=bid_qty))
-
-            # Asks above current price
-            ask_price = price * (1 + spread_pct/2 + (i * 0.0001))
-            ask_qty = 100.0 + (i * 10)  # Simulated quantity
-            asks.append(OrderBookLevel(price=ask_price, quantity=ask_qty))
+        # Bids below current price, asks above
+        bids = list(map(OrderBookLevel, (price * bid_multipliers).tolist(), quantities))
+        asks = list(map(OrderBookLevel, (price * ask_multipliers).tolist(), quantities))
 
         return OrderBookData(
             symbol=symbol,
@@ -301,21 +652,21 @@ class BacktestDataSource(DataSource):
         await self._load_data_cache()
 
         if symbol and symbol in self._price_cache:
-            data = self._price_cache[symbol]
-            if data:
-                return data[0].timestamp, data[-1].timestamp
+            timestamps = self._price_cache[symbol].timestamps
+            if len(timestamps):
+                return timestamps[0].item(), timestamps[-1].item()
             return None, None
 
         # Check all symbols
         earliest = None
         latest = None
 
-        for symbol_data in self._price_cache.values():
-            if not symbol_data:
+        for series in self._price_cache.values():
+            if not len(series.timestamps):
                 continue
 
-            first_time = symbol_data[0].timestamp
-            last_time = symbol_data[-1].timestamp
+            first_time = series.timestamps[0].item()
+            last_time = series.timestamps[-1].item()
 
             if earliest is None or first_time < earliest:
                 earliest = first_time
@@ -328,8 +679,13 @@ class BacktestDataSource(DataSource):
     def reset(self):
         """Reset the backtest data source."""
         self.current_time = self.start_time
+        self._last_idx.clear()
         # Keep cache loaded for efficiency
 
+    def close(self) -> None:
+        """Close the database connections (the loaded price cache stays usable)."""
+        self.db.close()
+
     def get_progress(self) -> Optional[float]:
         """Get backtest progress as percentage.
 
@@ -1,12 +1,13 @@
 """Abstract DataSource interface for strategy data access."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+import asyncio
+from typing import Optional, List, Sequence, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """Price data point."""
     symbol: str
@@ -17,7 +18,7 @@ class PriceData:
     volume: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CandleData:
     """OHLCV candle data."""
     symbol: str
@@ -30,14 +31,14 @@ class CandleData:
     volume: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookLevel:
     """Single order book level."""
     price: float
     quantity: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookData:
     """Order book snapshot."""
     symbol: str
@@ -111,7 +112,7 @@ class DataSource(ABC):
         """
         pass
 
-    async def get_symbol_prices(self, symbols: List[str]) -> dict[str, Optional[PriceData]]:
+    async def get_symbol_prices(self, symbols: Sequence[str]) -> dict[str, Optional[PriceData]]:
         """Get current prices for multiple symbols.
 
         Args:
@@ -120,10 +121,12 @@ class DataSource(ABC):
         Returns:
             Dictionary mapping symbol to price data
         """
-        result = {}
-        for symbol in symbols:
-            result[symbol] = await self.get_current_price(symbol)
-        return result
+        prices = await asyncio.gather(*(self.get_current_price(symbol) for symbol in symbols))
+        return dict(zip(symbols, prices))
+
+    def close(self) -> None:
+        """Release resources held by the data source. Override in subclasses."""
+        pass
 
     async def calculate_price_ratio(self, symbol1: str, symbol2: str) -> Optional[float]:
         """Calculate price ratio between two symbols.
@@ -171,20 +174,21 @@ class DataSource(ABC):
         if not history1 or not history2:
             return []
 
-        # Create dictionaries for fast lookup by timestamp
-        prices1 = {data.timestamp: data.price for data in history1}
-        prices2 = {data.timestamp: data.price for data in history2}
-
-        # Find common timestamps and calculate ratios
-        common_timestamps = set(prices1.keys()) & set(prices2.keys())
-
+        # Both histories are sorted by timestamp, so merge-join them in one pass
         ratios = []
-        for timestamp in sorted(common_timestamps):
-            price1 = prices1[timestamp]
-            price2 = prices2[timestamp]
-
-            if price2 > 0:  # Avoid division by zero
-                ratio = price1 / price2
-                ratios.append((timestamp, ratio))
+        i, j = 0, 0
+        n1, n2 = len(history1), len(history2)
+        while i < n1 and j < n2:
+            data1, data2 = history1[i], history2[j]
+
+            if data1.timestamp < data2.timestamp:
+                i += 1
+            elif data1.timestamp > data2.timestamp:
+                j += 1
+            else:
+                if data2.price > 0:  # Avoid division by zero
+                    ratios.append((data1.timestamp, data1.price / data2.price))
+                i += 1
+                j += 1
 
         return ratios[-limit:]  # Return most recent 'limit' ratios
\ No newline at end of file
@@ -1,9 +1,18 @@
 """Live data source implementation using database."""
 
-from typing import Optional, List
+from typing import Any, Optional, List, Dict, Sequence, Tuple
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
+import time
+import numpy as np
 from loguru import logger
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .base import DataSource, PriceData, CandleData, OrderBookData, OrderBookLevel
 from ..storage.database import Database
 
@@ -15,13 +24,47 @@ class LiveDataSource(DataSource):
     which is populated by the collectors running in the background.
     """
 
-    def __init__(self, db_path: str = "data/trading.db"):
+    # Most symbols whose current price is memoized at once
+    PRICE_MEMO_SIZE = 256
+
+    def __init__(self, db_path: str = "data/trading.db", price_ttl: float = 0.5):
         """Initialize with database connection.
 
         Args:
             db_path: Path to the SQLite database
+            price_ttl: Seconds a fetched current price is reused before
+                querying the database again (0 disables reuse)
+        """
+        self.db = Database(db_path, read_only=True)
+        self.price_ttl = price_ttl
+        # symbol -> (fetched at, price), least recently fetched first
+        self._price_memo: "OrderedDict[str, Tuple[float, PriceData]]" = OrderedDict()
+
+    def _remember_price(self, price_data: PriceData, fetched_at: float):
+        """Memoize a fetched current price, evicting the least recently fetched symbol if full."""
+        self._price_memo[price_data.symbol] = (fetched_at, price_data)
+        self._price_memo.move_to_end(price_data.symbol)
+        if len(self._price_memo) > self.PRICE_MEMO_SIZE:
+            self._price_memo.popitem(last=False)
+
+    async def _fetch(self, query: str, params: Any = (), one: bool = False) -> Any:
+        """Run a read query on a worker thread so the event loop isn't blocked.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+            one: Return only the first row
+
+        Returns:
+            The first row (or None) if one is set, otherwise all rows
         """
-        self.db = Database(db_path)
+        return await asyncio.to_thread(self._fetch_blocking, query, params, one)
+
+    def _fetch_blocking(self, query: str, params: Any, one: bool) -> Any:
+        """Blocking body of _fetch."""
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(query, params)
+            return cursor.fetchone() if one else cursor.fetchall()
 
     async def get_current_price(self, symbol: str) -> Optional[PriceData]:
         """Get the most recent price from database.
@@ -32,34 +75,93 @@ class LiveDataSource(DataSource):
         Returns:
             Current price data or None if unavailable
         """
+        memo = self._price_memo.get(symbol)
+        if memo is not None and time.monotonic() - memo[0] < self.price_ttl:
+            return memo[1]
+
         try:
-            with self.db.get_connection() as conn:
-                query = """
-                    SELECT symbol, last, timestamp, bid, ask
-                    FROM prices
-                    WHERE symbol = ?
-                    ORDER BY timestamp DESC
-                    LIMIT 1
-                """
+            query = """
+                SELECT symbol, last, timestamp, bid, ask
+                FROM prices
+                WHERE symbol = ?
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """
+
+            result = await self._fetch(query, (symbol,), one=True)
+
+            if not result:
+                logger.debug(f"No price data found for {symbol}")
+                return None
+
+            price_data = PriceData(
+                symbol=result[0],
+                price=float(result[1]),
+                timestamp=datetime.fromisoformat(result[2]),
+                bid=float(result[3]) if result[3] else None,
+                ask=float(result[4]) if result[4] else None,
+                volume=None  # Volume not in current schema
+            )
+            self._remember_price(price_data, time.monotonic())
+            return price_data
 
-                result = conn.execute(query, (symbol,)).fetchone()
+        except Exception as e:
+            logger.error(f"Error fetching current price for {symbol}: {e}")
+            return None
 
-                if not result:
-                    logger.debug(f"No price data found for {symbol}")
-                    return None
+    async def get_symbol_prices(self, symbols: Sequence[str]) -> Dict[str, Optional[PriceData]]:
+        """Get the most recent prices for multiple symbols in one query.
+
+        Args:
+            symbols: List of trading symbols
+
+        Returns:
+            Dictionary mapping symbol to price data
+        """
+        result: Dict[str, Optional[PriceData]] = {symbol: None for symbol in symbols}
 
-                return PriceData(
-                    symbol=result[0],
-                    price=float(result[1]),
-                    timestamp=datetime.fromisoformat(result[2]),
-                    bid=float(result[3]) if result[3] else None,
-                    ask=float(result[4]) if result[4] else None,
+        # Serve fresh memoized prices, query the rest
+        now = time.monotonic()
+        missing = []
+        for symbol in symbols:
+            memo = self._price_memo.get(symbol)
+            if memo is not None and now - memo[0] < self.price_ttl:
+                result[symbol] = memo[1]
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return result
+
+        try:
+            # SQLite returns the bare columns from the row holding MAX(timestamp)
+            placeholders = ", ".join("?" * len(missing))
+            query = f"""
+                SELECT symbol, last, MAX(timestamp), bid, ask
+                FROM prices
+                WHERE symbol IN ({placeholders})
+                GROUP BY symbol
+            """
+
+            rows = await self._fetch(query, missing)
+
+            fetched_at = time.monotonic()
+            for row in rows:
+                price_data = PriceData(
+                    symbol=row[0],
+                    price=float(row[1]),
+                    timestamp=datetime.fromisoformat(row[2]),
+                    bid=float(row[3]) if row[3] else None,
+                    ask=float(row[4]) if row[4] else None,
                     volume=None  # Volume not in current schema
                 )
+                self._remember_price(price_data, fetched_at)
+                result[row[0]] = price_data
 
         except Exception as e:
-            logger.error(f"Error fetching current price for {symbol}: {e}")
-            return None
+            logger.error(f"Error fetching current prices for {', '.join(missing)}: {e}")
+
+        return result
 
     async def get_price_history(self, symbol: str, limit: int = 100) -> List[PriceData]:
         """Get historical price data from database.
@@ -72,34 +174,37 @@ class LiveDataSource(DataSource):
             List of historical price data, ordered by timestamp (oldest first)
         """
         try:
-            with self.db.get_connection() as conn:
-                query = """
+            query = """
+                -- Newest rows first for the LIMIT, then returned oldest first
+                SELECT * FROM (
                     SELECT symbol, last, timestamp, bid, ask
                     FROM prices
                     WHERE symbol = ?
                     ORDER BY timestamp DESC
                     LIMIT ?
-                """
-
-                results = conn.execute(query, (symbol, limit)).fetchall()
-
-                if not results:
-                    logger.debug(f"No price history found for {symbol}")
-                    return []
-
-                # Reverse to get oldest first
-                price_data = []
-                for row in reversed(results):
-                    price_data.append(PriceData(
-                        symbol=row[0],
-                        price=float(row[1]),
-                        timestamp=datetime.fromisoformat(row[2]),
-                        bid=float(row[3]) if row[3] else None,
-                        ask=float(row[4]) if row[4] else None,
-                        volume=None  # Volume not in current schema
-                    ))
+                )
+                ORDER BY timestamp ASC
+            """
+
+            results = await self._fetch(query, (symbol, limit))
+
+            if not results:
+                logger.debug(f"No price history found for {symbol}")
+                return []
+
+            price_data = [
+                PriceData(
+                    symbol=row[0],
+                    price=float(row[1]),
+                    timestamp=datetime.fromisoformat(row[2]),
+                    bid=float(row[3]) if row[3] else None,
+                    ask=float(row[4]) if row[4] else None,
+                    volume=None  # Volume not in current schema
+                )
+                for row in results
+            ]
 
-                return price_data
+            return price_data
 
         except Exception as e:
             logger.error(f"Error fetching price history for {symbol}: {e}")
@@ -122,36 +227,39 @@ class LiveDataSource(DataSource):
             List of candle data, ordered by timestamp (oldest first)
         """
         try:
-            with self.db.get_connection() as conn:
-                query = """
+            query = """
+                -- Newest rows first for the LIMIT, then returned oldest first
+                SELECT * FROM (
                     SELECT symbol, timeframe, timestamp, open, high, low, close, volume
                     FROM candles
                     WHERE symbol = ? AND timeframe = ?
                     ORDER BY timestamp DESC
                     LIMIT ?
-                """
-
-                results = conn.execute(query, (symbol, timeframe, limit)).fetchall()
-
-                if not results:
-                    logger.debug(f"No candle data found for {symbol} {timeframe}")
-                    return []
-
-                # Reverse to get oldest first
-                candle_data = []
-                for row in reversed(results):
-                    candle_data.append(CandleData(
-                        symbol=row[0],
-                        timeframe=row[1],
-                        timestamp=datetime.fromisoformat(row[2]),
-                        open=float(row[3]),
-                        high=float(row[4]),
-                        low=float(row[5]),
-                        close=float(row[6]),
-                        volume=float(row[7])
-                    ))
-
-                return candle_data
+                )
+                ORDER BY timestamp ASC
+            """
+
+            results = await self._fetch(query, (symbol, timeframe, limit))
+
+            if not results:
+                logger.debug(f"No candle data found for {symbol} {timeframe}")
+                return []
+
+            candle_data = [
+                CandleData(
+                    symbol=row[0],
+                    timeframe=row[1],
+                    timestamp=datetime.fromisoformat(row[2]),
+                    open=float(row[3]),
+                    high=float(row[4]),
+                    low=float(row[5]),
+                    close=float(row[6]),
+                    volume=float(row[7])
+                )
+                for row in results
+            ]
+
+            return candle_data
 
         except Exception as e:
             logger.error(f"Error fetching candles for {symbol} {timeframe}: {e}")
@@ -168,49 +276,45 @@ class LiveDataSource(DataSource):
             Order book data or None if unavailable
         """
         try:
-            with self.db.get_connection() as conn:
-                # Get the most recent orderbook entry
-                query = """
-                    SELECT symbol, timestamp, bids_json, asks_json
-                    FROM orderbooks
-                    WHERE symbol = ?
-                    ORDER BY timestamp DESC
-                    LIMIT 1
-                """
-
-                result = conn.execute(query, (symbol,)).fetchone()
-
-                if not result:
-                    logger.debug(f"No orderbook data found for {symbol}")
-                    return None
-
-                import json
-
-                # Parse JSON data
-                bids_data = json.loads(result[2])
-                asks_data = json.loads(result[3])
-
-                # Convert to OrderBookLevel objects and limit depth
-                bids = [
-                    OrderBookLevel(price=float(level[0]), quantity=float(level[1]))
-                    for level in bids_data[:depth]
-                ]
-                asks = [
-                    OrderBookLevel(price=float(level[0]), quantity=float(level[1]))
-                    for level in asks_data[:depth]
-                ]
-
-                return OrderBookData(
-                    symbol=result[0],
-                    timestamp=datetime.fromisoformat(result[1]),
-                    bids=bids,
-                    asks=asks
-                )
+            # Get the most recent orderbook entry
+            query = """
+                SELECT symbol, timestamp, bids, asks
+                FROM orderbook_snapshots
+                WHERE symbol = ?
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """
+
+            result = await self._fetch(query, (symbol,), one=True)
+
+            if not result:
+                logger.debug(f"No orderbook data found for {symbol}")
+                return None
+
+            return OrderBookData(
+                symbol=result[0],
+                timestamp=datetime.fromisoformat(result[1]),
+                bids=self._decode_levels(result[2], depth),
+                asks=self._decode_levels(result[3], depth)
+            )
 
         except Exception as e:
             logger.error(f"Error fetching orderbook for {symbol}: {e}")
             return None
 
+    @staticmethod
+    def _decode_levels(data: Any, depth: int) -> List[OrderBookLevel]:
+        """Decode stored order book levels, limited to depth.
+
+        Snapshots are packed float64 (price, quantity) pairs; rows written
+        before that change hold the same pairs as a JSON string.
+        """
+        if isinstance(data, bytes):
+            levels = np.frombuffer(data, dtype=np.float64).reshape(-1, 2)[:depth]
+        else:
+            levels = np.asarray(json_loads(data), dtype=np.float64).reshape(-1, 2)[:depth]
+        return list(map(OrderBookLevel, levels[:, 0].tolist(), levels[:, 1].tolist()))
+
     async def is_data_fresh(self, symbol: str, max_age_seconds: int = 300) -> bool:
         """Check if data for a symbol is fresh (recent).
 
@@ -245,6 +349,10 @@ class LiveDataSource(DataSource):
 
         return (datetime.now() - price_data.timestamp).total_seconds()
 
+    def close(self) -> None:
+        """Close the database connections."""
+        self.db.close()
+
     def get_database(self) -> Database:
         """Get the underlying database instance.
 
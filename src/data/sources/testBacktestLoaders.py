@@ -0,0 +1,123 @@
+"""Test that the backtest price loaders agree with each other.
+
+BacktestDataSource can load prices from SQLite, from a Parquet snapshot
+(parquet_path) or from the on-disk array cache (cache_dir). A backtest must
+see exactly the same rows whichever one is used, including at the period
+bounds.
+
+Run from the repository root: python -m src.data.sources.testBacktestLoaders
+"""
+
+from src.data.sources.backtest import BacktestDataSource
+from src.data.storage.database import Database
+from datetime import datetime, timedelta
+from pathlib import Path
+from loguru import logger
+import numpy as np
+import asyncio
+import sys
+import tempfile
+
+# Configure loguru for better test output
+logger.remove()  # Remove default handler
+logger.add(sys.stdout, colorize=True, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>")
+
+SYMBOLS = ["AAA/USDT", "BBB/USDT"]
+
+# Bounds on day boundaries, where text and datetime comparisons used to differ
+START_TIME = datetime(2025, 1, 2)
+END_TIME = datetime(2025, 1, 3)
+
+
+def create_database(path: Path) -> Database:
+    """Create a database with 6-hourly prices from 2025-01-01 to 2025-01-04."""
+    db = Database(str(path))
+    rows = []
+    for i, symbol in enumerate(SYMBOLS):
+        for step in range(13):
+            timestamp = datetime(2025, 1, 1) + timedelta(hours=6 * step)
+            price = 100.0 * (i + 1) + step
+            # Some missing and zero quotes, which every loader turns into NaN
+            bid = None if step % 5 == 0 else (0.0 if step % 7 == 0 else price * 0.999)
+            rows.append((symbol, timestamp.strftime('%Y-%m-%d %H:%M:%S'), bid, price * 1.001, price))
+    with db.get_connection() as conn:
+        conn.executemany("INSERT INTO prices (symbol, timestamp, bid, ask, last) VALUES (?, ?, ?, ?, ?)", rows)
+    return db
+
+
+async def load(db_path: Path, **kwargs) -> BacktestDataSource:
+    """Create a backtest data source over the test period and load its prices."""
+    source = BacktestDataSource(str(db_path), start_time=START_TIME, end_time=END_TIME, **kwargs)
+    await source._load_data_cache()
+    return source
+
+
+def same_prices(expected: BacktestDataSource, actual: BacktestDataSource) -> bool:
+    """Check two loaded sources hold identical price columns for every symbol."""
+    if expected._price_cache.keys() != actual._price_cache.keys():
+        return False
+    return all(
+        np.array_equal(getattr(expected._price_cache[symbol], column), getattr(actual._price_cache[symbol], column), equal_nan=equal_nan)
+        for symbol in expected._price_cache
+        for column, equal_nan in (('timestamps', False), ('prices', False), ('bids', True), ('asks', True))
+    )
+
+
+async def test_backtest_loaders():
+    """Load the same period through every loader and compare the results."""
+
+    logger.info("=" * 50)
+    logger.info("TESTING BACKTEST LOADERS")
+    logger.info("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "trading.db"
+        create_database(db_path).close()
+
+        sources = []
+        try:
+            # Test 1: SQLite rows match the period bounds (both inclusive)
+            logger.info("Testing SQLite loader...")
+            sqlite_source = await load(db_path)
+            sources.append(sqlite_source)
+            timestamps = sqlite_source._price_cache[SYMBOLS[0]].timestamps
+            expected = np.arange(
+                np.datetime64(START_TIME, 'us'), np.datetime64(END_TIME, 'us') + 1, np.timedelta64(6, 'h')
+            )
+            if np.array_equal(timestamps, expected):
+                logger.success(f"SQLite loader returned {len(timestamps)} rows from {START_TIME} to {END_TIME}")
+            else:
+                logger.error(f"SQLite loader returned {timestamps}, expected {expected}")
+
+            # Test 2: Parquet snapshot
+            logger.info("Testing Parquet loader...")
+            parquet_path = Path(tmp) / "prices.parquet"
+            sqlite_source.export_parquet(str(parquet_path))
+            parquet_source = await load(db_path, parquet_path=str(parquet_path))
+            sources.append(parquet_source)
+            if same_prices(sqlite_source, parquet_source):
+                logger.success("Parquet loader matches SQLite")
+            else:
+                logger.error("Parquet loader differs from SQLite")
+
+            # Test 3: On-disk cache, written by the first load and memory-mapped by the second
+            logger.info("Testing disk cache loader...")
+            cache_dir = Path(tmp) / "cache"
+            for attempt in ("written", "memory-mapped"):
+                cache_source = await load(db_path, cache_dir=str(cache_dir))
+                sources.append(cache_source)
+                if same_prices(sqlite_source, cache_source):
+                    logger.success(f"Disk cache loader ({attempt}) matches SQLite")
+                else:
+                    logger.error(f"Disk cache loader ({attempt}) differs from SQLite")
+        finally:
+            for source in sources:
+                source.close()
+
+    logger.info("=" * 50)
+    logger.success("TESTING COMPLETE!")
+    logger.info("=" * 50)
+
+
+if __name__ == "__main__":
+    asyncio.run(test_backtest_loaders())
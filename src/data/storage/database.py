@@ -1,42 +1,324 @@
 """Database module for storing market data."""
 
+import asyncio
+import atexit
+import queue
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import numpy as np
 import polars as pl
 from loguru import logger
 import uuid
-import json
+import weakref
+
+try:
+    import orjson
+    
+    def json_dumps(obj: Any) -> str:
+        """orjson-backed json.dumps."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    from json import dumps as json_dumps  # type: ignore[assignment]
+
+
+class _Checkpointer:
+    """Background WAL checkpoint thread, shared by every Database open on one file.
+    
+    Every interval it runs a PASSIVE checkpoint, which copies whatever
+    frames it can without waiting on readers or the writer, so neither side
+    ever stalls on it. PASSIVE never shrinks the -wal file, so once a
+    checkpoint has copied every frame and the file is over truncate_size, it
+    also tries a TRUNCATE. That runs with no busy timeout, so if any reader
+    or writer is active it gives up at once instead of blocking them.
+    """
+    
+    _lock = threading.Lock()
+    _running: Dict[Path, "_Checkpointer"] = {}  # Database file -> its checkpointer
+    
+    def __init__(self, path: Path, interval: float, truncate_size: int):
+        self.path = path
+        self.interval = interval
+        self.truncate_size = truncate_size
+        self.users = 0  # Open Database instances sharing this checkpointer
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"wal-checkpoint-{path.name}", daemon=True)
+    
+    @classmethod
+    def acquire(cls, path: Path, interval: float, truncate_size: int) -> "_Checkpointer":
+        """Get the checkpointer for a database file, starting it if it isn't running."""
+        path = path.resolve()
+        with cls._lock:
+            checkpointer = cls._running.get(path)
+            if checkpointer is None:
+                checkpointer = cls._running[path] = cls(path, interval, truncate_size)
+                checkpointer._thread.start()
+            checkpointer.users += 1
+        return checkpointer
+    
+    def release(self):
+        """Drop one user, stopping the thread once the last one has released it."""
+        with self._lock:
+            self.users -= 1
+            if self.users:
+                return
+            del self._running[self.path]
+        self._stopped.set()
+        self._thread.join()
+    
+    def _run(self):
+        """Checkpoint every interval until stopped."""
+        # Autocommit, and no busy timeout so TRUNCATE never waits on other connections
+        conn = sqlite3.connect(self.path, timeout=0, isolation_level=None, check_same_thread=False)
+        wal_path = self.path.with_name(self.path.name + '-wal')
+        try:
+            while not self._stopped.wait(self.interval):
+                try:
+                    busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+                    if busy or checkpointed < log_frames:
+                        # Usually a long-running reader pinning old frames
+                        logger.debug(f"WAL checkpoint incomplete: {checkpointed}/{log_frames} frames copied")
+                    elif wal_path.exists() and wal_path.stat().st_size > self.truncate_size:
+                        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"WAL checkpoint failed: {e}")
+        finally:
+            conn.close()
+
+
+def _flush_at_exit(ref: "weakref.ref[Database]"):
+    """Flush a database's buffered writes at interpreter exit, if it is still alive."""
+    db = ref()
+    if db is not None:
+        db.flush()
 
 
 class Database:
     """SQLite database for market data storage."""
     
-    def __init__(self, db_path: str = "data/trading.db"):
+    # Per-connection settings: fsync only at WAL checkpoints, keep temp
+    # tables in memory, memory-map up to 512MB of the file and use a 64MB page cache
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=536870912",
+        "PRAGMA cache_size=-65536",
+    )
+    
+    # Page size for newly created databases (fewer, larger pages per B-tree walk)
+    PAGE_SIZE = 8192
+    
+    # Read-only connections kept open for reuse between queries
+    READER_POOL_SIZE = 4
+    
+    # Seconds a connection waits on another process's lock before raising
+    BUSY_TIMEOUT = 5.0
+    
+    # Buffered single-row writes (save_ticker, log_signal) are flushed once
+    # this many rows are pending, or this many seconds after the first one
+    WRITE_BUFFER_SIZE = 500
+    WRITE_BUFFER_INTERVAL = 0.25
+    
+    # Seconds between WAL checkpoints run by the background checkpointer
+    CHECKPOINT_INTERVAL = 5.0
+    
+    # WAL pages after which a commit checkpoints inline anyway (SQLite's
+    # default is 1000), a backstop in case the background checkpointer falls behind
+    WAL_AUTOCHECKPOINT = 10000
+    
+    # Bytes above which the checkpointer truncates the -wal file once it is fully copied
+    WAL_TRUNCATE_SIZE = 64 * 1024 * 1024
+    
+    # Seconds a get_active_sessions result is reused
+    ACTIVE_SESSIONS_TTL = 1.0
+    
+    def __init__(self, db_path: str = "data/trading.db", read_only: bool = False):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_tables()
-        logger.info(f"Database initialized at {self.db_path}")
+        self.read_only = read_only
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self.READER_POOL_SIZE)
+        self._writer: Optional[sqlite3.Connection] = None  # Long-lived writer connection
+        self._write_lock = threading.Lock()  # SQLite allows one writer at a time
+        self._buffers: Dict[str, List[tuple]] = {'tickers': [], 'signals': []}
+        self._buffer_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._checkpointer: Optional[_Checkpointer] = None
+        # (fetched at, sessions) from the last get_active_sessions query
+        self._active_sessions: Optional[tuple] = None
+        self._sessions_generation = 0  # Bumped whenever this instance changes sessions
+        self._sessions_lock = threading.Lock()
+        
+        if read_only:
+            # mode=ro can't create the file, so fail early with a useful message
+            if not self.db_path.exists():
+                raise FileNotFoundError(
+                    f"No database at {self.db_path}. Run the data collectors "
+                    "(or src/utils/downloadHistorical.py) first to create it."
+                )
+            logger.info(f"Database opened read-only at {self.db_path}")
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_tables()
+            # Don't lose buffered rows on a normal shutdown without close(). Only
+            # a weak reference is held, so this doesn't keep the instance alive.
+            atexit.register(_flush_at_exit, weakref.ref(self))
+            self._checkpointer = _Checkpointer.acquire(
+                self.db_path, self.CHECKPOINT_INTERVAL, self.WAL_TRUNCATE_SIZE
+            )
+            logger.info(f"Database initialized at {self.db_path}")
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        if read_only:
+            # URI mode=ro lets readers share the WAL with a live writer
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=self.BUSY_TIMEOUT,
+                check_same_thread=False
+            )
+        else:
+            # Autocommit mode; get_connection opens each write transaction explicitly
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            # Commits normally leave checkpointing to the background _Checkpointer
+            conn.execute(f"PRAGMA wal_autocheckpoint={self.WAL_AUTOCHECKPOINT}")
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if not read_only:
+            # Writers get a 128MB page cache so bulk inserts rarely evict pages
+            conn.execute("PRAGMA cache_size=-131072")
+        return conn
+    
+    def _checkout(self, read_only: bool) -> sqlite3.Connection:
+        """Take a connection for one get_connection block."""
+        if read_only:
+            try:
+                return self._readers.get_nowait()
+            except queue.Empty:
+                return self._connect(read_only=True)
+        
+        # Held until _checkin, so blocks on the writer never interleave
+        self._write_lock.acquire()
+        try:
+            if self._writer is None:
+                self._writer = self._connect(read_only=False)
+        except Exception:
+            self._write_lock.release()
+            raise
+        return self._writer
+    
+    def _checkin(self, conn: sqlite3.Connection, read_only: bool):
+        """Return a connection taken by _checkout."""
+        if read_only:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        else:
+            self._write_lock.release()
+    
+    @contextmanager
+    def get_connection(self, read_only: bool = False):
+        """Context manager for database connections.
+        
+        Connections stay open between calls, so their page cache and
+        prepared statements are reused. Reads are served from a small
+        pool of read-only connections; writes share a single writer
+        connection that is held for the whole block, inside a
+        BEGIN IMMEDIATE transaction.
+        
+        Args:
+            read_only: The block only reads, so it can use the read pool
+                instead of waiting on the writer (always set for
+                databases opened read-only)
+        """
+        read_only = read_only or self.read_only
+        conn = self._checkout(read_only)
         try:
+            if not read_only:
+                # Take SQLite's write lock up front rather than upgrading a
+                # read lock at the first write, which can fail with SQLITE_BUSY
+                conn.execute("BEGIN IMMEDIATE")
             yield conn
-            conn.commit()
+            if conn.in_transaction:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
+            if conn.in_transaction:
+                conn.rollback()
             logger.error(f"Database error: {e}")
             raise
         finally:
-            conn.close()
+            self._checkin(conn, read_only)
+    
+    def _buffer_row(self, kind: str, row: tuple):
+        """Queue a row for the next flush, flushing now if the buffer is full."""
+        with self._buffer_lock:
+            buffer = self._buffers[kind]
+            buffer.append(row)
+            full = len(buffer) >= self.WRITE_BUFFER_SIZE
+            if not full and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.WRITE_BUFFER_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if full:
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered tickers and signals."""
+        with self._buffer_lock:
+            tickers = self._buffers['tickers']
+            signals = self._buffers['signals']
+            self._buffers = {'tickers': [], 'signals': []}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        
+        if tickers:
+            self._save_ticker_rows(tickers)
+        if signals:
+            try:
+                self.log_signals(signals)
+            except Exception as e:
+                logger.error(f"Failed to log {len(signals)} signals: {e}")
+    
+    def close(self):
+        """Flush buffered writes and close the pooled connections."""
+        if not self.read_only:
+            self.flush()
+        if self._checkpointer is not None:
+            self._checkpointer.release()
+            self._checkpointer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
     
     def _init_tables(self):
         """Create tables if they don't exist."""
+        # Database-wide settings can't change inside a transaction
+        conn = self._checkout(read_only=False)
+        try:
+            # Only takes effect on a new, empty database file
+            conn.execute(f"PRAGMA page_size={self.PAGE_SIZE}")
+            
+            # WAL lets readers (backtests, data sources) run alongside collector writes.
+            # The journal mode is persistent, so setting it once here is enough.
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            self._checkin(conn, read_only=False)
+        
         with self.get_connection() as conn:
             # Prices table - stores ticker data
             conn.execute("""
@@ -76,8 +358,8 @@ class Database:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     symbol TEXT NOT NULL,
                     timestamp DATETIME NOT NULL,
-                    bids TEXT NOT NULL,  -- JSON string
-                    asks TEXT NOT NULL,  -- JSON string
+                    bids BLOB NOT NULL,  -- Packed float64 (price, quantity) pairs
+                    asks BLOB NOT NULL,  -- Packed float64 (price, quantity) pairs
                     spread REAL,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
@@ -139,10 +421,15 @@ class Database:
             """)
             
             # Create indexes for faster queries
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_symbol_time ON prices(symbol, timestamp DESC)")
+            # Covering: latest-price and price-history reads never touch the table rows
+            conn.execute("DROP INDEX IF EXISTS idx_prices_symbol_time")  # Superseded by idx_prices_latest
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_latest ON prices(symbol, timestamp DESC, last, bid, ask)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_candles_symbol_time ON candles(symbol, timeframe, timestamp DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_orderbooks_symbol_time ON orderbook_snapshots(symbol, timestamp DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp DESC)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_session ON trades(session_id)")
+            # Covering for the per-session P&L aggregates in compare_sessions
+            conn.execute("DROP INDEX IF EXISTS idx_trades_session")  # Superseded by idx_trades_session_pnl
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_session_pnl ON trades(session_id, pnl)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_session ON signals(session_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status)")
             
@@ -151,61 +438,99 @@ class Database:
     # ============= ORIGINAL METHODS =============
     
     def save_ticker(self, ticker) -> bool:
-        """Save a ticker to the database."""
+        """Buffer a ticker for the database.
+        
+        The row is written with the next batch (see flush), so it may take
+        up to WRITE_BUFFER_INTERVAL seconds to become visible to readers.
+        """
+        self._buffer_row('tickers', (
+            ticker.symbol,
+            ticker.timestamp,
+            ticker.bid,
+            ticker.ask,
+            ticker.last,
+            ticker.volume_24h
+        ))
+        return True
+    
+    def save_tickers(self, tickers: List) -> int:
+        """Save multiple tickers in a single transaction. Returns count saved."""
+        if not tickers:
+            return 0
+        
+        return self._save_ticker_rows([
+            (
+                ticker.symbol,
+                ticker.timestamp,
+                ticker.bid,
+                ticker.ask,
+                ticker.last,
+                ticker.volume_24h
+            )
+            for ticker in tickers
+        ])
+    
+    def _save_ticker_rows(self, rows: List[tuple]) -> int:
+        """Insert (symbol, timestamp, bid, ask, last, volume_24h) rows. Returns count saved."""
         try:
             with self.get_connection() as conn:
-                conn.execute("""
+                conn.executemany("""
                     INSERT OR REPLACE INTO prices 
                     (symbol, timestamp, bid, ask, last, volume_24h)
                     VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    ticker.symbol,
-                    ticker.timestamp,
-                    ticker.bid,
-                    ticker.ask,
-                    ticker.last,
-                    ticker.volume_24h
-                ))
-            logger.debug(f"Saved ticker for {ticker.symbol}")
-            return True
+                """, rows)
+            logger.debug(f"Saved {len(rows)} tickers")
+            return len(rows)
         except Exception as e:
-            logger.error(f"Failed to save ticker: {e}")
-            return False
+            logger.error(f"Failed to save tickers: {e}")
+            return 0
     
-    def save_candles(self, symbol: str, timeframe: str, candles: List) -> int:
-        """Save multiple candles to the database. Returns count saved."""
-        saved_count = 0
-        with self.get_connection() as conn:
-            for candle in candles:
-                try:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO candles 
-                        (symbol, timeframe, timestamp, open, high, low, close, volume)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        symbol,
-                        timeframe,
-                        candle.timestamp,
-                        candle.open,
-                        candle.high,
-                        candle.low,
-                        candle.close,
-                        candle.volume
-                    ))
-                    saved_count += 1
-                except Exception as e:
-                    logger.warning(f"Skipped candle: {e}")
+    def save_candles(self, symbol: str, timeframe: str, candles: pl.DataFrame) -> int:
+        """Save a DataFrame of candles in a single transaction. Returns count saved."""
+        if candles.is_empty():
+            return 0
+        
+        query = """
+            INSERT OR REPLACE INTO candles 
+            (symbol, timeframe, timestamp, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        rows = [
+            (symbol, timeframe, *row)
+            for row in candles.select(['timestamp', 'open', 'high', 'low', 'close', 'volume']).iter_rows()
+        ]
+        
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(query, rows)
+            saved = len(rows)
+        except sqlite3.Error as e:
+            # Retry row by row so one bad candle doesn't drop the whole batch
+            logger.warning(f"Batch insert failed for {symbol} {timeframe}, retrying per row: {e}")
+            saved = 0
+            with self.get_connection() as conn:
+                for row in rows:
+                    try:
+                        conn.execute(query, row)
+                        saved += 1
+                    except sqlite3.Error as row_error:
+                        logger.warning(f"Skipped candle {symbol} {timeframe} at {row[2]}: {row_error}")
         
-        logger.info(f"Saved {saved_count}/{len(candles)} candles for {symbol} {timeframe}")
-        return saved_count
+        logger.info(f"Saved {saved}/{len(candles)} candles for {symbol} {timeframe}")
+        return saved
+    
+    @staticmethod
+    def _pack_levels(levels) -> bytes:
+        """Pack (price, quantity) levels as raw float64 bytes, read back with np.frombuffer."""
+        return np.ascontiguousarray(levels, dtype=np.float64).tobytes()
     
     def save_orderbook(self, orderbook, symbol: str) -> bool:
         """Save an orderbook snapshot."""
         try:
             # Calculate spread
             spread = None
-            if orderbook.bids and orderbook.asks:
-                spread = orderbook.asks[0][0] - orderbook.bids[0][0]
+            if len(orderbook.bids) and len(orderbook.asks):
+                spread = float(orderbook.asks[0][0] - orderbook.bids[0][0])
             
             with self.get_connection() as conn:
                 conn.execute("""
@@ -215,8 +540,8 @@ class Database:
                 """, (
                     symbol,
                     orderbook.timestamp,
-                    json.dumps(orderbook.bids[:10]),  # Store top 10 levels
-                    json.dumps(orderbook.asks[:10]),
+                    self._pack_levels(orderbook.bids[:10]),  # Store top 10 levels
+                    self._pack_levels(orderbook.asks[:10]),
                     spread
                 ))
             logger.debug(f"Saved orderbook for {symbol}")
@@ -225,9 +550,24 @@ class Database:
             logger.error(f"Failed to save orderbook: {e}")
             return False
     
+    @staticmethod
+    def _rows_to_frame(cursor: sqlite3.Cursor) -> pl.DataFrame:
+        """Build a DataFrame from a cursor's result rows in one pass.
+        
+        Rows are fetched as plain tuples and handed to Polars row-wise,
+        instead of being split into per-column Python lists first.
+        """
+        cursor.row_factory = None  # type: ignore[assignment]
+        rows = cursor.fetchall()
+        if not rows:
+            return pl.DataFrame()
+        
+        columns = [col[0] for col in cursor.description]
+        return pl.DataFrame(rows, schema=columns, orient="row", infer_schema_length=None)
+    
     def get_latest_price(self, symbol: str) -> Optional[float]:
         """Get the latest price for a symbol."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             result = conn.execute("""
                 SELECT last FROM prices 
                 WHERE symbol = ? 
@@ -239,7 +579,7 @@ class Database:
     
     def get_recent_candles(self, symbol: str, timeframe: str, limit: int = 100) -> pl.DataFrame:
         """Get recent candles as a Polars DataFrame."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.execute("""
                 SELECT timestamp, open, high, low, close, volume
                 FROM candles
@@ -248,33 +588,23 @@ class Database:
                 LIMIT ?
             """, (symbol, timeframe, limit))
             
-            rows = cursor.fetchall()
-            
-            if not rows:
-                return pl.DataFrame()
-            
-            # Convert to Polars DataFrame
-            data = {
-                'timestamp': [row['timestamp'] for row in rows],
-                'open': [row['open'] for row in rows],
-                'high': [row['high'] for row in rows],
-                'low': [row['low'] for row in rows],
-                'close': [row['close'] for row in rows],
-                'volume': [row['volume'] for row in rows],
-            }
-            
-            df = pl.DataFrame(data)
+            df = self._rows_to_frame(cursor)
+            if df.is_empty():
+                return df
             return df.sort('timestamp')  # Return in chronological order
     
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             stats = {}
             
-            # Count records in each table
-            for table in ['prices', 'candles', 'orderbook_snapshots', 'trades']:
-                count = conn.execute(f"SELECT COUNT(*) as cnt FROM {table}").fetchone()
-                stats[f'{table}_count'] = count['cnt']
+            # Count records in every table with one query
+            tables = ['prices', 'candles', 'orderbook_snapshots', 'trades']
+            counts = conn.execute(" UNION ALL ".join(
+                f"SELECT '{table}' as tbl, COUNT(*) as cnt FROM {table}" for table in tables
+            )).fetchall()
+            for row in counts:
+                stats[f"{row['tbl']}_count"] = row['cnt']
             
             # Get date range
             result = conn.execute("""
@@ -310,14 +640,21 @@ class Database:
                 session_id,
                 name,
                 description,
-                json.dumps(strategies or []),
-                json.dumps(parameters or {}),
+                json_dumps(strategies or []),
+                json_dumps(parameters or {}),
                 int(is_live)
             ))
+        self._invalidate_sessions()
         
         logger.info(f"Created session '{name}' with ID: {session_id}")
         return session_id
     
+    def _invalidate_sessions(self):
+        """Drop the cached get_active_sessions result."""
+        with self._sessions_lock:
+            self._sessions_generation += 1
+            self._active_sessions = None
+    
     def end_session(self, session_id: str):
         """Mark a session as completed and calculate final stats."""
         with self.get_connection() as conn:
@@ -340,6 +677,7 @@ class Database:
                     trade_count = ?
                 WHERE session_id = ?
             """, (stats['total_pnl'], stats['trade_count'], session_id))
+        self._invalidate_sessions()
         
         logger.info(f"Session {session_id} completed. P&L: ${stats['total_pnl']:.2f}")
     
@@ -353,7 +691,8 @@ class Database:
         fee: float = 0, 
         strategy: str = None, # type: ignore
         session_id: str = None,  # NEW: Optional session ID # type: ignore
-        is_paper: bool = True     # NEW: Paper trading flag
+        is_paper: bool = True,    # NEW: Paper trading flag
+        timestamp: Optional[datetime] = None  # Execution time, defaults to now
     ) -> bool:
         """Log a trade execution."""
         try:
@@ -370,7 +709,7 @@ class Database:
                     price,
                     amount,
                     fee,
-                    datetime.now(),
+                    timestamp or datetime.now(),
                     strategy,
                     int(is_paper)
                 ))
@@ -395,43 +734,52 @@ class Database:
         strategy: str,
         traded: bool = False
     ):
-        """Log a signal (whether traded or not)."""
+        """Log a signal (whether traded or not).
+        
+        Buffered like save_ticker; the row is written with the next flush.
+        """
+        self._buffer_row('signals', (
+            session_id,
+            symbol,
+            signal_type,
+            strength,
+            price,
+            reason,
+            strategy,
+            int(traded)
+        ))
+    
+    def log_signals(self, signals: List[tuple]) -> int:
+        """Log multiple signals in a single transaction. Returns count logged.
+        
+        Each signal is a tuple in log_signal's argument order:
+        (session_id, symbol, signal_type, strength, price, reason, strategy, traded).
+        """
+        if not signals:
+            return 0
+        
         with self.get_connection() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT INTO signals
                 (session_id, symbol, signal_type, strength, price, reason, strategy, traded)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                session_id,
-                symbol,
-                signal_type,
-                strength,
-                price,
-                reason,
-                strategy,
-                int(traded)
-            ))
+            """, [(*signal[:7], int(signal[7]) if len(signal) > 7 else 0) for signal in signals])
+        return len(signals)
     
     def get_session_trades(self, session_id: str) -> pl.DataFrame:
         """Get all trades for a specific session."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.execute("""
                 SELECT * FROM trades
                 WHERE session_id = ?
                 ORDER BY timestamp DESC
             """, (session_id,))
             
-            rows = cursor.fetchall()
-            if not rows:
-                return pl.DataFrame()
-            
-            # Convert to Polars DataFrame
-            data = {key: [row[key] for row in rows] for key in rows[0].keys()}
-            return pl.DataFrame(data)
+            return self._rows_to_frame(cursor)
     
     def compare_sessions(self, session_ids: List[str]) -> pl.DataFrame:
         """Compare performance across multiple sessions."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             placeholders = ','.join('?' * len(session_ids))
             cursor = conn.execute(f"""
                 SELECT 
@@ -444,30 +792,30 @@ class Database:
                     COALESCE(SUM(t.pnl), 0) as total_pnl,
                     COALESCE(AVG(t.pnl), 0) as avg_pnl,
                     SUM(CASE WHEN t.pnl > 0 THEN 1 ELSE 0 END) as winning_trades,
-                    SUM(CASE WHEN t.pnl < 0 THEN 1 ELSE 0 END) as losing_trades
+                    SUM(CASE WHEN t.pnl < 0 THEN 1 ELSE 0 END) as losing_trades,
+                    CAST(SUM(CASE WHEN t.pnl > 0 THEN 1 ELSE 0 END) AS REAL) / NULLIF(COUNT(t.id), 0) as win_rate
                 FROM sessions s
                 LEFT JOIN trades t ON s.session_id = t.session_id
                 WHERE s.session_id IN ({placeholders})
                 GROUP BY s.session_id
             """, session_ids)
             
-            rows = cursor.fetchall()
-            if not rows:
-                return pl.DataFrame()
-            
-            data = {key: [row[key] for row in rows] for key in rows[0].keys()}
-            df = pl.DataFrame(data)
-            
-            # Add win rate calculation
-            df = df.with_columns(
-                (pl.col("winning_trades") / pl.col("trade_count")).alias("win_rate")
-            )
-            
-            return df
+            return self._rows_to_frame(cursor)
     
     def get_active_sessions(self) -> List[Dict[str, Any]]:
-        """Get all active sessions."""
-        with self.get_connection() as conn:
+        """Get all active sessions.
+        
+        Results are reused for ACTIVE_SESSIONS_TTL seconds. Sessions created
+        or ended through this instance invalidate them immediately.
+        """
+        with self._sessions_lock:
+            cached = self._active_sessions
+            generation = self._sessions_generation
+        if cached is not None and time.monotonic() - cached[0] < self.ACTIVE_SESSIONS_TTL:
+            return [dict(session) for session in cached[1]]
+        
+        fetched_at = time.monotonic()
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.execute("""
                 SELECT session_id, name, started_at, is_live
                 FROM sessions
@@ -475,7 +823,41 @@ class Database:
                 ORDER BY started_at DESC
             """)
             
-            return [dict(row) for row in cursor.fetchall()]
+            sessions = [dict(row) for row in cursor.fetchall()]
+        
+        with self._sessions_lock:
+            # Don't cache a result that a concurrent create/end already made stale
+            if generation == self._sessions_generation:
+                self._active_sessions = (fetched_at, sessions)
+        return [dict(session) for session in sessions]
+    
+    # Async variants of the writers: SQLite I/O runs on a worker thread so
+    # callers on the event loop aren't blocked (the write lock still admits
+    # one writer at a time)
+    
+    async def asave_tickers(self, tickers: List) -> int:
+        """Async save_tickers."""
+        return await asyncio.to_thread(self.save_tickers, tickers)
+    
+    async def asave_candles(self, symbol: str, timeframe: str, candles: pl.DataFrame) -> int:
+        """Async save_candles."""
+        return await asyncio.to_thread(self.save_candles, symbol, timeframe, candles)
+    
+    async def asave_orderbook(self, orderbook, symbol: str) -> bool:
+        """Async save_orderbook."""
+        return await asyncio.to_thread(self.save_orderbook, orderbook, symbol)
+    
+    async def alog_trade(self, *args, **kwargs) -> bool:
+        """Async log_trade."""
+        return await asyncio.to_thread(self.log_trade, *args, **kwargs)
+    
+    async def alog_signal(self, *args, **kwargs):
+        """Async log_signal."""
+        return await asyncio.to_thread(self.log_signal, *args, **kwargs)
+    
+    async def alog_signals(self, signals: List[tuple]) -> int:
+        """Async log_signals."""
+        return await asyncio.to_thread(self.log_signals, signals)
 
 
 # Test the database
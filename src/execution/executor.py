@@ -1,12 +1,17 @@
 """Order execution implementations."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Optional, Dict, List, Sequence, Union
+import asyncio
 from loguru import logger
+import polars as pl
 
 from ..trading.models import Order, Fill, OrderSide, OrderType
-from ..data.sources.base import DataSource
+from ..data.sources.base import DataSource, PriceData
+
+# Enum members bound once for identity checks on the fill path
+_BUY = OrderSide.BUY
+_LIMIT = OrderType.LIMIT
 
 
 class Executor(ABC):
@@ -27,6 +32,18 @@ class Executor(ABC):
         """
         pass
 
+    async def execute_orders(self, orders: Sequence[Order]) -> List[Union[Fill, Exception]]:
+        """Execute a batch of orders concurrently.
+
+        Args:
+            orders: Orders to execute
+
+        Returns:
+            One entry per order, in order: its Fill, or the exception that
+            prevented it from being executed
+        """
+        return await asyncio.gather(*map(self.execute_order, orders), return_exceptions=True)
+
 
 class ExecutionError(Exception):
     """Exception raised when order execution fails."""
@@ -63,6 +80,15 @@ class MockExecutor(Executor):
         self.fill_rate = fill_rate
         self.use_bid_ask = use_bid_ask
 
+        # Slippage multipliers, precomputed for _calculate_fill_price
+        self._buy_slip = 1.0 + self.slippage_pct
+        self._sell_slip = 1.0 - self.slippage_pct
+
+        # Pick the fill-price variant once instead of checking use_bid_ask per order
+        self._calculate_fill_price = (
+            self._fill_price_from_quotes if use_bid_ask else self._fill_price_from_mid
+        )
+
         logger.info(
             f"MockExecutor initialized with {slippage_bps}bps slippage, "
             f"{fee_bps}bps fees, {fill_rate:.0%} fill rate"
@@ -83,49 +109,95 @@ class MockExecutor(Executor):
         try:
             # Get current price data
             price_data = await self.datasource.get_current_price(order.symbol)
+            return self._fill_order(order, price_data)
 
-            if not price_data:
-                raise ExecutionError(f"No price data available for {order.symbol}")
+        except Exception as e:
+            logger.error(f"Failed to execute order for {order.symbol}: {e}")
+            raise ExecutionError(f"Order execution failed: {e}")
 
-            # Determine fill price
-            fill_price = await self._calculate_fill_price(order, price_data.price, price_data.bid, price_data.ask)
+    async def execute_orders(self, orders: Sequence[Order]) -> List[Union[Fill, Exception]]:
+        """Execute a batch of mock orders against one price snapshot.
 
-            # Calculate executed size (may be partial)
-            executed_size = order.size * self.fill_rate
+        Prices for every symbol in the batch are fetched with a single
+        get_symbol_prices call instead of one lookup per order.
 
-            # Calculate fees
-            fees = executed_size * self.fee_pct
+        Args:
+            orders: Orders to execute
 
-            # Create fill
-            fill = Fill(
-                order=order,
-                executed_price=fill_price,
-                executed_size=executed_size,
-                fees=fees,
-                timestamp=datetime.now()
-            )
+        Returns:
+            One entry per order, in order: its simulated Fill, or the
+            ExecutionError that prevented it from being filled
+        """
+        if not orders:
+            return []
 
-            # Log execution
-            logger.debug(
-                f"Mock executed {order.side.value} order for {order.symbol}: "
-                f"${executed_size:.2f} @ ${fill_price:.2f} "
-                f"(slippage: ${fill.slippage:.2f}, fees: ${fees:.2f})"
-            )
+        try:
+            prices = await self.datasource.get_symbol_prices(list({order.symbol: None for order in orders}))
+        except Exception as e:
+            logger.error(f"Failed to fetch prices for order batch: {e}")
+            error = ExecutionError(f"Order execution failed: {e}")
+            return [error] * len(orders)
 
-            return fill
+        results: List[Union[Fill, Exception]] = []
+        for order in orders:
+            try:
+                results.append(self._fill_order(order, prices.get(order.symbol)))
+            except Exception as e:
+                results.append(ExecutionError(f"Order execution failed: {e}"))
+        return results
 
-        except Exception as e:
-            logger.error(f"Failed to execute order for {order.symbol}: {e}")
-            raise ExecutionError(f"Order execution failed: {e}")
+    def _fill_order(self, order: Order, price_data: Optional[PriceData]) -> Fill:
+        """Simulate the fill of an order at the given price.
+
+        Args:
+            order: Order to execute
+            price_data: Current price of the order's symbol
+
+        Returns:
+            Simulated fill
+
+        Raises:
+            ExecutionError: If price_data is missing
+        """
+        if not price_data:
+            raise ExecutionError(f"No price data available for {order.symbol}")
+
+        # Determine fill price
+        fill_price = self._calculate_fill_price(order, price_data.price, price_data.bid, price_data.ask)
+
+        # Calculate executed size (may be partial)
+        executed_size = order.size * self.fill_rate
+
+        # Calculate fees
+        fees = executed_size * self.fee_pct
+
+        # Create fill
+        fill = Fill(
+            order=order,
+            executed_price=fill_price,
+            executed_size=executed_size,
+            fees=fees,
+            timestamp=order.timestamp
+        )
+
+        # Log execution
+        logger.debug(
+            "Mock executed {} order for {}: ${:.2f} @ ${:.2f} (slippage: ${:.2f}, fees: ${:.2f})",
+            order.side.value, order.symbol, executed_size, fill_price, fill.slippage, fees
+        )
 
-    async def _calculate_fill_price(
+        return fill
+
+    def _fill_price_from_quotes(
         self,
         order: Order,
         mid_price: float,
         bid_price: Optional[float],
         ask_price: Optional[float]
     ) -> float:
-        """Calculate the fill price including slippage.
+        """Calculate the fill price including slippage, buying at ask and selling at bid.
+
+        Used as _calculate_fill_price when use_bid_ask is set.
 
         Args:
             order: Order being executed
@@ -136,34 +208,46 @@ class MockExecutor(Executor):
         Returns:
             Fill price including slippage
         """
-        # Start with mid price
-        base_price = mid_price
-
-        # Use bid/ask if available and enabled
-        if self.use_bid_ask and bid_price and ask_price:
-            if order.side == OrderSide.BUY:
-                # Buying at ask
-                base_price = ask_price
-            else:
-                # Selling at bid
-                base_price = bid_price
-
-        # Apply slippage
-        if order.side == OrderSide.BUY:
-            # Buying: price goes up (worse)
-            fill_price = base_price * (1 + self.slippage_pct)
+        # Use bid/ask if available, otherwise mid price
+        use_quote = bid_price and ask_price
+        limit_price = order.limit_price if order.order_type is _LIMIT else None
+
+        if order.side is _BUY:
+            # Buying at ask; slippage moves the price up (worse)
+            fill_price = (ask_price if use_quote else mid_price) * self._buy_slip
+            # Don't pay more than limit
+            if limit_price and limit_price < fill_price:
+                fill_price = limit_price
+        else:
+            # Selling at bid; slippage moves the price down (worse)
+            fill_price = (bid_price if use_quote else mid_price) * self._sell_slip
+            # Don't sell for less than limit
+            if limit_price and limit_price > fill_price:
+                fill_price = limit_price
+
+        return fill_price  # type: ignore[return-value]
+
+    def _fill_price_from_mid(
+        self,
+        order: Order,
+        mid_price: float,
+        bid_price: Optional[float],
+        ask_price: Optional[float]
+    ) -> float:
+        """Calculate the fill price including slippage from the mid price.
+
+        Used as _calculate_fill_price when use_bid_ask is off.
+        """
+        limit_price = order.limit_price if order.order_type is _LIMIT else None
+
+        if order.side is _BUY:
+            fill_price = mid_price * self._buy_slip
+            if limit_price and limit_price < fill_price:
+                fill_price = limit_price
         else:
-            # Selling: price goes down (worse)
-            fill_price = base_price * (1 - self.slippage_pct)
-
-        # Handle limit orders
-        if order.order_type == OrderType.LIMIT and order.limit_price:
-            if order.side == OrderSide.BUY:
-                # Don't pay more than limit
-                fill_price = min(fill_price, order.limit_price)
-            else:
-                # Don't sell for less than limit
-                fill_price = max(fill_price, order.limit_price)
+            fill_price = mid_price * self._sell_slip
+            if limit_price and limit_price > fill_price:
+                fill_price = limit_price
 
         return fill_price
 
@@ -183,7 +267,7 @@ class MockExecutor(Executor):
                 raise ValueError("No price data available")
 
             # Calculate expected fill price
-            expected_price = await self._calculate_fill_price(
+            expected_price = self._calculate_fill_price(
                 order,
                 price_data.price,
                 price_data.bid,
@@ -254,4 +338,84 @@ class BacktestExecutor(MockExecutor):
         if not hasattr(self.datasource, 'current_time'):
             logger.warning("BacktestExecutor used without BacktestDataSource")
 
-        return await super().execute_order(order)
\ No newline at end of file
+        return await super().execute_order(order)
+
+    async def execute_orders(self, orders: Sequence[Order]) -> List[Union[Fill, Exception]]:
+        """Execute a batch of orders using historical prices at current simulation time.
+
+        Args:
+            orders: Orders to execute
+
+        Returns:
+            One entry per order, in order: its Fill, or the ExecutionError
+            that prevented it from being filled
+        """
+        if not hasattr(self.datasource, 'current_time'):
+            logger.warning("BacktestExecutor used without BacktestDataSource")
+
+        return await super().execute_orders(orders)
+
+    def execute_many(self, orders: pl.DataFrame, prices: pl.DataFrame) -> pl.DataFrame:
+        """Fill a batch of orders at once with columnar expressions.
+
+        Applies the same pricing as execute_order (bid/ask or mid price,
+        slippage, limit caps, fill rate and fees) to every order.
+
+        Args:
+            orders: One row per order with columns symbol, side ('buy' or
+                'sell'), size, order_type ('market' or 'limit') and
+                limit_price. Orders are matched to prices on symbol, and
+                also on timestamp if both frames have that column.
+            prices: Price snapshot with columns symbol, price, bid and ask
+
+        Returns:
+            The orders with executed_price, executed_size and fees added
+
+        Raises:
+            ExecutionError: If an order has no matching price
+        """
+        keys = ['symbol', 'timestamp'] if 'timestamp' in orders.columns and 'timestamp' in prices.columns else ['symbol']
+        book = prices.select([*keys, 'price', 'bid', 'ask'])
+        fills = orders.join(book, on=keys, how='left')
+
+        missing = fills.filter(pl.col('price').is_null())
+        if missing.height:
+            symbols = ', '.join(missing['symbol'].unique().sort().to_list())
+            raise ExecutionError(f"No price data available for {symbols}")
+
+        is_buy = pl.col('side') == OrderSide.BUY.value
+        use_quote = (
+            pl.lit(self.use_bid_ask)
+            & pl.col('bid').fill_null(0.0).ne(0.0)
+            & pl.col('ask').fill_null(0.0).ne(0.0)
+        )
+        limit_price = (
+            pl.when((pl.col('order_type') == OrderType.LIMIT.value) & pl.col('limit_price').fill_null(0.0).ne(0.0))
+            .then(pl.col('limit_price'))
+            .otherwise(None)
+        )
+
+        base_price = (
+            pl.when(use_quote & is_buy).then(pl.col('ask'))
+            .when(use_quote).then(pl.col('bid'))
+            .otherwise(pl.col('price'))
+        )
+        slipped = base_price * pl.when(is_buy).then(self._buy_slip).otherwise(self._sell_slip)
+
+        # Buys are capped at the limit, sells floored at it
+        fill_price = (
+            pl.when(limit_price.is_null()).then(slipped)
+            .when(is_buy).then(pl.min_horizontal(slipped, limit_price))
+            .otherwise(pl.max_horizontal(slipped, limit_price))
+        )
+        executed_size = pl.col('size') * self.fill_rate
+
+        return (
+            fills
+            .with_columns(
+                fill_price.alias('executed_price'),
+                executed_size.alias('executed_size'),
+                (executed_size * self.fee_pct).alias('fees'),
+            )
+            .drop(['price', 'bid', 'ask'])
+        )
\ No newline at end of file
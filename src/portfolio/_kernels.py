@@ -0,0 +1,52 @@
+"""Numeric kernels behind PositionTable.
+
+Every kernel is compiled with numba when it is installed and runs as
+plain Python otherwise (see ``utils.jit``).
+"""
+
+import numpy as np
+
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _update_positions_pnl_loop(
+    entry: np.ndarray,
+    inv_entry: np.ndarray,
+    size: np.ndarray,
+    side_sign: np.ndarray,
+    price: np.ndarray,
+    out_pnl: np.ndarray
+) -> None:
+    """Write size * side_sign * (price - entry) * inv_entry into out_pnl, row by row."""
+    for i in range(len(out_pnl)):
+        out_pnl[i] = size[i] * (side_sign[i] * (price[i] - entry[i]) * inv_entry[i])
+
+
+def _update_positions_pnl_vectorized(
+    entry: np.ndarray,
+    inv_entry: np.ndarray,
+    size: np.ndarray,
+    side_sign: np.ndarray,
+    price: np.ndarray,
+    out_pnl: np.ndarray
+) -> None:
+    """NumPy equivalent of _update_positions_pnl_loop."""
+    np.subtract(price, entry, out=out_pnl)
+    out_pnl *= side_sign
+    out_pnl *= inv_entry
+    out_pnl *= size
+
+
+# The compiled loop makes one fused pass under numba; interpreted, the
+# ufunc chain avoids a per-row Python loop
+update_positions_pnl = _update_positions_pnl_loop if NUMBA_AVAILABLE else _update_positions_pnl_vectorized
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) every kernel with a tiny call.
+
+    Call before a time-critical loop so JIT latency isn't paid on its first iteration.
+    """
+    one = np.ones(1)
+    update_positions_pnl(one, one, one, one, one, np.zeros(1))
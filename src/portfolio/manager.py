@@ -3,9 +3,26 @@
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
+from operator import attrgetter
+import heapq
+import time
+import numpy as np
 from loguru import logger
 
-from ..trading.models import Signal, Order, Fill, Position, OrderSide, SignalType
+from ..trading.models import Signal, Order, Fill, Position, OrderSide, SignalType, Side
+from .positionTable import PositionTable
+
+# Enum members bound once for identity checks on the signal path
+_HOLD = SignalType.HOLD
+_BUY_SIGNAL = SignalType.BUY
+_SELL_SIGNAL = SignalType.SELL
+_BUY = OrderSide.BUY
+_SELL = OrderSide.SELL
+_LONG = Side.LONG
+_SHORT = Side.SHORT
+
+# Sort key for signals, built once (a C-level getter, not a per-call lambda)
+_by_strength = attrgetter('strength')
 
 
 @dataclass
@@ -31,6 +48,9 @@ class PortfolioStats:
 class PortfolioManager:
     """Manages portfolio positions, capital allocation, and risk."""
 
+    # Most recent equity curve points kept (older points are evicted)
+    EQUITY_CURVE_MAXLEN = 10000
+
     def __init__(
         self,
         initial_capital: float = 10000.0,
@@ -52,10 +72,27 @@ class PortfolioManager:
         self.max_positions = max_positions
         self.position_sizing = position_sizing
 
+        # Pick the sizing variant once instead of comparing position_sizing per signal
+        # ('volatility' and unknown methods fall back to equal sizing)
+        self._calculate_position_size = (
+            self._size_signal_strength if position_sizing == "signal_strength" else self._size_equal
+        )
+
         # Position tracking
         self.positions: Dict[str, Position] = {}  # symbol -> Position
         self.closed_positions: List[Position] = []
 
+        # Sum of open position values, recomputed only after fills or price updates
+        self._positions_value_cache = 0.0
+        self._positions_value_dirty = False
+
+        # Pricing state of open positions as parallel arrays (one row per
+        # position) so price updates and P&L sums are vectorized
+        self._reset_position_rows()
+
+        # Symbols of open positions, rebuilt only after a position opens or closes
+        self._held_symbols: Optional[Tuple[str, ...]] = ()
+
         # Strategy tracking
         self.registered_strategies: Set[str] = set()
         self.strategy_allocations: Dict[str, float] = {}  # strategy_id -> allocation %
@@ -64,7 +101,29 @@ class PortfolioManager:
         self.realized_pnl = 0.0
         self.fees_paid = 0.0
         self.trade_count = 0
-        self.equity_curve: List[Tuple[datetime, float]] = [(datetime.now(), initial_capital)]
+        self._reset_trade_tallies()
+        self._reset_equity_curve()
+
+    def _reset_position_rows(self) -> None:
+        """Clear the per-position pricing table."""
+        self._table = PositionTable(self.max_positions)
+        # Position objects lag behind the table until _sync_positions
+        self._positions_stale = False
+
+    def _sync_positions(self) -> None:
+        """Copy vectorized prices back into the Position objects."""
+        if self._positions_stale:
+            prices = self._table.current_price
+            for symbol, row in self._table.items():
+                self.positions[symbol].update_price(float(prices[row]))
+            self._positions_stale = False
+
+    def _reset_trade_tallies(self) -> None:
+        """Zero the running win/loss aggregates over closed positions."""
+        self._n_wins = 0
+        self._n_losses = 0
+        self._sum_wins = 0.0
+        self._sum_losses = 0.0
 
     def register_strategy(self, strategy_id: str, allocation: float = 1.0) -> None:
         """Register a strategy with the portfolio.
@@ -91,37 +150,55 @@ class PortfolioManager:
             List of orders to be executed
         """
         orders = []
-
-        # Sort signals by strength (strongest first)
-        sorted_signals = sorted(signals, key=lambda s: s.strength, reverse=True)
-
-        for signal in sorted_signals:
+        positions = self.positions
+        registered_strategies = self.registered_strategies
+
+        # Free position slots for entries (fills only land after this returns)
+        slots = self.max_positions - len(positions)
+
+        # One pass: drop unusable signals, split the rest into exits and entries.
+        # With no free slots, entry signals are only counted.
+        exit_candidates = []
+        entry_candidates = []
+        num_entries = 0
+        for signal in signals:
             # Skip if strategy not registered
-            if signal.strategy_id not in self.registered_strategies:
+            if signal.strategy_id not in registered_strategies:
                 logger.warning(f"Signal from unregistered strategy: {signal.strategy_id}")
                 continue
 
             # Skip HOLD signals
-            if signal.signal == SignalType.HOLD:
+            if signal.signal is _HOLD:
                 continue
 
-            # Check if we already have a position in this symbol
-            if signal.symbol in self.positions:
-                # Check if this is an exit signal for existing position
-                position = self.positions[signal.symbol]
-                if self._is_exit_signal(signal, position):
-                    order = self._create_exit_order(signal, position)
-                    if order:
-                        orders.append(order)
-                else:
-                    logger.debug(f"Already have position in {signal.symbol}, skipping signal")
-                continue
-
-            # Check if we can open new position
-            if len(self.positions) >= self.max_positions:
-                logger.warning(f"Maximum positions ({self.max_positions}) reached, skipping signal")
-                continue
+            if signal.symbol in positions:
+                exit_candidates.append(signal)
+            else:
+                num_entries += 1
+                if slots > 0:
+                    entry_candidates.append(signal)
+
+        # Exits for existing positions, strongest first
+        for signal in sorted(exit_candidates, key=_by_strength, reverse=True):
+            # Check if this is an exit signal for existing position
+            position = positions[signal.symbol]
+            if self._is_exit_signal(signal, position):
+                order = self._create_exit_order(signal, position)
+                if order:
+                    orders.append(order)
+            else:
+                logger.debug(f"Already have position in {signal.symbol}, skipping signal")
+
+        # Entries: only the strongest signals that fit in the free position slots
+        if num_entries > slots:
+            logger.warning(
+                f"Maximum positions ({self.max_positions}) reached, "
+                f"skipping {num_entries - max(slots, 0)} signal(s)"
+            )
+        if not entry_candidates:
+            return orders
 
+        for signal in heapq.nlargest(slots, entry_candidates, key=_by_strength):
             # Create entry order
             order = self._create_entry_order(signal)
             if order:
@@ -155,13 +232,14 @@ class PortfolioManager:
                 return None
 
         # Create order
-        order_side = OrderSide.BUY if signal.signal == SignalType.BUY else OrderSide.SELL
+        order_side = _BUY if signal.signal is _BUY_SIGNAL else _SELL
 
         order = Order(
             symbol=signal.symbol,
             side=order_side,
             size=position_size,
-            strategy_id=signal.strategy_id
+            strategy_id=signal.strategy_id,
+            timestamp=signal.timestamp
         )
 
         logger.debug(
@@ -182,13 +260,14 @@ class PortfolioManager:
             Exit order or None
         """
         # Determine order side (opposite of position)
-        order_side = OrderSide.SELL if position.side == "long" else OrderSide.BUY
+        order_side = _SELL if position.side is _LONG else _BUY
 
         order = Order(
             symbol=position.symbol,
             side=order_side,
             size=position.size,  # Exit full position
-            strategy_id=position.strategy_id
+            strategy_id=position.strategy_id,
+            timestamp=signal.timestamp
         )
 
         logger.debug(f"Creating exit order for {position.symbol} position")
@@ -206,17 +285,20 @@ class PortfolioManager:
             True if this is an exit signal
         """
         # Long position exits on SELL signal
-        if position.side == "long" and signal.signal == SignalType.SELL:
+        if position.side is _LONG and signal.signal is _SELL_SIGNAL:
             return True
 
         # Short position exits on BUY signal
-        if position.side == "short" and signal.signal == SignalType.BUY:
+        if position.side is _SHORT and signal.signal is _BUY_SIGNAL:
             return True
 
         return False
 
-    def _calculate_position_size(self, signal: Signal) -> float:
-        """Calculate position size based on signal and portfolio state.
+    def _size_equal(self, signal: Signal) -> float:
+        """Calculate an equal position size for every signal.
+
+        Used as _calculate_position_size for the 'equal' and (until it is
+        implemented) 'volatility' sizing methods.
 
         Args:
             signal: Trading signal
@@ -224,40 +306,24 @@ class PortfolioManager:
         Returns:
             Position size in dollars
         """
-        # Get total portfolio value
-        total_value = self.get_total_value()
-
-        # Base size as percentage of portfolio
-        base_size = total_value * self.max_position_size_pct
-
-        # Apply strategy allocation
-        if signal.strategy_id:
-            strategy_allocation = self.strategy_allocations.get(signal.strategy_id, 1.0)
-        else:
-            strategy_allocation = 1.0
-        base_size *= strategy_allocation
+        # Percentage of portfolio, scaled by the strategy allocation (never above the max size)
+        allocation = self.strategy_allocations.get(signal.strategy_id, 1.0) if signal.strategy_id else 1.0
+        return round(self.get_total_value() * self.max_position_size_pct * allocation, 2)
 
-        # Apply position sizing method
-        if self.position_sizing == "equal":
-            # Equal size for all positions
-            position_size = base_size
+    def _size_signal_strength(self, signal: Signal) -> float:
+        """Calculate a position size scaled by signal strength.
 
-        elif self.position_sizing == "signal_strength":
-            # Scale by signal strength
-            position_size = base_size * signal.strength
-
-        elif self.position_sizing == "volatility":
-            # TODO: Implement volatility-based sizing
-            position_size = base_size
-
-        else:
-            position_size = base_size
+        Used as _calculate_position_size for the 'signal_strength' sizing method.
 
-        # Ensure we don't exceed max position size
-        max_size = total_value * self.max_position_size_pct
-        position_size = min(position_size, max_size)
+        Args:
+            signal: Trading signal
 
-        return round(position_size, 2)
+        Returns:
+            Position size in dollars
+        """
+        # Strength is in [0, 1], so this never exceeds the equal (max) size
+        allocation = self.strategy_allocations.get(signal.strategy_id, 1.0) if signal.strategy_id else 1.0
+        return round(self.get_total_value() * self.max_position_size_pct * allocation * signal.strength, 2)
 
     def process_fill(self, fill: Fill) -> None:
         """Process an executed fill and update positions.
@@ -270,16 +336,27 @@ class PortfolioManager:
 
         # Check if this is closing an existing position
         if symbol in self.positions:
+            self._sync_positions()
             position = self.positions[symbol]
 
             # Close the position
-            realized_pnl = position.close(fill.executed_price, fill.fees)
+            realized_pnl = position.close(fill.executed_price, fill.fees, fill.timestamp)
             self.realized_pnl += realized_pnl
             self.fees_paid += fill.fees
 
+            # Running aggregates so get_stats never rescans closed_positions
+            if realized_pnl > 0:
+                self._n_wins += 1
+                self._sum_wins += realized_pnl
+            elif realized_pnl < 0:
+                self._n_losses += 1
+                self._sum_losses += realized_pnl
+
             # Move to closed positions
             self.closed_positions.append(position)
             del self.positions[symbol]
+            self._held_symbols = None
+            self._table.remove(symbol)
 
             # Update cash
             self.cash += fill.net_size + realized_pnl
@@ -291,7 +368,7 @@ class PortfolioManager:
 
         else:
             # Opening new position
-            position_side = "long" if order.side == OrderSide.BUY else "short"
+            position_side = _LONG if order.side is _BUY else _SHORT
 
             # Calculate quantity
             quantity = fill.executed_size / fill.executed_price
@@ -303,10 +380,13 @@ class PortfolioManager:
                 entry_price=fill.executed_price,
                 size=fill.executed_size,
                 quantity=quantity,
+                entry_time=fill.timestamp,
                 fees_paid=fill.fees
             )
 
             self.positions[symbol] = position
+            self._held_symbols = None
+            self._table.add(position)
             self.cash -= fill.executed_size + fill.fees
             self.fees_paid += fill.fees
 
@@ -316,6 +396,7 @@ class PortfolioManager:
             )
 
         self.trade_count += 1
+        self._positions_value_dirty = True
         self._update_equity_curve()
 
     def update_prices(self, prices: Dict[str, float]) -> None:
@@ -324,9 +405,9 @@ class PortfolioManager:
         Args:
             prices: Dict of symbol -> current price
         """
-        for symbol, position in self.positions.items():
-            if symbol in prices:
-                position.update_price(prices[symbol])
+        if self._table.set_prices(prices):
+            self._positions_stale = True
+            self._positions_value_dirty = True
 
     def get_position(self, symbol: str) -> Optional[Position]:
         """Get position for a specific symbol.
@@ -337,14 +418,26 @@ class PortfolioManager:
         Returns:
             Position or None if not found
         """
+        self._sync_positions()
         return self.positions.get(symbol)
 
+    def get_held_symbols(self) -> Tuple[str, ...]:
+        """Get the symbols of all open positions.
+
+        Returns:
+            Tuple of symbols (cached until a position opens or closes)
+        """
+        if self._held_symbols is None:
+            self._held_symbols = tuple(self.positions)
+        return self._held_symbols
+
     def get_all_positions(self) -> Dict[str, Position]:
         """Get all open positions.
 
         Returns:
             Dict of symbol -> Position
         """
+        self._sync_positions()
         return self.positions.copy()
 
     def get_strategy_positions(self, strategy_id: str) -> List[Position]:
@@ -356,6 +449,7 @@ class PortfolioManager:
         Returns:
             List of positions for the strategy
         """
+        self._sync_positions()
         return [
             pos for pos in self.positions.values()
             if pos.strategy_id == strategy_id
@@ -369,14 +463,24 @@ class PortfolioManager:
         """
         return self.cash
 
+    def get_positions_value(self) -> float:
+        """Get current market value of all open positions.
+
+        Returns:
+            Positions value
+        """
+        if self._positions_value_dirty:
+            self._positions_value_cache = self._table.total_value()
+            self._positions_value_dirty = False
+        return self._positions_value_cache
+
     def get_total_value(self) -> float:
         """Get total portfolio value (cash + positions).
 
         Returns:
             Total portfolio value
         """
-        positions_value = sum(pos.current_value for pos in self.positions.values())
-        return self.cash + positions_value
+        return self.cash + self.get_positions_value()
 
     def get_unrealized_pnl(self) -> float:
         """Get total unrealized P&L from open positions.
@@ -384,7 +488,7 @@ class PortfolioManager:
         Returns:
             Unrealized P&L
         """
-        return sum(pos.unrealized_pnl for pos in self.positions.values())
+        return self._table.total_unrealized_pnl()
 
     def get_stats(self) -> PortfolioStats:
         """Get comprehensive portfolio statistics.
@@ -392,24 +496,21 @@ class PortfolioManager:
         Returns:
             Portfolio statistics
         """
-        total_value = self.get_total_value()
-        positions_value = sum(pos.current_value for pos in self.positions.values())
+        positions_value = self.get_positions_value()
+        total_value = self.cash + positions_value
         unrealized_pnl = self.get_unrealized_pnl()
         total_pnl = self.realized_pnl + unrealized_pnl
 
         # Calculate win rate
-        winning_trades = sum(1 for pos in self.closed_positions if pos.realized_pnl > 0)
-        losing_trades = sum(1 for pos in self.closed_positions if pos.realized_pnl < 0)
+        winning_trades = self._n_wins
+        losing_trades = self._n_losses
         total_closed = len(self.closed_positions)
 
         win_rate = winning_trades / total_closed if total_closed > 0 else 0.0
 
         # Calculate average win/loss
-        wins = [pos.realized_pnl for pos in self.closed_positions if pos.realized_pnl > 0]
-        losses = [pos.realized_pnl for pos in self.closed_positions if pos.realized_pnl < 0]
-
-        avg_win = sum(wins) / len(wins) if wins else 0.0
-        avg_loss = sum(losses) / len(losses) if losses else 0.0
+        avg_win = self._sum_wins / winning_trades if winning_trades else 0.0
+        avg_loss = self._sum_losses / losing_trades if losing_trades else 0.0
 
         return PortfolioStats(
             total_value=total_value,
@@ -424,17 +525,92 @@ class PortfolioManager:
             losing_trades=losing_trades,
             win_rate=win_rate,
             avg_win=avg_win,
-            avg_loss=avg_loss
+            avg_loss=avg_loss,
+            sharpe_ratio=self.get_sharpe_ratio(),
+            max_drawdown=self.get_max_drawdown()
         )
 
+    def _reset_equity_curve(self) -> None:
+        """Start a new equity curve at the current cash balance."""
+        # Points are (monotonic ns, portfolio value); the live curve is
+        # [_eq_start, _eq_n), at most EQUITY_CURVE_MAXLEN points long.
+        # Adding _eq_epoch_offset turns a monotonic reading into epoch ns.
+        self._eq_epoch_offset = time.time_ns() - time.monotonic_ns()
+        self._eq_ts = np.empty(2 * self.EQUITY_CURVE_MAXLEN, dtype=np.int64)
+        self._eq_val = np.empty(2 * self.EQUITY_CURVE_MAXLEN, dtype=np.float64)
+        self._eq_ts[0] = time.monotonic_ns()
+        self._eq_val[0] = self.cash
+        self._eq_start = 0
+        self._eq_n = 1
+
     def _update_equity_curve(self) -> None:
         """Update the equity curve with current portfolio value."""
-        current_value = self.get_total_value()
-        self.equity_curve.append((datetime.now(), current_value))
+        n = self._eq_n
+        maxlen = self.EQUITY_CURVE_MAXLEN
+        if n == len(self._eq_val):
+            # Buffer full: move the live points to the front. This happens
+            # once every maxlen appends, so appends stay amortized O(1).
+            self._eq_ts[:maxlen] = self._eq_ts[n - maxlen:n]
+            self._eq_val[:maxlen] = self._eq_val[n - maxlen:n]
+            n = maxlen
+
+        self._eq_ts[n] = time.monotonic_ns()
+        self._eq_val[n] = self.get_total_value()
+        self._eq_n = n + 1
+        self._eq_start = max(0, n + 1 - maxlen)
+
+    def get_equity_curve(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the equity curve as arrays.
+
+        Returns:
+            (timestamps as datetime64[ns] UTC, portfolio values)
+        """
+        start, n = self._eq_start, self._eq_n
+        timestamps = (self._eq_ts[start:n] + self._eq_epoch_offset).astype("datetime64[ns]")
+        return timestamps, self._eq_val[start:n]
+
+    @property
+    def equity_curve(self) -> List[Tuple[datetime, float]]:
+        """Equity curve as (timestamp, portfolio value) pairs."""
+        timestamps, values = self.get_equity_curve()
+        return [
+            (datetime.fromtimestamp(ts / 1e9), value)
+            for ts, value in zip(timestamps.view(np.int64).tolist(), values.tolist())
+        ]
+
+    def get_max_drawdown(self) -> float:
+        """Get the largest peak-to-trough drop of the equity curve.
+
+        Returns:
+            Maximum drawdown as a fraction of the peak value (0-1)
+        """
+        values = self._eq_val[self._eq_start:self._eq_n]
+        running_max = np.maximum.accumulate(values)
+        drawdowns = np.divide(
+            running_max - values, running_max,
+            out=np.zeros_like(values), where=running_max > 0
+        )
+        return float(drawdowns.max())
+
+    def get_sharpe_ratio(self, periods_per_year: float = 1.0) -> float:
+        """Get the Sharpe ratio of returns between equity curve points.
+
+        Args:
+            periods_per_year: Equity points per year, used to annualize
+                (the default leaves the ratio per point)
+
+        Returns:
+            Sharpe ratio, or 0 with fewer than two returns or no variance
+        """
+        values = self._eq_val[self._eq_start:self._eq_n]
+        if len(values) < 3:
+            return 0.0
 
-        # Keep only last 10000 points to avoid memory issues
-        if len(self.equity_curve) > 10000:
-            self.equity_curve = self.equity_curve[-10000:]
+        returns = np.diff(values) / values[:-1]
+        std = returns.std()
+        if std == 0 or not np.isfinite(std):
+            return 0.0
+        return float(returns.mean() / std * np.sqrt(periods_per_year))
 
     def can_afford_order(self, order: Order) -> bool:
         """Check if we have enough capital for an order.
@@ -451,10 +627,15 @@ class PortfolioManager:
         """Reset portfolio to initial state."""
         self.cash = self.initial_capital
         self.positions.clear()
+        self._held_symbols = ()
         self.closed_positions.clear()
+        self._positions_value_cache = 0.0
+        self._positions_value_dirty = False
+        self._reset_position_rows()
         self.realized_pnl = 0.0
         self.fees_paid = 0.0
         self.trade_count = 0
-        self.equity_curve = [(datetime.now(), self.initial_capital)]
+        self._reset_trade_tallies()
+        self._reset_equity_curve()
 
         logger.debug("Portfolio reset to initial state")
\ No newline at end of file
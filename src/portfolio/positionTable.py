@@ -0,0 +1,122 @@
+"""Struct-of-arrays pricing state for open positions."""
+
+from typing import Dict, Iterator, List, Mapping, Tuple
+import numpy as np
+
+from ..trading.models import Position
+from ._kernels import update_positions_pnl
+
+
+class PositionTable:
+    """Open-position pricing columns as parallel NumPy float64 arrays.
+
+    Each open position owns one row. Free rows hold neutral values (zero
+    quantity and size, entry price 1) so column reductions can run over
+    the whole table without masking.
+    """
+
+    def __init__(self, capacity: int = 10):
+        """Initialize an empty table.
+
+        Args:
+            capacity: Initial number of rows (doubled when full)
+        """
+        capacity = max(capacity, 1)
+        self.rows: Dict[str, int] = {}  # symbol -> row index
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self.quantity = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.entry_price = np.ones(capacity)
+        self.inv_entry = np.ones(capacity)  # 1 / entry_price
+        self.current_price = np.zeros(capacity)
+        self.side_sign = np.zeros(capacity)  # +1 long, -1 short
+        self.unrealized_pnl = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, position: Position) -> None:
+        """Give a newly opened position a row.
+
+        Args:
+            position: Open position
+        """
+        if not self._free:
+            self._grow()
+
+        row = self._free.pop()
+        self.rows[position.symbol] = row
+        self.quantity[row] = position.quantity
+        self.size[row] = position.size
+        self.entry_price[row] = position.entry_price
+        self.inv_entry[row] = position.inv_entry
+        self.current_price[row] = position.current_price
+        self.side_sign[row] = position.side_sign
+        self.unrealized_pnl[row] = position.unrealized_pnl
+
+    def remove(self, symbol: str) -> None:
+        """Free the row of a closed position.
+
+        Args:
+            symbol: Trading symbol
+        """
+        row = self.rows.pop(symbol)
+        self.quantity[row] = 0.0
+        self.size[row] = 0.0
+        self.entry_price[row] = 1.0
+        self.inv_entry[row] = 1.0
+        self.current_price[row] = 0.0
+        self.side_sign[row] = 0.0
+        self.unrealized_pnl[row] = 0.0
+        self._free.append(row)
+
+    def set_prices(self, prices: Mapping[str, float]) -> bool:
+        """Mark positions to market and recompute their unrealized P&L.
+
+        Args:
+            prices: Symbol -> current price (symbols without a row are ignored)
+
+        Returns:
+            True if any row was updated
+        """
+        rows = self.rows
+        held = [symbol for symbol in prices if symbol in rows]
+        if not held:
+            return False
+
+        self.current_price[[rows[symbol] for symbol in held]] = [prices[symbol] for symbol in held]
+
+        # Same formula as Position.update_price, in place over every row
+        update_positions_pnl(
+            self.entry_price, self.inv_entry, self.size, self.side_sign, self.current_price, self.unrealized_pnl
+        )
+        return True
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """Iterate over (symbol, row) pairs."""
+        return iter(self.rows.items())
+
+    def total_value(self) -> float:
+        """Get the summed market value of all positions."""
+        return float(np.dot(self.quantity, self.current_price))
+
+    def total_unrealized_pnl(self) -> float:
+        """Get the summed unrealized P&L of all positions."""
+        return float(self.unrealized_pnl.sum())
+
+    def pnl_percentage(self) -> np.ndarray:
+        """Get unrealized P&L as a percentage of size for every row (0 on free rows)."""
+        size = self.size
+        return np.divide(self.unrealized_pnl * 100, size, out=np.zeros_like(size), where=size != 0)
+
+    def _grow(self) -> None:
+        """Double every column."""
+        n = len(self.quantity)
+        self.quantity = np.concatenate([self.quantity, np.zeros(n)])
+        self.size = np.concatenate([self.size, np.zeros(n)])
+        self.entry_price = np.concatenate([self.entry_price, np.ones(n)])
+        self.inv_entry = np.concatenate([self.inv_entry, np.ones(n)])
+        self.current_price = np.concatenate([self.current_price, np.zeros(n)])
+        self.side_sign = np.concatenate([self.side_sign, np.zeros(n)])
+        self.unrealized_pnl = np.concatenate([self.unrealized_pnl, np.zeros(n)])
+        self._free = list(range(2 * n - 1, n - 1, -1))
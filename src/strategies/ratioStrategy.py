@@ -3,15 +3,76 @@
 This strategy works with both live and backtest data sources.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime
 from enum import Enum
 from loguru import logger
+import math
 import numpy as np
 
 from .baseStrategy import BaseStrategy
 from ..trading.models import Signal, SignalType
 from ..data.sources.base import DataSource
+from ..utils.jit import njit
+
+
+@njit(cache=True)
+def _ratio_zscore(window: np.ndarray, current_ratio: float) -> Tuple[float, float, float]:
+    """Compute (mean, std, z-score) of current_ratio against a window of ratios."""
+    mean = window.mean()
+    std = window.std()
+
+    if std == 0.0:
+        return mean, std, 0.0
+
+    return mean, std, (current_ratio - mean) / std
+
+
+# Pair state codes used by _pairs_decide (see PairState)
+_NEUTRAL = 0
+_LONG_B_SHORT_A = 1
+_LONG_A_SHORT_B = 2
+
+# Actions returned by _pairs_decide
+_NO_OP = 0
+_ENTER = 1
+_EXIT = 2
+
+
+@njit(cache=True)
+def _pairs_decide(
+    window_sum: float,
+    window_sum2: float,
+    n: int,
+    shift: float,
+    current_ratio: float,
+    entry_threshold: float,
+    exit_threshold: float,
+    state: int
+) -> Tuple[int, float, float, float, int]:
+    """Z-score current_ratio against the rolling window and step the pair state machine.
+
+    window_sum and window_sum2 are the sum and sum of squares of the n
+    window ratios, each taken minus shift.
+
+    Returns:
+        (action, z-score, mean, std, new state). The z-score is 0 when std is 0.
+    """
+    mean_shifted = window_sum / n
+    var = window_sum2 / n - mean_shifted * mean_shifted
+    std = math.sqrt(var) if var > 0.0 else 0.0
+    mean = mean_shifted + shift
+    z_score = (current_ratio - mean) / std if std != 0.0 else 0.0
+
+    if state == _NEUTRAL:
+        if z_score > entry_threshold:
+            return _ENTER, z_score, mean, std, _LONG_B_SHORT_A
+        if z_score < -entry_threshold:
+            return _ENTER, z_score, mean, std, _LONG_A_SHORT_B
+    elif abs(z_score) < exit_threshold:
+        return _EXIT, z_score, mean, std, _NEUTRAL
+
+    return _NO_OP, z_score, mean, std, state
 
 
 class PairState(Enum):
@@ -21,9 +82,23 @@ class PairState(Enum):
     LONG_A_SHORT_B = "long_a_short_b"  # When symbol_b is expensive (low z-score)
 
 
+# PairState <-> _pairs_decide state code
+_STATE_CODES = {
+    PairState.NEUTRAL: _NEUTRAL,
+    PairState.LONG_B_SHORT_A: _LONG_B_SHORT_A,
+    PairState.LONG_A_SHORT_B: _LONG_A_SHORT_B,
+}
+_STATES = {code: state for state, code in _STATE_CODES.items()}
+
+
 class RatioStrategy(BaseStrategy):
     """Ratio strategy that works with any DataSource."""
 
+    # Ratio points fetched per tick once the rolling window is warm
+    UPDATE_FETCH_SIZE = 8
+    # Ticks between full window refetches (also clears floating-point drift)
+    REFILL_INTERVAL = 256
+
     def __init__(
         self,
         datasource: DataSource,
@@ -52,45 +127,127 @@ class RatioStrategy(BaseStrategy):
         # State machine for pairs trading
         self.state = PairState.NEUTRAL
 
+        # Rolling window of the last lookback_periods ratios, stored as
+        # (ratio - _shift) with running sums so mean/std update in O(1)
+        self._ring = np.zeros(lookback_periods, dtype=np.float64)
+        self._ring_filled = 0
+        self._ring_idx = 0
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum2 = 0.0
+        self._last_ratio_ts: Optional[datetime] = None
+        self._updates_since_refill = 0
+
     async def get_current_prices(self) -> Tuple[Optional[float], Optional[float]]:
         """Get current prices for symbol_a and symbol_b from datasource."""
-        symbol_a_data = await self.datasource.get_current_price(self.symbol_a)
-        symbol_b_data = await self.datasource.get_current_price(self.symbol_b)
+        # One batched lookup (a single query on LiveDataSource) instead of two awaits
+        prices = await self.datasource.get_symbol_prices([self.symbol_a, self.symbol_b])
+        symbol_a_data = prices.get(self.symbol_a)
+        symbol_b_data = prices.get(self.symbol_b)
 
         symbol_a_price = symbol_a_data.price if symbol_a_data else None
         symbol_b_price = symbol_b_data.price if symbol_b_data else None
 
         return symbol_a_price, symbol_b_price
 
-    async def get_ratio_history(self) -> List[float]:
-        """Get historical ratios from datasource."""
+    async def _fetch_ratio_history(self, limit: int) -> List[Tuple[datetime, float]]:
+        """Get up to limit (timestamp, ratio) points from datasource, oldest first."""
         try:
-            # Get price ratio history using datasource method
             ratio_data = await self.datasource.get_price_ratio_history(
                 self.symbol_a,
                 self.symbol_b,
-                limit=self.lookback_periods * 2  # Get extra for safety
+                limit=limit
             )
+        except Exception as e:
+            logger.error(f"Error getting ratio history: {e}")
+            return []
+
+        if not ratio_data:
+            logger.debug(f"No ratio history available for {self.symbol_a}/{self.symbol_b}")
+            return []
+
+        return ratio_data
+
+    async def get_ratio_history(self) -> np.ndarray:
+        """Get the last lookback_periods historical ratios from datasource as a float64 array."""
+        # Get extra for safety
+        ratio_data = await self._fetch_ratio_history(self.lookback_periods * 2)
+
+        # Extract just the ratio values
+        ratios = np.fromiter((ratio for timestamp, ratio in ratio_data), dtype=np.float64, count=len(ratio_data))
+
+        return ratios[-self.lookback_periods:]
+
+    def _refill_window(self, ratio_data: List[Tuple[datetime, float]]) -> None:
+        """Rebuild the rolling window from the newest lookback_periods points."""
+        recent = ratio_data[-self.lookback_periods:]
+        ratios = np.fromiter((ratio for timestamp, ratio in recent), dtype=np.float64, count=len(recent))
+        n = len(ratios)
+
+        # Sums are taken around the newest ratio to keep them well conditioned
+        self._shift = float(ratios[-1]) if n else 0.0
+        self._ring[:n] = ratios - self._shift
+        self._ring_filled = n
+        self._ring_idx = n % self.lookback_periods
+        self._sum = float(self._ring[:n].sum())
+        self._sum2 = float(np.dot(self._ring[:n], self._ring[:n]))
+        self._last_ratio_ts = ratio_data[-1][0] if ratio_data else None
+        self._updates_since_refill = 0
+
+    def _push_ratio(self, ratio: float) -> None:
+        """Add a ratio to the rolling window, evicting the oldest once full."""
+        x = ratio - self._shift
+        idx = self._ring_idx
+
+        if self._ring_filled == self.lookback_periods:
+            old = self._ring[idx]
+            self._sum -= old
+            self._sum2 -= old * old
+        else:
+            self._ring_filled += 1
+
+        self._ring[idx] = x
+        self._sum += x
+        self._sum2 += x * x
+        self._ring_idx = (idx + 1) % self.lookback_periods
+
+    async def _update_ratio_window(self) -> int:
+        """Bring the rolling window up to date with the datasource.
+
+        Once warm, only the last few ratio points are fetched and the new
+        ones pushed. The window is refetched in full on cold start, every
+        REFILL_INTERVAL ticks, or when points may have been missed.
 
+        Returns:
+            Number of ratios in the window
+        """
+        last_ts = self._last_ratio_ts
+        if last_ts is not None and self._updates_since_refill < self.REFILL_INTERVAL:
+            ratio_data = await self._fetch_ratio_history(self.UPDATE_FETCH_SIZE)
             if not ratio_data:
-                logger.debug(f"No ratio history available for {self.symbol_a}/{self.symbol_b}")
-                return []
+                self._last_ratio_ts = None
+                return 0
 
-            # Extract just the ratio values
-            ratios = [ratio for timestamp, ratio in ratio_data]
+            new_points = [(ts, ratio) for ts, ratio in ratio_data if ts > last_ts]
 
-            return ratios[-self.lookback_periods:] if ratios else []
+            # A gap wider than the fetch, or time moving backwards, needs a refill
+            if len(new_points) < len(ratio_data) and ratio_data[-1][0] >= last_ts:
+                for ts, ratio in new_points:
+                    self._push_ratio(ratio)
+                if new_points:
+                    self._last_ratio_ts = new_points[-1][0]
+                self._updates_since_refill += 1
+                return self._ring_filled
 
-        except Exception as e:
-            logger.error(f"Error getting ratio history: {e}")
-            return []
+        self._refill_window(await self._fetch_ratio_history(self.lookback_periods * 2))
+        return self._ring_filled
 
-    def calculate_z_score(self, current_ratio: float, historical_ratios: List[float]) -> float:
+    def calculate_z_score(self, current_ratio: float, historical_ratios: Union[np.ndarray, List[float]]) -> float:
         """Calculate z-score from ratio data.
 
         Args:
             current_ratio: Current symbol_a/symbol_b ratio
-            historical_ratios: List of historical ratios
+            historical_ratios: Historical ratios (a float64 array is used without copying)
 
         Returns:
             Z-score of current ratio
@@ -98,15 +255,12 @@ class RatioStrategy(BaseStrategy):
         if len(historical_ratios) < self.lookback_periods:
             return 0.0
 
-        recent_ratios = historical_ratios[-self.lookback_periods:]
-        mean = np.mean(recent_ratios)
-        std = np.std(recent_ratios)
+        recent_ratios = np.asarray(historical_ratios[-self.lookback_periods:], dtype=np.float64)
+        mean, std, z_score = _ratio_zscore(recent_ratios, current_ratio)
 
         if std == 0:
             return 0.0
 
-        z_score = (current_ratio - mean) / std
-
         # Update internal state
         self.current_ratio = current_ratio
         self.ratio_mean = mean
@@ -142,14 +296,14 @@ class RatioStrategy(BaseStrategy):
                 signal=SignalType.BUY,
                 strength=strength,
                 price=symbol_b_price,
-                reason=f"Pairs entry: Z-score {z_score:.2f} > {self.entry_threshold} ({self.symbol_b} undervalued)"
+                reason=("Pairs entry: Z-score {:.2f} > {} ({} undervalued)", (z_score, self.entry_threshold, self.symbol_b))
             ))
             signals.append(Signal(
                 symbol=self.symbol_a,
                 signal=SignalType.SELL,
                 strength=strength,
                 price=symbol_a_price,
-                reason=f"Pairs entry: Z-score {z_score:.2f} > {self.entry_threshold} ({self.symbol_a} overvalued)"
+                reason=("Pairs entry: Z-score {:.2f} > {} ({} overvalued)", (z_score, self.entry_threshold, self.symbol_a))
             ))
             self.state = PairState.LONG_B_SHORT_A
 
@@ -161,14 +315,14 @@ class RatioStrategy(BaseStrategy):
                 signal=SignalType.BUY,
                 strength=strength,
                 price=symbol_a_price,
-                reason=f"Pairs entry: Z-score {z_score:.2f} < -{self.entry_threshold} ({self.symbol_a} undervalued)"
+                reason=("Pairs entry: Z-score {:.2f} < -{} ({} undervalued)", (z_score, self.entry_threshold, self.symbol_a))
             ))
             signals.append(Signal(
                 symbol=self.symbol_b,
                 signal=SignalType.SELL,
                 strength=strength,
                 price=symbol_b_price,
-                reason=f"Pairs entry: Z-score {z_score:.2f} < -{self.entry_threshold} ({self.symbol_b} overvalued)"
+                reason=("Pairs entry: Z-score {:.2f} < -{} ({} overvalued)", (z_score, self.entry_threshold, self.symbol_b))
             ))
             self.state = PairState.LONG_A_SHORT_B
 
@@ -201,14 +355,14 @@ class RatioStrategy(BaseStrategy):
                     signal=SignalType.SELL,
                     strength=0.8,
                     price=symbol_b_price,
-                    reason=f"Pairs exit: Z-score normalized to {z_score:.2f}"
+                    reason=("Pairs exit: Z-score normalized to {:.2f}", (z_score,))
                 ))
                 signals.append(Signal(
                     symbol=self.symbol_a,
                     signal=SignalType.BUY,
                     strength=0.8,
                     price=symbol_a_price,
-                    reason=f"Pairs exit: Z-score normalized to {z_score:.2f}"
+                    reason=("Pairs exit: Z-score normalized to {:.2f}", (z_score,))
                 ))
                 self.state = PairState.NEUTRAL
 
@@ -219,14 +373,14 @@ class RatioStrategy(BaseStrategy):
                     signal=SignalType.SELL,
                     strength=0.8,
                     price=symbol_a_price,
-                    reason=f"Pairs exit: Z-score normalized to {z_score:.2f}"
+                    reason=("Pairs exit: Z-score normalized to {:.2f}", (z_score,))
                 ))
                 signals.append(Signal(
                     symbol=self.symbol_b,
                     signal=SignalType.BUY,
                     strength=0.8,
                     price=symbol_b_price,
-                    reason=f"Pairs exit: Z-score normalized to {z_score:.2f}"
+                    reason=("Pairs exit: Z-score normalized to {:.2f}", (z_score,))
                 ))
                 self.state = PairState.NEUTRAL
 
@@ -253,37 +407,49 @@ class RatioStrategy(BaseStrategy):
 
             current_ratio = symbol_a_price / symbol_b_price
 
-            # Get historical ratios and calculate z-score
-            historical_ratios = await self.get_ratio_history()
+            # Update the rolling ratio window and calculate z-score
+            n_ratios = await self._update_ratio_window()
 
-            if len(historical_ratios) < self.lookback_periods:
-                logger.debug(f"Insufficient history: {len(historical_ratios)}/{self.lookback_periods}")
+            if n_ratios < self.lookback_periods:
+                logger.debug("Insufficient history: {}/{}", n_ratios, self.lookback_periods)
                 return []
 
-            z_score = self.calculate_z_score(current_ratio, historical_ratios)
+            # Z-score and state transition in one compiled step
+            action, z_score, mean, std, new_state = _pairs_decide(
+                self._sum,
+                self._sum2,
+                self.lookback_periods,
+                self._shift,
+                current_ratio,
+                self.entry_threshold,
+                self.exit_threshold,
+                _STATE_CODES[self.state]
+            )
+
+            if std != 0:
+                # Update internal state
+                self.current_ratio = current_ratio
+                self.ratio_mean = mean
+                self.ratio_std = std
+                self.z_score = z_score
 
             # Log current state
+            # Arguments are only formatted if a DEBUG handler will emit the message
             logger.debug(
-                f"Pairs Trading [{self.state.value}] - Ratio: {current_ratio:.2f} "
-                f"(mean: {self.ratio_mean:.2f}, std: {self.ratio_std:.2f}, z-score: {z_score:.2f})"
+                "Pairs Trading [{}] - Ratio: {:.2f} (mean: {:.2f}, std: {:.2f}, z-score: {:.2f})",
+                self.state.value, current_ratio, self.ratio_mean, self.ratio_std, z_score
             )
 
-            # Clean flow logic:
-            # 1. If in position: check exit conditions
-            if self.state in [PairState.LONG_B_SHORT_A, PairState.LONG_A_SHORT_B]:
-                if abs(z_score) < self.exit_threshold:
-                    signals = self.generate_exit_signals(z_score, symbol_a_price, symbol_b_price)
-                    if signals:
-                        logger.debug(f"Closing pairs trade: {self.state.value} → {PairState.NEUTRAL.value}")
-                    return signals
-
-            # 2. If neutral: check entry conditions
-            elif self.state == PairState.NEUTRAL:
-                if abs(z_score) > self.entry_threshold:
-                    signals = self.generate_entry_signals(z_score, symbol_a_price, symbol_b_price)
-                    if signals:
-                        logger.debug(f"Opening pairs trade: {PairState.NEUTRAL.value} → {self.state.value}")
-                    return signals
+            # Clean flow logic (Signal objects are only built on a transition):
+            # 1. If in position and the z-score normalized: exit
+            if action == _EXIT:
+                logger.debug(f"Closing pairs trade: {self.state.value} → {_STATES[new_state].value}")
+                return self.generate_exit_signals(z_score, symbol_a_price, symbol_b_price)
+
+            # 2. If neutral and the z-score is extreme: enter
+            if action == _ENTER:
+                logger.debug(f"Opening pairs trade: {self.state.value} → {_STATES[new_state].value}")
+                return self.generate_entry_signals(z_score, symbol_a_price, symbol_b_price)
 
             # 3. No action needed
             return []
@@ -1,5 +1,5 @@
 """Trading components for portfolio management and execution."""
 
-from .models import Order, Fill, Position, Signal
+from .models import Order, Fill, Position, Signal, Side
 
-__all__ = ['Order', 'Fill', 'Position', 'Signal']
\ No newline at end of file
+__all__ = ['Order', 'Fill', 'Position', 'Signal', 'Side']
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Data models for trading system."""
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+import sys
 from datetime import datetime
-from typing import Optional, Literal
-from enum import Enum
+from typing import Any, Mapping, Optional, Tuple, Union
+from enum import Enum, IntEnum
 
 
 class OrderSide(Enum):
@@ -18,6 +19,18 @@ class OrderType(Enum):
     LIMIT = "limit"
 
 
+class Side(IntEnum):
+    """Position side; the value is the sign applied to price moves."""
+    LONG = 1
+    SHORT = -1
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
 class SignalType(Enum):
     """Trading signal type."""
     BUY = "BUY"
@@ -25,24 +38,47 @@ class SignalType(Enum):
     HOLD = "HOLD"
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
-    """Trading signal from a strategy."""
+    """Trading signal from a strategy.
+
+    reason may be given as a (format string, args) pair. It is formatted
+    the first time signal.reason is read, which is always a str.
+    """
     symbol: str
     signal: SignalType
     strength: float  # 0-1 confidence/strength
     price: float
-    reason: str
+    reason: InitVar[Union[str, Tuple[str, tuple]]]  # Read back through the reason property
     strategy_id: Optional[str] = None  # Will be set by TradingSession
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None  # Will be set by TradingSession (iteration time)
+    _reason: Union[str, Tuple[str, tuple]] = field(init=False, repr=False)
 
-    def __post_init__(self):
-        """Validate signal strength is in valid range."""
-        if not 0 <= self.strength <= 1:
-            raise ValueError(f"Signal strength must be between 0 and 1, got {self.strength}")
+    def __post_init__(self, reason: Union[str, Tuple[str, tuple]]):
+        """Validate signal strength is in valid range (skipped under python -O)."""
+        if __debug__:
+            if not 0 <= self.strength <= 1:
+                raise ValueError(f"Signal strength must be between 0 and 1, got {self.strength}")
 
+        # Interned so symbol-keyed dict lookups compare by identity
+        self.symbol = sys.intern(self.symbol)
+        self._reason = reason
 
-@dataclass
+    def _get_reason(self) -> str:
+        """Get the reason text, formatting a deferred (format string, args) reason once."""
+        reason = self._reason
+        if isinstance(reason, tuple):
+            template, args = reason
+            reason = self._reason = template.format(*args)
+        return reason
+
+
+# Set after the class is built, so the dataclass doesn't take the property
+# as the default of the reason InitVar
+Signal.reason = property(Signal._get_reason)  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
 class Order:
     """Order to be executed."""
     symbol: str
@@ -51,50 +87,78 @@ class Order:
     order_type: OrderType = OrderType.MARKET
     strategy_id: Optional[str] = None
     limit_price: Optional[float] = None  # For limit orders
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None  # Time of the originating signal
 
     def __post_init__(self):
-        """Validate order parameters."""
-        if self.size <= 0:
-            raise ValueError(f"Order size must be positive, got {self.size}")
+        """Validate order parameters (checks are skipped under python -O)."""
+        if __debug__:
+            if self.size <= 0:
+                raise ValueError(f"Order size must be positive, got {self.size}")
 
-        if self.order_type == OrderType.LIMIT and self.limit_price is None:
-            raise ValueError("Limit orders require a limit_price")
+            # Strings are converted by from_dict, not here
+            if not isinstance(self.side, OrderSide):
+                raise TypeError(f"Order side must be an OrderSide, got {self.side!r} (use Order.from_dict)")
 
-        # Convert string to enum if needed
-        if isinstance(self.side, str):
-            self.side = OrderSide(self.side)
-        if isinstance(self.order_type, str):
-            self.order_type = OrderType(self.order_type)
+            if not isinstance(self.order_type, OrderType):
+                raise TypeError(
+                    f"Order type must be an OrderType, got {self.order_type!r} (use Order.from_dict)"
+                )
 
+            if self.order_type is OrderType.LIMIT and self.limit_price is None:
+                raise ValueError("Limit orders require a limit_price")
 
-@dataclass
+        # Interned so symbol-keyed dict lookups compare by identity
+        self.symbol = sys.intern(self.symbol)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Order":
+        """Build an order from user-facing input.
+
+        Orders created internally pass enum members directly; this is the
+        one place that converts string sides and order types.
+
+        Args:
+            data: Order fields; side ('buy' / 'sell') and order_type
+                ('market' / 'limit') may be given as strings
+
+        Returns:
+            Order
+        """
+        fields = dict(data)
+        if isinstance(fields.get('side'), str):
+            fields['side'] = OrderSide(fields['side'])
+        if isinstance(fields.get('order_type'), str):
+            fields['order_type'] = OrderType(fields['order_type'])
+        return cls(**fields)
+
+
+@dataclass(slots=True)
 class Fill:
     """Executed order fill details."""
     order: Order
     executed_price: float
     executed_size: float  # Dollar amount actually filled
     fees: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None  # Time of the order
     slippage: float = 0.0  # Price difference from expected
 
     def __post_init__(self):
-        """Validate fill parameters."""
-        if self.executed_price <= 0:
-            raise ValueError(f"Executed price must be positive, got {self.executed_price}")
+        """Validate fill parameters (checks are skipped under python -O)."""
+        if __debug__:
+            if self.executed_price <= 0:
+                raise ValueError(f"Executed price must be positive, got {self.executed_price}")
 
-        if self.executed_size < 0:
-            raise ValueError(f"Executed size cannot be negative, got {self.executed_size}")
+            if self.executed_size < 0:
+                raise ValueError(f"Executed size cannot be negative, got {self.executed_size}")
 
-        if self.fees < 0:
-            raise ValueError(f"Fees cannot be negative, got {self.fees}")
+            if self.fees < 0:
+                raise ValueError(f"Fees cannot be negative, got {self.fees}")
 
-        # Calculate slippage if we have a limit price
+        # Calculate slippage if we have a limit price (paying up on a BUY,
+        # or selling below the limit, is positive slippage)
         if self.order.limit_price:
-            if self.order.side == OrderSide.BUY:
-                self.slippage = self.executed_price - self.order.limit_price
-            else:  # SELL
-                self.slippage = self.order.limit_price - self.executed_price
+            sign = 1.0 if self.order.side is OrderSide.BUY else -1.0
+            self.slippage = sign * (self.executed_price - self.order.limit_price)
 
     @property
     def net_size(self) -> float:
@@ -109,25 +173,32 @@ class Fill:
         return self.executed_size / self.order.size
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Track an open position."""
     symbol: str
     strategy_id: str
-    side: Literal["long", "short"]
+    side: Side  # "long" / "short" strings are accepted and converted
     entry_price: float
     size: float  # Dollar amount
     quantity: float  # Number of units (size / entry_price)
     current_price: float = 0.0
     unrealized_pnl: float = 0.0
     realized_pnl: float = 0.0
-    entry_time: datetime = field(default_factory=datetime.now)
+    entry_time: Optional[datetime] = None  # Time of the opening fill
     exit_time: Optional[datetime] = None
     exit_price: Optional[float] = None
     fees_paid: float = 0.0
+    side_sign: float = field(default=1.0, init=False, repr=False)  # float(side)
+    inv_entry: float = field(default=0.0, init=False, repr=False)  # 1 / entry_price
 
     def __post_init__(self):
-        """Initialize quantity if not set."""
+        """Normalize side and initialize quantity if not set."""
+        if isinstance(self.side, str):
+            self.side = Side[self.side.upper()]
+        self.side_sign = float(self.side)
+        self.inv_entry = 1.0 / self.entry_price if self.entry_price > 0 else 0.0
+
         if self.quantity == 0 and self.entry_price > 0:
             self.quantity = self.size / self.entry_price
 
@@ -144,12 +215,8 @@ class Position:
         """
         self.current_price = current_price
 
-        if self.side == "long":
-            # Long: profit when price goes up
-            price_change = (current_price - self.entry_price) / self.entry_price
-        else:  # short
-            # Short: profit when price goes down
-            price_change = (self.entry_price - current_price) / self.entry_price
+        # Long profits when price goes up, short when it goes down
+        price_change = self.side_sign * (current_price - self.entry_price) * self.inv_entry
 
         self.unrealized_pnl = self.size * price_change
 
@@ -162,25 +229,23 @@ class Position:
         Returns:
             Realized profit/loss
         """
-        if self.side == "long":
-            price_change = (exit_price - self.entry_price) / self.entry_price
-        else:  # short
-            price_change = (self.entry_price - exit_price) / self.entry_price
+        price_change = self.side_sign * (exit_price - self.entry_price) * self.inv_entry
 
         return self.size * price_change - self.fees_paid
 
-    def close(self, exit_price: float, fees: float = 0.0) -> float:
+    def close(self, exit_price: float, fees: float = 0.0, exit_time: Optional[datetime] = None) -> float:
         """Close the position and calculate final P&L.
 
         Args:
             exit_price: Price at which position is closed
             fees: Trading fees for the exit
+            exit_time: Time of the closing fill (defaults to now)
 
         Returns:
             Final realized P&L
         """
         self.exit_price = exit_price
-        self.exit_time = datetime.now()
+        self.exit_time = exit_time or datetime.now()
         self.fees_paid += fees
         self.realized_pnl = self.calculate_pnl(exit_price)
         self.unrealized_pnl = 0.0
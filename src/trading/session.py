@@ -1,12 +1,14 @@
 """Trading session orchestrator."""
 
 import asyncio
+import time
 from typing import Dict, List, Optional, Type, Any
 from datetime import datetime, timedelta
 from loguru import logger
 
 from ..strategies.baseStrategy import BaseStrategy
 from ..portfolio.manager import PortfolioManager, PortfolioStats
+from ..portfolio import _kernels as portfolio_kernels
 from ..execution.executor import Executor, MockExecutor, BacktestExecutor
 from ..data.sources.base import DataSource
 from ..data.sources.backtest import BacktestDataSource
@@ -16,6 +18,10 @@ from ..trading.models import Signal
 class TradingSession:
     """Orchestrates trading strategies, portfolio management, and execution."""
 
+    # Minimum seconds between progress bar redraws in quiet backtests
+    PROGRESS_INTERVAL = 0.1
+    PROGRESS_BAR_LENGTH = 30
+
     def __init__(
         self,
         datasource: DataSource,
@@ -35,6 +41,12 @@ class TradingSession:
         self.datasource = datasource
         self.portfolio = PortfolioManager(initial_capital=capital)
 
+        # The datasource again if it is a backtest one (None otherwise), so the
+        # loop checks for None instead of calling isinstance every iteration
+        self._backtest: Optional[BacktestDataSource] = (
+            datasource if isinstance(datasource, BacktestDataSource) else None
+        )
+
         # Create executor
         executor_params = executor_params or {}
         self.executor = self._create_executor(executor_type, executor_params)
@@ -47,6 +59,8 @@ class TradingSession:
         self.iteration_count = 0
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        self._run_started = 0.0  # time.perf_counter() when run() began
+        self._last_progress_draw = 0.0  # time.perf_counter() of the last progress bar redraw
         self.quiet_mode = quiet_mode
 
         logger.info(
@@ -129,20 +143,33 @@ class TradingSession:
 
         self.is_running = True
         self.start_time = start_time or datetime.now()
+        self._run_started = time.perf_counter()
         self.end_time = end_time
         self.iteration_count = 0
 
+        # Pay numba compile/cache-load latency before the first iteration
+        portfolio_kernels.warm_up()
+
         # Setup backtest datasource if needed
-        if isinstance(self.datasource, BacktestDataSource):
+        backtest = self._backtest
+        if backtest is not None:
             if start_time:
-                self.datasource.set_current_time(start_time)
+                backtest.set_current_time(start_time)
             logger.info(f"Starting backtest from {start_time} to {end_time}")
-
-        logger.info("=" * 60)
-        logger.info("TRADING SESSION STARTED")
-        logger.info(f"Strategies: {list(self.strategies.keys())}")
-        logger.info(f"Capital: ${self.portfolio.initial_capital:,.2f}")
-        logger.info("=" * 60)
+            advance_time = backtest.advance_time
+            advance_minutes = int(interval_seconds / 60)
+        else:
+            # Live ticks are scheduled at start + n * interval so that
+            # iteration work time doesn't accumulate as drift
+            next_tick = self._run_started
+
+        logger.info("\n".join([
+            "=" * 60,
+            "TRADING SESSION STARTED",
+            f"Strategies: {list(self.strategies.keys())}",
+            f"Capital: ${self.portfolio.initial_capital:,.2f}",
+            "=" * 60,
+        ]))
 
         try:
             while self.is_running:
@@ -152,8 +179,8 @@ class TradingSession:
                     break
 
                 # Check end time for backtesting
-                if isinstance(self.datasource, BacktestDataSource):
-                    if end_time and self.datasource.current_time and self.datasource.current_time >= end_time:
+                if backtest is not None:
+                    if end_time and backtest.current_time and backtest.current_time >= end_time:
                         logger.info(f"Reached backtest end time: {end_time}")
                         break
 
@@ -161,12 +188,19 @@ class TradingSession:
                 await self._run_iteration()
 
                 # Advance time for backtesting
-                if isinstance(self.datasource, BacktestDataSource):
-                    self.datasource.advance_time(int(interval_seconds / 60))
+                if backtest is not None:
+                    advance_time(advance_minutes)
 
-                # Sleep for live/paper trading
+                # Sleep until the next tick for live/paper trading
                 else:
-                    await asyncio.sleep(interval_seconds)
+                    next_tick += interval_seconds
+                    sleep_time = next_tick - time.perf_counter()
+
+                    if sleep_time > 0:
+                        await asyncio.sleep(sleep_time)
+                    else:
+                        # Overran the interval; restart the schedule instead of bursting to catch up
+                        next_tick = time.perf_counter()
 
                 self.iteration_count += 1
 
@@ -179,20 +213,24 @@ class TradingSession:
 
         finally:
             self.is_running = False
+            if self._backtest is not None and self.quiet_mode:
+                self._show_progress(final=True)
             self._print_final_stats()
 
     async def _run_iteration(self) -> None:
         """Run a single iteration of the trading loop."""
-        timestamp = datetime.now()
-
         # For backtesting, use simulated time
-        if isinstance(self.datasource, BacktestDataSource) and self.datasource.current_time:
-            timestamp = self.datasource.current_time
+        backtest = self._backtest
+        if backtest is not None and backtest.current_time:
+            timestamp = backtest.current_time
+        else:
+            timestamp = datetime.now()
 
-        logger.debug(f"\n--- Iteration {self.iteration_count + 1} [{timestamp.strftime('%Y-%m-%d %H:%M:%S')}] ---")
+        # Arguments (and the strftime) are only formatted if a DEBUG handler will emit the message
+        logger.debug("\n--- Iteration {} [{:%Y-%m-%d %H:%M:%S}] ---", self.iteration_count + 1, timestamp)
 
-        # 1. Collect signals from all strategies
-        signals = await self._collect_signals()
+        # 1. Collect signals from all strategies (orders and fills inherit the timestamp)
+        signals = await self._collect_signals(timestamp)
 
         if signals and not self.quiet_mode:
             logger.info(f"Collected {len(signals)} signals from strategies")
@@ -203,51 +241,61 @@ class TradingSession:
         if orders and not self.quiet_mode:
             logger.info(f"Generated {len(orders)} orders from signals")
 
-        # 3. Execute orders
-        for order in orders:
-            try:
-                fill = await self.executor.execute_order(order)
-                self.portfolio.process_fill(fill)
+        # 3. Execute orders as one batch
+        if orders:
+            results = await self.executor.execute_orders(orders)
+            for order, result in zip(orders, results):
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    self.portfolio.process_fill(result)
 
-            except Exception as e:
-                logger.error(f"Failed to execute order for {order.symbol}: {e}")
+                except Exception as e:
+                    logger.error(f"Failed to execute order for {order.symbol}: {e}")
 
         # 4. Update portfolio prices
         await self._update_portfolio_prices()
 
         # 5. Show progress and log portfolio status
-        if isinstance(self.datasource, BacktestDataSource) and self.quiet_mode:
+        if backtest is not None and self.quiet_mode:
             self._show_progress()
         elif self.iteration_count % 10 == 0:
             self._log_portfolio_status()
 
-    async def _collect_signals(self) -> List[Signal]:
+    async def _collect_signals(self, timestamp: datetime) -> List[Signal]:
         """Collect signals from all strategies.
 
+        Args:
+            timestamp: Iteration time (simulated time when backtesting) stamped on each signal
+
         Returns:
             List of signals
         """
         signals = []
 
-        for strategy_name, strategy in self.strategies.items():
-            try:
-                # Get signals from strategy (now returns List[Signal])
-                strategy_signals = await strategy.calculate_signal()
+        # Strategies run concurrently; a failing one doesn't affect the others
+        results = await asyncio.gather(
+            *(strategy.calculate_signal() for strategy in self.strategies.values()),
+            return_exceptions=True
+        )
 
-                if strategy_signals:
-                    for signal in strategy_signals:
-                        # Ensure signal has strategy ID
-                        signal.strategy_id = strategy_name
-                        signals.append(signal)
+        for strategy_name, strategy_signals in zip(self.strategies, results):
+            if isinstance(strategy_signals, BaseException):
+                logger.error(f"Error getting signal from {strategy_name}: {strategy_signals}")
+                continue
 
-                        if not self.quiet_mode:
-                            logger.debug(
-                                f"Signal from {strategy_name}: {signal.signal.value} "
-                                f"{signal.symbol} (strength: {signal.strength:.2f})"
-                            )
+            if strategy_signals:
+                for signal in strategy_signals:
+                    # Ensure signal has strategy ID
+                    signal.strategy_id = strategy_name
+                    signal.timestamp = timestamp
+                    signals.append(signal)
 
-            except Exception as e:
-                logger.error(f"Error getting signal from {strategy_name}: {e}")
+                    if not self.quiet_mode:
+                        logger.debug(
+                            "Signal from {}: {} {} (strength: {:.2f})",
+                            strategy_name, signal.signal.value, signal.symbol, signal.strength
+                        )
 
         return signals
 
@@ -256,67 +304,78 @@ class TradingSession:
         if not self.portfolio.positions:
             return
 
-        prices = {}
-        for symbol in self.portfolio.positions.keys():
-            try:
-                price_data = await self.datasource.get_current_price(symbol)
-                if price_data:
-                    prices[symbol] = price_data.price
+        # One batched lookup for every held symbol (concurrent, or a single query on live data)
+        symbols = self.portfolio.get_held_symbols()
+        try:
+            price_data = await self.datasource.get_symbol_prices(symbols)
+        except Exception as e:
+            logger.error(f"Failed to get prices for {', '.join(symbols)}: {e}")
+            return
 
-            except Exception as e:
-                logger.error(f"Failed to get price for {symbol}: {e}")
+        prices = {symbol: data.price for symbol, data in price_data.items() if data}
 
         if prices:
             self.portfolio.update_prices(prices)
 
-    def _show_progress(self) -> None:
-        """Show progress indicator for backtesting in quiet mode."""
-        if not isinstance(self.datasource, BacktestDataSource):
+    def _show_progress(self, final: bool = False) -> None:
+        """Show progress indicator for backtesting in quiet mode.
+
+        Redraws at most every PROGRESS_INTERVAL seconds.
+
+        Args:
+            final: Draw regardless of the interval and end the line
+        """
+        backtest = self._backtest
+        if backtest is None:
             return
 
-        # Show progress every 50 iterations
-        if self.iteration_count % 50 == 0:
-            progress = self.datasource.get_progress()
-            if progress is not None:
-                # Create progress bar
-                bar_length = 30
-                filled_length = int(bar_length * progress / 100)
-                bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        now = time.perf_counter()
+        if not final and now - self._last_progress_draw < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress_draw = now
 
-                # Get current stats for display
-                stats = self.portfolio.get_stats()
-                pnl_pct = ((stats.total_value - self.portfolio.initial_capital) / self.portfolio.initial_capital) * 100
+        progress = backtest.get_progress()
+        if progress is None:
+            return
+
+        # Create progress bar
+        filled_length = int(self.PROGRESS_BAR_LENGTH * progress / 100)
+        bar = '█' * filled_length + '░' * (self.PROGRESS_BAR_LENGTH - filled_length)
 
-                print(f"\rProgress: |{bar}| {progress:.1f}% | Trades: {stats.num_trades} | P&L: {pnl_pct:+.1f}%", end='', flush=True)
+        # Get current stats for display
+        stats = self.portfolio.get_stats()
+        pnl_pct = ((stats.total_value - self.portfolio.initial_capital) / self.portfolio.initial_capital) * 100
 
-        # Final newline when complete
-        if self.iteration_count > 0 and hasattr(self.datasource, 'get_progress'):
-            progress = self.datasource.get_progress()
-            if progress and progress >= 99.9:
-                print()  # New line after progress bar
+        # The bar redraws in place with \r, so it has to be flushed (no newline until the end)
+        print(
+            f"\rProgress: |{bar}| {progress:.1f}% | Trades: {stats.num_trades} | P&L: {pnl_pct:+.1f}%",
+            end='\n' if final else '',
+            flush=True
+        )
 
     def _log_portfolio_status(self) -> None:
         """Log current portfolio status."""
         stats = self.portfolio.get_stats()
 
-        logger.info("📊 Portfolio Status:")
-        logger.info(f"  Total Value: ${stats.total_value:,.2f}")
-        logger.info(f"  Cash: ${stats.cash:,.2f}")
-        logger.info(f"  Positions: {stats.num_positions}")
+        lines = ["📊 Portfolio Status:"]
+        lines.append(f"  Total Value: ${stats.total_value:,.2f}")
+        lines.append(f"  Cash: ${stats.cash:,.2f}")
+        lines.append(f"  Positions: {stats.num_positions}")
 
         if stats.total_pnl != 0:
             pnl_pct = (stats.total_pnl / self.portfolio.initial_capital) * 100
             pnl_emoji = "🟢" if stats.total_pnl > 0 else "🔴"
-            logger.info(f"  {pnl_emoji} Total P&L: ${stats.total_pnl:+,.2f} ({pnl_pct:+.2f}%)")
+            lines.append(f"  {pnl_emoji} Total P&L: ${stats.total_pnl:+,.2f} ({pnl_pct:+.2f}%)")
 
         if stats.num_trades > 0:
-            logger.info(f"  Win Rate: {stats.win_rate:.1%} ({stats.winning_trades}/{stats.num_trades})")
+            lines.append(f"  Win Rate: {stats.win_rate:.1%} ({stats.winning_trades}/{stats.num_trades})")
+
+        logger.info("\n".join(lines))
 
     def _print_final_stats(self) -> None:
         """Print final session statistics."""
-        logger.info("\n" + "=" * 60)
-        logger.info("TRADING SESSION COMPLETED")
-        logger.info("=" * 60)
+        # Built up and logged as one message rather than one call per line
+        lines = ["\n" + "=" * 60, "TRADING SESSION COMPLETED", "=" * 60]
 
         stats = self.portfolio.get_stats()
 
@@ -324,42 +383,42 @@ class TradingSession:
         total_return = ((stats.total_value - self.portfolio.initial_capital) /
                        self.portfolio.initial_capital) * 100
 
-        logger.info(f"Initial Capital: ${self.portfolio.initial_capital:,.2f}")
-        logger.info(f"Final Value: ${stats.total_value:,.2f}")
-        logger.info(f"Total Return: {total_return:+.2f}%")
+        lines.append(f"Initial Capital: ${self.portfolio.initial_capital:,.2f}")
+        lines.append(f"Final Value: ${stats.total_value:,.2f}")
+        lines.append(f"Total Return: {total_return:+.2f}%")
 
         # Trading summary
-        logger.info(f"\nTrading Summary:")
-        logger.info(f"  Total Trades: {stats.num_trades}")
-        logger.info(f"  Winning Trades: {stats.winning_trades}")
-        logger.info(f"  Losing Trades: {stats.losing_trades}")
+        lines.append(f"\nTrading Summary:")
+        lines.append(f"  Total Trades: {stats.num_trades}")
+        lines.append(f"  Winning Trades: {stats.winning_trades}")
+        lines.append(f"  Losing Trades: {stats.losing_trades}")
 
         if stats.num_trades > 0:
-            logger.info(f"  Win Rate: {stats.win_rate:.1%}")
+            lines.append(f"  Win Rate: {stats.win_rate:.1%}")
             if stats.avg_win != 0:
-                logger.info(f"  Avg Win: ${stats.avg_win:+,.2f}")
+                lines.append(f"  Avg Win: ${stats.avg_win:+,.2f}")
             if stats.avg_loss != 0:
-                logger.info(f"  Avg Loss: ${stats.avg_loss:+,.2f}")
+                lines.append(f"  Avg Loss: ${stats.avg_loss:+,.2f}")
 
         # P&L breakdown
-        logger.info(f"\nP&L Breakdown:")
-        logger.info(f"  Realized P&L: ${stats.realized_pnl:+,.2f}")
-        logger.info(f"  Unrealized P&L: ${stats.unrealized_pnl:+,.2f}")
-        logger.info(f"  Total P&L: ${stats.total_pnl:+,.2f}")
-        logger.info(f"  Total Fees Paid: ${self.portfolio.fees_paid:+,.2f}")
+        lines.append(f"\nP&L Breakdown:")
+        lines.append(f"  Realized P&L: ${stats.realized_pnl:+,.2f}")
+        lines.append(f"  Unrealized P&L: ${stats.unrealized_pnl:+,.2f}")
+        lines.append(f"  Total P&L: ${stats.total_pnl:+,.2f}")
+        lines.append(f"  Total Fees Paid: ${self.portfolio.fees_paid:+,.2f}")
 
         # Debug calculation
-        logger.info(f"\nDebug Calculation:")
-        logger.info(f"  Cash: ${stats.cash:+,.2f}")
-        logger.info(f"  Positions Value: ${stats.positions_value:+,.2f}")
-        logger.info(f"  Total Value: ${stats.total_value:+,.2f}")
-        logger.info(f"  Initial Capital: ${self.portfolio.initial_capital:+,.2f}")
-        logger.info(f"  Actual Gain: ${stats.total_value - self.portfolio.initial_capital:+,.2f}")
-        logger.info(f"  P&L + Fees: ${stats.total_pnl - self.portfolio.fees_paid:+,.2f}")
+        lines.append(f"\nDebug Calculation:")
+        lines.append(f"  Cash: ${stats.cash:+,.2f}")
+        lines.append(f"  Positions Value: ${stats.positions_value:+,.2f}")
+        lines.append(f"  Total Value: ${stats.total_value:+,.2f}")
+        lines.append(f"  Initial Capital: ${self.portfolio.initial_capital:+,.2f}")
+        lines.append(f"  Actual Gain: ${stats.total_value - self.portfolio.initial_capital:+,.2f}")
+        lines.append(f"  P&L + Fees: ${stats.total_pnl - self.portfolio.fees_paid:+,.2f}")
 
         # Strategy Performance Breakdown
         if len(self.strategies) > 1:
-            logger.info(f"\nStrategy Performance Breakdown:")
+            lines.append(f"\nStrategy Performance Breakdown:")
             for strategy_name in self.strategies.keys():
                 strategy_positions = self.portfolio.get_strategy_positions(strategy_name)
                 closed_positions = [pos for pos in self.portfolio.closed_positions if pos.strategy_id == strategy_name]
@@ -378,33 +437,35 @@ class TradingSession:
                 allocation = self.portfolio.strategy_allocations.get(strategy_name, 1.0)
                 allocated_capital = self.portfolio.initial_capital * allocation
 
-                logger.info(f"  {strategy_name}:")
-                logger.info(f"    Allocation: ${allocated_capital:,.2f} ({allocation:.0%})")
-                logger.info(f"    Total P&L: ${strategy_total_pnl:+,.2f}")
-                logger.info(f"    Return: {(strategy_total_pnl / allocated_capital) * 100:+.2f}%")
-                logger.info(f"    Trades: {strategy_trades}")
+                lines.append(f"  {strategy_name}:")
+                lines.append(f"    Allocation: ${allocated_capital:,.2f} ({allocation:.0%})")
+                lines.append(f"    Total P&L: ${strategy_total_pnl:+,.2f}")
+                lines.append(f"    Return: {(strategy_total_pnl / allocated_capital) * 100:+.2f}%")
+                lines.append(f"    Trades: {strategy_trades}")
                 if strategy_trades > 0:
-                    logger.info(f"    Win Rate: {win_rate:.1%}")
-                logger.info(f"    Open Positions: {len(strategy_positions)}")
+                    lines.append(f"    Win Rate: {win_rate:.1%}")
+                lines.append(f"    Open Positions: {len(strategy_positions)}")
 
         # Open positions
         if stats.num_positions > 0:
-            logger.info(f"\nOpen Positions: {stats.num_positions}")
+            lines.append(f"\nOpen Positions: {stats.num_positions}")
             for symbol, position in self.portfolio.get_all_positions().items():
-                logger.info(f"  {symbol}: ${position.size:.2f} @ ${position.entry_price:.2f} (Strategy: {position.strategy_id})")
+                lines.append(f"  {symbol}: ${position.size:.2f} @ ${position.entry_price:.2f} (Strategy: {position.strategy_id})")
 
         # Session info
         runtime = self.iteration_count
         if self.start_time:
-            if isinstance(self.datasource, BacktestDataSource):
+            if self._backtest is not None:
                 runtime = f"{self.iteration_count} iterations"
             else:
-                elapsed = datetime.now() - self.start_time
-                runtime = f"{elapsed.total_seconds() / 60:.1f} minutes"
+                elapsed = time.perf_counter() - self._run_started
+                runtime = f"{elapsed / 60:.1f} minutes"
+
+        lines.append(f"\nSession Info:")
+        lines.append(f"  Iterations: {self.iteration_count}")
+        lines.append(f"  Runtime: {runtime}")
 
-        logger.info(f"\nSession Info:")
-        logger.info(f"  Iterations: {self.iteration_count}")
-        logger.info(f"  Runtime: {runtime}")
+        logger.info("\n".join(lines))
 
     def get_performance_stats(self) -> PortfolioStats:
         """Get current performance statistics.
@@ -427,7 +488,7 @@ class TradingSession:
         self.end_time = None
 
         # Reset backtest datasource if applicable
-        if isinstance(self.datasource, BacktestDataSource):
-            self.datasource.reset()
+        if self._backtest is not None:
+            self._backtest.reset()
 
         logger.info("Session reset to initial state")
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Download historical data from exchanges to backfill database."""
 
-import ccxt
+import asyncio
+import ccxt.async_support as ccxt_async
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain, repeat
 from loguru import logger
-import time
-from typing import List, Optional
+import numpy as np
+from typing import List
+import sqlite3
 import sys
 
 from src.data.clients.Binance.binanceClient import BinanceClient
@@ -18,18 +22,140 @@ logger.add(
     format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
 )
 
+# Candles are loaded into unindexed temp staging tables, then merged into
+# prices / candles with one INSERT ... SELECT per save. Timestamps are staged
+# as raw epoch milliseconds and rendered by SQLite as the same local-time
+# 'YYYY-MM-DD HH:MM:SS' text the collectors store.
+STAGING_PRICES = """
+    CREATE TEMP TABLE IF NOT EXISTS staging_prices
+    (symbol TEXT, ts_ms INTEGER, bid REAL, ask REAL, last REAL, volume_24h REAL)
+"""
+
+STAGING_CANDLES = """
+    CREATE TEMP TABLE IF NOT EXISTS staging_candles
+    (symbol TEXT, timeframe TEXT, ts_ms INTEGER, open REAL, high REAL, low REAL, close REAL, volume REAL)
+"""
+
+# Upserts in staging order, so a later duplicate wins as with INSERT OR
+# REPLACE, but conflicting rows are updated in place rather than deleted
+# and reinserted (WHERE true keeps the ON CONFLICT clause unambiguous)
+PRICE_MERGE = """
+    INSERT INTO prices (symbol, timestamp, bid, ask, last, volume_24h)
+    SELECT symbol, datetime(ts_ms / 1000, 'unixepoch', 'localtime'), bid, ask, last, volume_24h
+    FROM staging_prices WHERE true ORDER BY rowid
+    ON CONFLICT (symbol, timestamp) DO UPDATE SET
+        bid = excluded.bid, ask = excluded.ask, last = excluded.last, volume_24h = excluded.volume_24h
+"""
+
+CANDLE_MERGE = """
+    INSERT INTO candles (symbol, timeframe, timestamp, open, high, low, close, volume)
+    SELECT symbol, timeframe, datetime(ts_ms / 1000, 'unixepoch', 'localtime'), open, high, low, close, volume
+    FROM staging_candles WHERE true ORDER BY rowid
+    ON CONFLICT (symbol, timeframe, timestamp) DO UPDATE SET
+        open = excluded.open, high = excluded.high, low = excluded.low,
+        close = excluded.close, volume = excluded.volume
+"""
+
+# Bound parameters allowed per statement by SQLite builds older than 3.32
+MAX_SQL_PARAMS = 999
+
+
+@lru_cache(maxsize=None)
+def _chunk_insert(insert: str, chunk: int) -> str:
+    """Build the chunk-row version of a single-row INSERT ... VALUES (...) statement.
+
+    Cached, so the SQL text is built once and sqlite3's per-connection
+    statement cache keeps finding the same prepared statement.
+    """
+    head, values = insert.rsplit("VALUES", 1)
+    return f"{head}VALUES {', '.join([values.strip()] * chunk)}"
+
+
+@lru_cache(maxsize=None)
+def _staging_insert(staging: str, n_cols: int) -> str:
+    """Build the single-row INSERT statement of a staging table."""
+    return f"INSERT INTO {staging} VALUES ({', '.join('?' * n_cols)})"
+
+
+def _insert_rows(conn: sqlite3.Connection, insert: str, rows: List[tuple]) -> None:
+    """Insert rows using multi-row VALUES statements.
+
+    Rows go in chunks of as many as fit in MAX_SQL_PARAMS, so each
+    statement execution inserts hundreds of rows instead of one. Rows
+    left over after the last full chunk use the single-row statement.
+
+    Args:
+        conn: Connection inside a write transaction
+        insert: Single-row INSERT ... VALUES (?, ...) statement
+        rows: Parameter tuples, all of the same length
+    """
+    if not rows:
+        return
+    
+    chunk = MAX_SQL_PARAMS // len(rows[0])
+    full = len(rows) - len(rows) % chunk
+    if full:
+        conn.executemany(_chunk_insert(insert, chunk), (
+            list(chain.from_iterable(rows[start:start + chunk]))
+            for start in range(0, full, chunk)
+        ))
+    conn.executemany(insert, rows[full:])
+
+
+def _merge_rows(conn: sqlite3.Connection, staging: str, merge: str, rows: List[tuple]) -> None:
+    """Stage rows in a temp table, merge them into their table, then empty it.
+
+    Args:
+        conn: Connection inside a write transaction
+        staging: Name of the staging table (columns in row order)
+        merge: INSERT ... SELECT statement reading the staging table
+        rows: Parameter tuples, all of the same length
+    """
+    if not rows:
+        return
+    
+    try:
+        _insert_rows(conn, _staging_insert(staging, len(rows[0])), rows)
+        conn.execute(merge)
+    finally:
+        conn.execute(f"DELETE FROM {staging}")
+
 
 class HistoricalDataDownloader:
     """Download historical OHLCV data from exchanges."""
     
+    # Candles requested per fetch_ohlcv call (most exchanges allow 500-1000)
+    BATCH_LIMIT = 500
+    
+    # fetch_ohlcv calls in flight at once, across all symbols. ccxt's rate
+    # limiter still spaces the requests; this bounds how many overlap.
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Retries of a fetch_ohlcv call that failed with a network error, waiting
+    # RETRY_DELAY seconds before the first and doubling after each
+    MAX_RETRIES = 3
+    RETRY_DELAY = 1.0
+    
+    # Tables written by the backfill. Their secondary (non-UNIQUE) indexes
+    # are dropped during download_multiple_symbols and rebuilt once at the end.
+    BACKFILL_TABLES = ('prices', 'candles')
+    
     def __init__(self, exchange_name: str = "binanceus", db_path: str = "data/trading.db"):
-        self.exchange = getattr(ccxt, exchange_name)({
+        self.exchange = getattr(ccxt_async, exchange_name)({
             'enableRateLimit': True,
             'options': {'defaultType': 'spot'}
         })
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         self.db = Database(db_path)
+    
+    async def close(self):
+        """Close the exchange client's HTTP session and the database."""
+        try:
+            await self.exchange.close()
+        finally:
+            await asyncio.to_thread(self.db.close)
         
-    def download_ohlcv(
+    async def download_ohlcv(
         self,
         symbol: str,
         timeframe: str = '1h',
@@ -38,6 +164,86 @@ class HistoricalDataDownloader:
     ) -> List:
         """Download historical OHLCV data."""
         
+        all_candles = await self._fetch_ohlcv(symbol, timeframe, days_back)
+        
+        if save_to_db and all_candles:
+            await asyncio.to_thread(self.save_candles_to_db, symbol, timeframe, all_candles)
+        
+        return all_candles
+    
+    async def _fetch_ohlcv(self, symbol: str, timeframe: str, days_back: int) -> List:
+        """Fetch days_back days of candles for a symbol.
+        
+        The range is split up front into BATCH_LIMIT-candle windows that
+        are all requested concurrently, then merged back in order.
+        
+        Raises:
+            Exception: The first window error, once every window has finished
+        """
+        
+        windows = await self._windows(symbol, timeframe, days_back)
+        batches = await self._gather_windows(symbol, (
+            self._fetch_window(symbol, timeframe, start, start + windows.step) for start in windows
+        ))
+        all_candles = list(chain.from_iterable(batches))
+        
+        logger.success(f"Downloaded {len(all_candles)} total candles for {symbol}")
+        
+        return all_candles
+    
+    async def _backfill_ohlcv(self, symbol: str, timeframe: str, days_back: int) -> int:
+        """Download and save days_back days of candles for a symbol.
+        
+        Like download_ohlcv, but each window is saved as soon as it arrives
+        and then dropped, so only the windows in flight are held in memory
+        rather than the whole range.
+        
+        Returns:
+            Number of candles downloaded
+        
+        Raises:
+            Exception: The first window error, once every window has
+                finished. Windows that succeeded stay saved, and the next run
+                resumes from the first gap (see _resume_from).
+        """
+        
+        windows = await self._windows(symbol, timeframe, days_back)
+        counts = await self._gather_windows(symbol, (
+            self._backfill_window(symbol, timeframe, start, start + windows.step) for start in windows
+        ))
+        total = sum(counts)
+        
+        logger.success(f"Downloaded and saved {total} total candles for {symbol}")
+        
+        return total
+    
+    async def _backfill_window(self, symbol: str, timeframe: str, start: int, end: int) -> int:
+        """Fetch and save one window of candles. Returns the number fetched."""
+        candles = await self._fetch_window(symbol, timeframe, start, end)
+        if candles:
+            await asyncio.to_thread(self._save_candles, symbol, timeframe, candles)
+        return len(candles)
+    
+    @staticmethod
+    async def _gather_windows(symbol: str, coros) -> List:
+        """Run window coroutines concurrently and return their results in order.
+        
+        Every window runs to completion before a failure is raised, so no
+        window is left running (or saving) after the download has failed.
+        """
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error(f"{len(errors)} of {len(results)} {symbol} windows failed")
+            raise errors[0]
+        return results
+    
+    async def _windows(self, symbol: str, timeframe: str, days_back: int) -> range:
+        """Get the start times (epoch ms) of the BATCH_LIMIT-candle windows to fetch.
+        
+        The range's step is the window length.
+        """
+        
         logger.info(f"Downloading {days_back} days of {timeframe} data for {symbol}")
         
         # Calculate start timestamp
@@ -45,130 +251,250 @@ class HistoricalDataDownloader:
             (datetime.now() - timedelta(days=days_back)).isoformat()
         )
         
-        all_candles = []
+        # Resume after the candles already stored rather than re-downloading
+        # the whole range
+        candle_ms = self.exchange.parse_timeframe(timeframe) * 1000
+        resume = await asyncio.to_thread(self._resume_from, symbol, timeframe, since, candle_ms)
+        if resume > since:
+            logger.info(f"Resuming {symbol} {timeframe} from {datetime.fromtimestamp(resume / 1000)}")
+            since = resume
         
-        while since < self.exchange.milliseconds():
-            try:
-                # Fetch batch of candles
-                candles = self.exchange.fetch_ohlcv(
-                    symbol,
-                    timeframe,
-                    since,
-                    limit=500  # Most exchanges limit to 500-1000
-                )
-                
-                if not candles:
-                    break
-                
-                all_candles.extend(candles)
-                
-                # Update since to last candle timestamp
-                since = candles[-1][0] + 1
-                
-                logger.debug(f"Fetched {len(candles)} candles, total: {len(all_candles)}")
-                
-                # Rate limiting
-                time.sleep(self.exchange.rateLimit / 1000)
-                
-            except Exception as e:
-                logger.error(f"Error downloading data: {e}")
-                break
+        return range(since, self.exchange.milliseconds(), candle_ms * self.BATCH_LIMIT)
+    
+    def _resume_from(self, symbol: str, timeframe: str, since: int, candle_ms: int) -> int:
+        """Get the epoch ms a download of candles from since onwards should start at.
         
-        logger.success(f"Downloaded {len(all_candles)} total candles for {symbol}")
+        That is the last stored candle of the unbroken run starting at
+        since, so a hole left by a failed window (or a run stopped part way)
+        is fetched again rather than skipped. The candle itself is fetched
+        again too, since it may have still been forming when it was saved.
+        Returns since if the run doesn't start there.
+        """
+        # Stored as local time, like datetime.fromtimestamp produces
+        with self.db.get_connection(read_only=True) as conn:
+            rows = conn.execute(
+                """
+                SELECT timestamp FROM candles
+                WHERE symbol = ? AND timeframe = ? AND timestamp >= ?
+                ORDER BY timestamp
+                """,
+                (symbol, timeframe, datetime.fromtimestamp(since / 1000).strftime('%Y-%m-%d %H:%M:%S'))
+            ).fetchall()
         
-        if save_to_db and all_candles:
-            self.save_candles_to_db(symbol, timeframe, all_candles)
+        if not rows:
+            return since
         
-        return all_candles
+        timestamps = np.array([datetime.fromisoformat(row[0]).timestamp() * 1000 for row in rows], dtype=np.int64)
+        if timestamps[0] - since >= candle_ms:
+            return since
+        
+        # Index of the first candle followed by a gap, else the newest one
+        gaps = np.flatnonzero(np.diff(timestamps) > candle_ms)
+        return int(timestamps[gaps[0]] if len(gaps) else timestamps[-1])
+    
+    async def _fetch_window(self, symbol: str, timeframe: str, start: int, end: int) -> List:
+        """Fetch the candles of one [start, end) window.
+        
+        Pages through the window like the sequential download did, in case
+        the exchange returns fewer than BATCH_LIMIT candles per call.
+        """
+        candles = []
+        since = start
+        while since < end:
+            batch = await self._fetch_page(symbol, timeframe, since)
+            
+            # Windows don't overlap, so drop anything the exchange returned past this one
+            batch = [candle for candle in batch if candle[0] < end]
+            if not batch:
+                break
+            
+            candles.extend(batch)
+            since = batch[-1][0] + 1
+            
+            logger.debug(f"Fetched {len(batch)} {symbol} candles, window total: {len(candles)}")
+        
+        return candles
+    
+    async def _fetch_page(self, symbol: str, timeframe: str, since: int) -> List:
+        """Fetch up to BATCH_LIMIT candles from since, retrying network errors with backoff.
+        
+        Raises:
+            ccxt.BaseError: The last network error once MAX_RETRIES is
+                exhausted, or any other exchange error straight away
+        """
+        delay = self.RETRY_DELAY
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self._semaphore:
+                    return await self.exchange.fetch_ohlcv(symbol, timeframe, since, limit=self.BATCH_LIMIT)
+            except ccxt_async.NetworkError as e:
+                if attempt == self.MAX_RETRIES:
+                    logger.error(f"Error downloading {symbol} data from {since}: {e}")
+                    raise
+                logger.warning(f"Error downloading {symbol} data from {since}, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay *= 2
     
     def save_candles_to_db(self, symbol: str, timeframe: str, candles: List):
-        """Save OHLCV candles to database."""
+        """Save OHLCV candles to database in a single transaction."""
+        
+        saved_count = self._save_candles(symbol, timeframe, candles)
+        logger.success(f"Saved {saved_count} price records to database")
+    
+    def _save_candles(self, symbol: str, timeframe: str, candles: List) -> int:
+        """Body of save_candles_to_db. Returns the number of price records saved."""
+        
+        if not candles:
+            return 0
+        
+        # One float64 column per OHLCV field (missing values become NaN,
+        # which SQLite stores as NULL)
+        arr = np.asarray(candles, dtype=np.float64)
+        timestamps = arr[:, 0].astype(np.int64).tolist()  # Epoch ms, converted when merged
+        opens, highs, lows, closes, volumes = arr[:, 1:6].T
         
         # Convert to price records for the prices table
         # We'll save the close price as the "last" price
-        saved_count = 0
+        price_rows = list(zip(
+            repeat(symbol),
+            timestamps,
+            (closes * 0.999).tolist(),  # Simulate bid as slightly below close
+            (closes * 1.001).tolist(),  # Simulate ask as slightly above close
+            closes.tolist(),  # Close price as last
+            volumes.tolist()
+        ))
+        candle_rows = list(zip(
+            repeat(symbol),
+            repeat(timeframe),
+            timestamps,
+            opens.tolist(),
+            highs.tolist(),
+            lows.tolist(),
+            closes.tolist(),
+            volumes.tolist()
+        ))
         
-        with self.db.get_connection() as conn:
-            for candle in candles:
-                timestamp = datetime.fromtimestamp(candle[0] / 1000)
-                
-                # Save to prices table (for strategy to use)
-                try:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO prices 
-                        (symbol, timestamp, bid, ask, last, volume_24h)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        symbol,
-                        timestamp,
-                        candle[4] * 0.999,  # Simulate bid as slightly below close
-                        candle[4] * 1.001,  # Simulate ask as slightly above close
-                        candle[4],  # Close price as last
-                        candle[5]   # Volume
-                    ))
-                    saved_count += 1
-                except Exception as e:
-                    logger.debug(f"Skipped duplicate: {e}")
+        try:
+            with self.db.get_connection() as conn:
+                conn.execute(STAGING_PRICES)
+                conn.execute(STAGING_CANDLES)
+                _merge_rows(conn, 'staging_prices', PRICE_MERGE, price_rows)
+                _merge_rows(conn, 'staging_candles', CANDLE_MERGE, candle_rows)
+            saved_count = len(price_rows)
+        except sqlite3.IntegrityError as e:
+            # Duplicates never raise (the merge upserts), so this is a row
+            # breaking a constraint, e.g. a missing value. Retry row by row so
+            # it doesn't drop the whole batch. Any other error (schema, I/O)
+            # propagates and stops the download.
+            logger.warning(f"Batch insert failed for {symbol} {timeframe}, retrying per row: {e}")
+            saved_count = 0
+            with self.db.get_connection() as conn:
+                conn.execute(STAGING_PRICES)
+                conn.execute(STAGING_CANDLES)
+                for price_row, candle_row in zip(price_rows, candle_rows):
+                    try:
+                        _merge_rows(conn, 'staging_prices', PRICE_MERGE, [price_row])
+                        saved_count += 1
+                    except sqlite3.IntegrityError as row_error:
+                        logger.debug(f"Skipped invalid price record: {row_error}")
                     
-                # Also save to candles table
-                try:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO candles 
-                        (symbol, timeframe, timestamp, open, high, low, close, volume)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        symbol,
-                        timeframe,
-                        timestamp,
-                        candle[1],  # Open
-                        candle[2],  # High
-                        candle[3],  # Low
-                        candle[4],  # Close
-                        candle[5]   # Volume
-                    ))
-                except Exception as e:
-                    logger.debug(f"Skipped candle: {e}")
+                    try:
+                        _merge_rows(conn, 'staging_candles', CANDLE_MERGE, [candle_row])
+                    except sqlite3.IntegrityError as row_error:
+                        logger.debug(f"Skipped invalid candle: {row_error}")
         
-        logger.success(f"Saved {saved_count} price records to database")
+        return saved_count
     
-    def download_multiple_symbols(
+    async def download_multiple_symbols(
         self,
         symbols: List[str],
         timeframe: str = '30m',
         days_back: int = 30
     ):
-        """Download data for multiple symbols."""
+        """Download data for multiple symbols.
+        
+        All symbols download concurrently, sharing the request limit of
+        MAX_CONCURRENT_REQUESTS. Candles are saved window by window as
+        they arrive (see _backfill_ohlcv).
+        
+        Secondary indexes on BACKFILL_TABLES are dropped for the duration
+        and rebuilt in one pass at the end, instead of being updated row by
+        row. Queries on those tables are slower while this runs, so it's
+        meant for offline backfills.
+        """
+        
+        index_statements = await asyncio.to_thread(self._drop_secondary_indexes)
+        try:
+            # A failed symbol doesn't stop the others
+            results = await asyncio.gather(*(
+                self._backfill_ohlcv(symbol, timeframe, days_back) for symbol in symbols
+            ), return_exceptions=True)
+            for symbol, result in zip(symbols, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to download {symbol}: {result}")
+        finally:
+            await asyncio.to_thread(self._recreate_secondary_indexes, index_statements)
+    
+    def _drop_secondary_indexes(self) -> List[str]:
+        """Drop the explicitly created indexes of BACKFILL_TABLES.
+        
+        UNIQUE constraint indexes have no SQL in sqlite_master and are
+        kept, since INSERT OR REPLACE relies on them.
         
-        for symbol in symbols:
-            self.download_ohlcv(symbol, timeframe, days_back)
-            time.sleep(1)  # Be nice to the exchange
+        Returns:
+            The CREATE INDEX statements of the dropped indexes
+        """
+        placeholders = ", ".join("?" * len(self.BACKFILL_TABLES))
+        with self.db.get_connection() as conn:
+            indexes = conn.execute(f"""
+                SELECT name, sql FROM sqlite_master
+                WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+            """, self.BACKFILL_TABLES).fetchall()
+            for index in indexes:
+                conn.execute(f'DROP INDEX "{index["name"]}"')
+        
+        if indexes:
+            logger.info(f"Deferred {len(indexes)} indexes until the backfill finishes")
+        return [index['sql'] for index in indexes]
+    
+    def _recreate_secondary_indexes(self, statements: List[str]):
+        """Rebuild indexes dropped by _drop_secondary_indexes."""
+        if not statements:
+            return
+        
+        with self.db.get_connection() as conn:
+            for sql in statements:
+                conn.execute(sql)
+        logger.info(f"Rebuilt {len(statements)} indexes")
     
     def get_data_coverage(self) -> dict:
         """Check how much data we have for each symbol."""
         
-        with self.db.get_connection() as conn:
-            result = conn.execute("""
+        with self.db.get_connection(read_only=True) as conn:
+            cursor = conn.execute("""
                 SELECT 
                     symbol,
                     COUNT(*) as count,
                     MIN(timestamp) as earliest,
-                    MAX(timestamp) as latest
+                    MAX(timestamp) as latest,
+                    -- Whole days covered, from the span in integer milliseconds
+                    COALESCE(
+                        CAST(ROUND((julianday(MAX(timestamp)) - julianday(MIN(timestamp))) * 86400000) AS INTEGER)
+                            / 86400000,
+                        0
+                    ) as days
                 FROM prices
                 GROUP BY symbol
-            """).fetchall()
+            """)
             
-            coverage = {}
-            for row in result:
-                coverage[row['symbol']] = {
-                    'count': row['count'],
-                    'earliest': row['earliest'],
-                    'latest': row['latest']
-                }
-            
-            return coverage
+            # Rows are (symbol, count, earliest, latest, days), unpacked by position
+            return {
+                symbol: {'count': count, 'earliest': earliest, 'latest': latest, 'days': days}
+                for symbol, count, earliest, latest, days in cursor
+            }
 
 
-def main():
+async def main():
     """Download historical data for backtesting."""
     
     logger.info("=" * 60)
@@ -246,28 +572,24 @@ def main():
     if timeframe in expected_candles:
         logger.info(f"Expected ~{expected_candles[timeframe]:,} candles per symbol")
     
-    for symbol in symbols_to_download:
-        logger.info(f"\nDownloading {symbol}...")
-        logger.info(f"This may take a few minutes for large datasets...")
-        
-        downloader.download_ohlcv(
-            symbol=symbol,
+    logger.info(f"Downloading {len(symbols_to_download)} symbols, "
+                f"up to {HistoricalDataDownloader.MAX_CONCURRENT_REQUESTS} requests at a time...")
+    logger.info(f"This may take a few minutes for large datasets...")
+    
+    try:
+        await downloader.download_multiple_symbols(
+            symbols=symbols_to_download,
             timeframe=timeframe,
-            days_back=days_back,
-            save_to_db=True
+            days_back=days_back
         )
         
-        # Longer delay for rate limiting with large downloads
-        time.sleep(3)
-    
-    # Optional: Download additional altcoins for more trading opportunities
-    # Uncomment if you want more symbols:
-    # additional_symbols = ['SOL/USDT', 'AVAX/USDT', 'LINK/USDT', 'UNI/USDT']
-    # logger.info("\nDownloading additional altcoins...")
-    # for symbol in additional_symbols:
-    #     logger.info(f"Downloading {symbol}...")
-    #     downloader.download_ohlcv(symbol, timeframe, days_back, save_to_db=True)
-    #     time.sleep(3)
+        # Optional: Download additional altcoins for more trading opportunities
+        # Uncomment if you want more symbols:
+        # additional_symbols = ['SOL/USDT', 'AVAX/USDT', 'LINK/USDT', 'UNI/USDT']
+        # logger.info("\nDownloading additional altcoins...")
+        # await downloader.download_multiple_symbols(additional_symbols, timeframe, days_back)
+    finally:
+        await downloader.close()
     
     # Check final coverage
     logger.info("\n" + "=" * 60)
@@ -276,14 +598,8 @@ def main():
     
     total_records = 0
     for symbol, info in final_coverage.items():
-        days = 0
-        if info['earliest'] and info['latest']:
-            earliest = datetime.fromisoformat(info['earliest'])
-            latest = datetime.fromisoformat(info['latest'])
-            days = (latest - earliest).days
-        
         total_records += info['count']
-        logger.success(f"  {symbol}: {info['count']:,} records covering {days} days")
+        logger.success(f"  {symbol}: {info['count']:,} records covering {info['days']} days")
     
     logger.info(f"\nTotal records in database: {total_records:,}")
     
@@ -301,4 +617,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Optional Numba JIT support.
+
+Numeric kernels decorate themselves with ``njit`` from this module. When
+numba is installed they are compiled to machine code; otherwise the
+decorator is a no-op and the kernels run as plain Python/NumPy.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']